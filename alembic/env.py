@@ -10,13 +10,14 @@ from alembic import context
 # --- بخش وارد کردن ماژول‌های پروژه ---
 
 # Add project root to path to import our modules
-# This is necessary so Alembic can find src.db and src.core.models
+# This is necessary so Alembic can find src.db and src.models
 sys.path.insert(0, os.path.realpath('.'))
 
 # Import the Base and engine from your db setup
-from src.db import engine, Base
+from src.db.session import get_engine
+from src.db.base import Base
 # Import your models file to ensure Base knows about them (all models inherit from Base)
-from src.core import models 
+from src.models import project, task, project_stats, change
 
 # --- تنظیمات Alembic ---
 
@@ -29,7 +30,7 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 # target_metadata is where Base.metadata is set.
-# We set it to the Base.metadata imported from src.db
+# We set it to the Base.metadata imported from src.db.base
 target_metadata = Base.metadata
 
 
@@ -58,11 +59,11 @@ def run_migrations_offline() -> None:
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
-    We use the pre-configured 'engine' from src.db which handles 
+    We use the pre-configured 'engine' from src.db.session which handles 
     reading the credentials from the .env file.
     """
-    # We use the 'engine' imported from src.db
-    connectable = engine 
+    # We use the engine built by src.db.session
+    connectable = get_engine()
 
     with connectable.connect() as connection:
         context.configure(
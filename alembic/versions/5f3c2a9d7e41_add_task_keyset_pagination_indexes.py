@@ -0,0 +1,41 @@
+"""Add composite indexes for keyset-paginated task listing
+
+Revision ID: 5f3c2a9d7e41
+Revises: 2bab4dc4cf1d
+Create Date: 2026-10-17 09:12:31.418203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f3c2a9d7e41'
+down_revision: Union[str, Sequence[str], None] = '2bab4dc4cf1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # defcd57a3259 was generated empty, so closed_at may be missing on databases
+    # built purely from migrations. The closed_at range index below needs it.
+    columns = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('tasks')}
+    if 'closed_at' not in columns:
+        op.add_column('tasks', sa.Column('closed_at', sa.DateTime(), nullable=True))
+
+    # Built concurrently so large task tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index('ix_tasks_project_id_id', 'tasks', ['project_id', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_tasks_project_id_deadline', 'tasks', ['project_id', 'deadline'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_tasks_project_id_closed_at', 'tasks', ['project_id', 'closed_at'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_project_id_closed_at', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_project_id_deadline', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_project_id_id', table_name='tasks', postgresql_concurrently=True)
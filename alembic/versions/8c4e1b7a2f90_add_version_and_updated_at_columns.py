@@ -0,0 +1,36 @@
+"""Add version and updated_at columns to projects and tasks
+
+Revision ID: 8c4e1b7a2f90
+Revises: 5f3c2a9d7e41
+Create Date: 2026-10-17 11:04:52.630117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e1b7a2f90'
+down_revision: Union[str, Sequence[str], None] = '5f3c2a9d7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Both defaults are non-volatile, so existing rows are filled without rewriting the tables
+    for table in ('projects', 'tasks'):
+        op.add_column(table, sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+        op.add_column(
+            table,
+            sa.Column('updated_at', sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False)
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('tasks', 'projects'):
+        op.drop_column(table, 'updated_at')
+        op.drop_column(table, 'version')
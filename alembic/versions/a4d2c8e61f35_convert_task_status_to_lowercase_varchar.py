@@ -0,0 +1,55 @@
+"""Convert tasks.status from the native taskstatus enum to lowercase varchar
+
+Revision ID: a4d2c8e61f35
+Revises: b17d93e4c5a2
+Create Date: 2026-10-17 14:02:56.730184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d2c8e61f35'
+down_revision: Union[str, Sequence[str], None] = 'b17d93e4c5a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 085021ba6daa created status as a native enum of the member names ('TODO', ...), while the
+    # model stores the lowercase values in a varchar (native_enum=False). Every later predicate
+    # on status ('done', 'todo', ...) is written against the model, so convert the column first.
+    # Databases whose tables were built from the model already have the varchar; they are left alone.
+    data_type = op.get_bind().scalar(sa.text(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = 'tasks' AND column_name = 'status'"
+    ))
+    if data_type != 'USER-DEFINED':
+        return
+
+    # Rewrites the table once; run during a maintenance window on large tables
+    op.alter_column(
+        'tasks', 'status',
+        type_=sa.String(length=5),
+        postgresql_using='lower(status::text)',
+        existing_nullable=True
+    )
+    op.execute("UPDATE tasks SET status = 'todo' WHERE status IS NULL")
+    op.alter_column('tasks', 'status', nullable=False, existing_type=sa.String(length=5))
+    op.execute('DROP TYPE IF EXISTS taskstatus')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("CREATE TYPE taskstatus AS ENUM ('TODO', 'DOING', 'DONE')")
+    op.alter_column(
+        'tasks', 'status',
+        type_=sa.Enum('TODO', 'DOING', 'DONE', name='taskstatus', create_type=False),
+        postgresql_using='upper(status)::taskstatus',
+        nullable=True,
+        existing_nullable=False
+    )
@@ -0,0 +1,53 @@
+"""Add full-text search vector on tasks and trigram index on project names
+
+Revision ID: b17d93e4c5a2
+Revises: 8c4e1b7a2f90
+Create Date: 2026-10-17 13:27:05.912448
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b17d93e4c5a2'
+down_revision: Union[str, Sequence[str], None] = '8c4e1b7a2f90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # A stored generated column rewrites the table once; run during a maintenance window on large tables
+    op.add_column(
+        'tasks',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))", persisted=True),
+            nullable=True
+        )
+    )
+
+    # Built concurrently so the tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_search_vector', 'tasks', ['search_vector'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_projects_name_trgm', 'projects', ['name'],
+            unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_projects_name_trgm', table_name='projects', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_search_vector', table_name='tasks', postgresql_concurrently=True)
+    op.drop_column('tasks', 'search_vector')
@@ -0,0 +1,120 @@
+"""Add a per-project tasks_version change token to project_stats
+
+Revision ID: b6f2e8d4c913
+Revises: f3a91c5e8d20
+Create Date: 2026-10-17 20:36:52.104873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f2e8d4c913'
+down_revision: Union[str, Sequence[str], None] = 'f3a91c5e8d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Per-row contribution of a set of task rows to the counters, negated for removed rows;
+# every row also counts once towards the project's tasks_version
+TASK_DELTA = """
+    SELECT project_id,
+           {sign} * (status = 'todo')::int AS todo,
+           {sign} * (status = 'doing')::int AS doing,
+           {sign} * (status = 'done')::int AS done,
+           {sign} * (closed_at IS NOT NULL AND created_at IS NOT NULL)::int AS closed_count,
+           {sign} * coalesce(extract(epoch FROM closed_at - created_at), 0) AS close_seconds_sum,
+           1 AS writes
+    FROM {rows}
+    WHERE project_id IS NOT NULL
+"""
+
+# Every statement that touches a project's tasks now upserts its row (the counters may cancel
+# out, the change token does not); rows are still locked in project_id order
+APPLY_DELTA = """
+    INSERT INTO project_stats AS s
+        (project_id, todo, doing, done, closed_count, close_seconds_sum, tasks_version, tasks_updated_at)
+    SELECT project_id, sum(todo), sum(doing), sum(done), sum(closed_count), sum(close_seconds_sum),
+           sum(writes), timezone('utc', now())
+    FROM ({deltas}) AS delta
+    GROUP BY project_id
+    ORDER BY project_id
+    ON CONFLICT (project_id) DO UPDATE SET
+        todo = s.todo + EXCLUDED.todo,
+        doing = s.doing + EXCLUDED.doing,
+        done = s.done + EXCLUDED.done,
+        closed_count = s.closed_count + EXCLUDED.closed_count,
+        close_seconds_sum = s.close_seconds_sum + EXCLUDED.close_seconds_sum,
+        tasks_version = s.tasks_version + EXCLUDED.tasks_version,
+        tasks_updated_at = EXCLUDED.tasks_updated_at;
+"""
+
+# The d5e7a3c91b04 version, restored on downgrade
+PREVIOUS_TASK_DELTA = """
+    SELECT project_id,
+           {sign} * (status = 'todo')::int AS todo,
+           {sign} * (status = 'doing')::int AS doing,
+           {sign} * (status = 'done')::int AS done,
+           {sign} * (closed_at IS NOT NULL AND created_at IS NOT NULL)::int AS closed_count,
+           {sign} * coalesce(extract(epoch FROM closed_at - created_at), 0) AS close_seconds_sum
+    FROM {rows}
+    WHERE project_id IS NOT NULL
+"""
+
+PREVIOUS_APPLY_DELTA = """
+    INSERT INTO project_stats AS s (project_id, todo, doing, done, closed_count, close_seconds_sum)
+    SELECT project_id, sum(todo), sum(doing), sum(done), sum(closed_count), sum(close_seconds_sum)
+    FROM ({deltas}) AS delta
+    GROUP BY project_id
+    HAVING sum(todo) <> 0 OR sum(doing) <> 0 OR sum(done) <> 0
+        OR sum(closed_count) <> 0 OR sum(close_seconds_sum) <> 0
+    ORDER BY project_id
+    ON CONFLICT (project_id) DO UPDATE SET
+        todo = s.todo + EXCLUDED.todo,
+        doing = s.doing + EXCLUDED.doing,
+        done = s.done + EXCLUDED.done,
+        closed_count = s.closed_count + EXCLUDED.closed_count,
+        close_seconds_sum = s.close_seconds_sum + EXCLUDED.close_seconds_sum;
+"""
+
+
+def trigger_function(task_delta: str, apply_delta: str) -> str:
+    return f"""
+CREATE OR REPLACE FUNCTION project_stats_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {apply_delta.format(deltas=task_delta.format(sign=1, rows='new_rows'))}
+    ELSIF TG_OP = 'UPDATE' THEN
+        {apply_delta.format(deltas=task_delta.format(sign=-1, rows='old_rows') + ' UNION ALL ' + task_delta.format(sign=1, rows='new_rows'))}
+    ELSE
+        {apply_delta.format(deltas=task_delta.format(sign=-1, rows='old_rows'))}
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant default fills existing rows without rewriting the table
+    op.add_column('project_stats', sa.Column('tasks_version', sa.BigInteger(), server_default='0', nullable=False))
+    op.add_column('project_stats', sa.Column('tasks_updated_at', sa.DateTime(), nullable=True))
+    op.execute(trigger_function(TASK_DELTA, APPLY_DELTA))
+
+    # Last-Modified of existing projects: the latest task write so far, one grouped scan
+    op.execute("""
+        UPDATE project_stats s SET tasks_updated_at = t.updated_at
+        FROM (SELECT project_id, max(updated_at) AS updated_at FROM tasks GROUP BY project_id) AS t
+        WHERE s.project_id = t.project_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(trigger_function(PREVIOUS_TASK_DELTA, PREVIOUS_APPLY_DELTA))
+    op.drop_column('project_stats', 'tasks_updated_at')
+    op.drop_column('project_stats', 'tasks_version')
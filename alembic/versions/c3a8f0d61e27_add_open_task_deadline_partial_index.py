@@ -0,0 +1,36 @@
+"""Add partial index on deadlines of open tasks
+
+Revision ID: c3a8f0d61e27
+Revises: a4d2c8e61f35
+Create Date: 2026-10-17 14:48:19.204716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a8f0d61e27'
+down_revision: Union[str, Sequence[str], None] = 'a4d2c8e61f35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only open tasks with a deadline are indexed, so the index stays small as done tasks pile up
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_open_deadline', 'tasks', ['deadline'],
+            unique=False,
+            postgresql_where=sa.text("status <> 'done' AND deadline IS NOT NULL"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_open_deadline', table_name='tasks', postgresql_concurrently=True)
@@ -0,0 +1,63 @@
+"""Number the changes log after commit: id primary key, nullable unique seq
+
+Revision ID: c9a4f7e2b1d6
+Revises: b6f2e8d4c913
+Create Date: 2026-10-17 21:14:07.385920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9a4f7e2b1d6'
+down_revision: Union[str, Sequence[str], None] = 'b6f2e8d4c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows get an insertion-order id as primary key; seq is assigned by the publish step after
+    # commit instead of by the insert. Existing rows are published already and keep their seq.
+    op.add_column('changes', sa.Column('id', sa.BigInteger(), nullable=True))
+    op.execute("CREATE SEQUENCE changes_id_seq OWNED BY changes.id")
+    op.execute("UPDATE changes SET id = seq")
+    op.execute("SELECT setval('changes_id_seq', coalesce(max(id), 0) + 1, false) FROM changes")
+    op.alter_column('changes', 'id', nullable=False, server_default=sa.text("nextval('changes_id_seq')"))
+
+    op.drop_constraint('changes_pkey', 'changes', type_='primary')
+    op.create_primary_key('changes_pkey', 'changes', ['id'])
+    op.alter_column('changes', 'seq', nullable=True, server_default=None)
+    op.execute("DROP SEQUENCE changes_seq_seq")
+
+    op.create_index('ix_changes_seq', 'changes', ['seq'], unique=True)
+    op.create_index(
+        'ix_changes_unpublished', 'changes', ['id'],
+        unique=False,
+        postgresql_where=sa.text("seq IS NULL")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_changes_unpublished', table_name='changes')
+    op.drop_index('ix_changes_seq', table_name='changes')
+
+    # Publish whatever is left, then make seq the serial primary key again
+    op.execute("""
+        UPDATE changes SET seq = numbered.seq
+        FROM (
+            SELECT id, (SELECT coalesce(max(seq), 0) FROM changes) + row_number() OVER (ORDER BY id) AS seq
+            FROM changes WHERE seq IS NULL
+        ) AS numbered
+        WHERE changes.id = numbered.id
+    """)
+    op.execute("CREATE SEQUENCE changes_seq_seq OWNED BY changes.seq")
+    op.execute("SELECT setval('changes_seq_seq', coalesce(max(seq), 0) + 1, false) FROM changes")
+    op.alter_column('changes', 'seq', nullable=False, server_default=sa.text("nextval('changes_seq_seq')"))
+    op.drop_constraint('changes_pkey', 'changes', type_='primary')
+    op.create_primary_key('changes_pkey', 'changes', ['seq'])
+    op.drop_column('changes', 'id')
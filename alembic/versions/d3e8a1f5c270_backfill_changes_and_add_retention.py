@@ -0,0 +1,68 @@
+"""Backfill the changes log with existing rows and add pruning bookkeeping
+
+Revision ID: d3e8a1f5c270
+Revises: c9a4f7e2b1d6
+Create Date: 2026-10-17 22:05:41.617302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3e8a1f5c270'
+down_revision: Union[str, Sequence[str], None] = 'c9a4f7e2b1d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# ChangeRepository's CHANGES_LOCK: the backfill numbers its entries like a publish step
+CHANGES_LOCK = 0x7A60
+
+# One "created" entry per project and task the log has never mentioned, with the data the API
+# would have recorded (TaskInDB / project_change field order). Numbered after the current end
+# of the log, so existing cursors receive them as new changes on their next sync.
+BACKFILL = """
+    INSERT INTO changes (seq, project_id, entity, entity_id, op, data)
+    SELECT (SELECT coalesce(max(seq), 0) FROM changes) + row_number() OVER (ORDER BY entity, entity_id),
+           project_id, entity, entity_id, 'created', data
+    FROM (
+        SELECT p.id AS project_id, 'project' AS entity, p.id AS entity_id,
+               json_build_object('id', p.id, 'name', p.name, 'description', p.description) AS data
+        FROM projects p
+        WHERE NOT EXISTS (SELECT 1 FROM changes c WHERE c.entity = 'project' AND c.entity_id = p.id)
+        UNION ALL
+        SELECT t.project_id, 'task', t.id,
+               json_build_object(
+                   'title', t.title, 'description', t.description, 'deadline', t.deadline,
+                   'id', t.id, 'project_id', t.project_id, 'status', t.status, 'closed_at', t.closed_at
+               )
+        FROM tasks t
+        WHERE t.project_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM changes c WHERE c.entity = 'task' AND c.entity_id = t.id)
+    ) AS missing
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'change_log_state',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('pruned_through', sa.BigInteger(), nullable=False),
+    )
+    op.execute("INSERT INTO change_log_state (id, pruned_through) VALUES (1, 0)")
+    op.create_index('ix_changes_entity_seq', 'changes', ['entity', 'entity_id', 'seq'], unique=False)
+
+    # Rows created before the log existed were invisible to since=0; one scan of each table
+    op.execute(sa.text("SELECT pg_advisory_xact_lock(:key)").bindparams(key=CHANGES_LOCK))
+    op.execute(BACKFILL)
+    op.execute("SELECT pg_notify('changes', coalesce(max(seq), 0)::text) FROM changes")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The backfilled entries stay: they are valid log entries either way
+    op.drop_index('ix_changes_entity_seq', table_name='changes')
+    op.drop_table('change_log_state')
@@ -0,0 +1,130 @@
+"""Add project_stats counters maintained by triggers on tasks
+
+Revision ID: d5e7a3c91b04
+Revises: c3a8f0d61e27
+Create Date: 2026-10-17 16:22:41.518307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e7a3c91b04'
+down_revision: Union[str, Sequence[str], None] = 'c3a8f0d61e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Per-row contribution of a set of task rows to the counters, negated for removed rows.
+# The status literals are the model's lowercase values; a4d2c8e61f35 converted the column to them.
+TASK_DELTA = """
+    SELECT project_id,
+           {sign} * (status = 'todo')::int AS todo,
+           {sign} * (status = 'doing')::int AS doing,
+           {sign} * (status = 'done')::int AS done,
+           {sign} * (closed_at IS NOT NULL AND created_at IS NOT NULL)::int AS closed_count,
+           {sign} * coalesce(extract(epoch FROM closed_at - created_at), 0) AS close_seconds_sum
+    FROM {rows}
+    WHERE project_id IS NOT NULL
+"""
+
+# Statement-level triggers over transition tables: a bulk UPDATE/DELETE/COPY merge costs one
+# grouped upsert per statement instead of one upsert per row. Counter rows are locked in
+# project_id order, so two statements touching the same projects cannot deadlock.
+APPLY_DELTA = """
+    INSERT INTO project_stats AS s (project_id, todo, doing, done, closed_count, close_seconds_sum)
+    SELECT project_id, sum(todo), sum(doing), sum(done), sum(closed_count), sum(close_seconds_sum)
+    FROM ({deltas}) AS delta
+    GROUP BY project_id
+    -- Updates that leave status and closed_at alone cancel out and touch no counter row
+    HAVING sum(todo) <> 0 OR sum(doing) <> 0 OR sum(done) <> 0
+        OR sum(closed_count) <> 0 OR sum(close_seconds_sum) <> 0
+    ORDER BY project_id
+    ON CONFLICT (project_id) DO UPDATE SET
+        todo = s.todo + EXCLUDED.todo,
+        doing = s.doing + EXCLUDED.doing,
+        done = s.done + EXCLUDED.done,
+        closed_count = s.closed_count + EXCLUDED.closed_count,
+        close_seconds_sum = s.close_seconds_sum + EXCLUDED.close_seconds_sum;
+"""
+
+TRIGGER_FUNCTION = f"""
+CREATE FUNCTION project_stats_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {APPLY_DELTA.format(deltas=TASK_DELTA.format(sign=1, rows='new_rows'))}
+    ELSIF TG_OP = 'UPDATE' THEN
+        {APPLY_DELTA.format(deltas=TASK_DELTA.format(sign=-1, rows='old_rows') + ' UNION ALL ' + TASK_DELTA.format(sign=1, rows='new_rows'))}
+    ELSE
+        {APPLY_DELTA.format(deltas=TASK_DELTA.format(sign=-1, rows='old_rows'))}
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+TRIGGERS = {
+    'tasks_stats_insert': "AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows",
+    'tasks_stats_update': "AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    'tasks_stats_delete': "AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Added without a default first so existing tasks keep an unknown (null) creation time,
+    # without rewriting the table; only new tasks get one
+    op.add_column('tasks', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.alter_column('tasks', 'created_at', server_default=sa.text("timezone('utc', now())"))
+
+    op.create_table(
+        'project_stats',
+        sa.Column('project_id', sa.Integer(), sa.ForeignKey('projects.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('todo', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('doing', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('done', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('closed_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('close_seconds_sum', sa.Float(), server_default='0', nullable=False),
+    )
+
+    op.execute(TRIGGER_FUNCTION)
+    for name, timing in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER {name} {timing} FOR EACH STATEMENT EXECUTE FUNCTION project_stats_apply()")
+
+    # Initial fill. Creating the triggers locked tasks against writes until this migration
+    # commits, so no write can slip in between the fill and the triggers.
+    op.execute("""
+        INSERT INTO project_stats (project_id, todo, doing, done, closed_count, close_seconds_sum)
+        SELECT project_id,
+               count(*) FILTER (WHERE status = 'todo'),
+               count(*) FILTER (WHERE status = 'doing'),
+               count(*) FILTER (WHERE status = 'done'),
+               0,
+               0
+        FROM tasks
+        WHERE project_id IS NOT NULL
+        GROUP BY project_id
+    """)
+
+    # Per-project overdue counts are read live: this index covers only open tasks with a deadline
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_open_project_deadline', 'tasks', ['project_id', 'deadline'],
+            unique=False,
+            postgresql_where=sa.text("status <> 'done' AND deadline IS NOT NULL"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_open_project_deadline', table_name='tasks', postgresql_concurrently=True)
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER {name} ON tasks")
+    op.execute("DROP FUNCTION project_stats_apply()")
+    op.drop_table('project_stats')
+    op.drop_column('tasks', 'created_at')
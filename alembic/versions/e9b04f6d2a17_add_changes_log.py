@@ -0,0 +1,39 @@
+"""Add append-only changes log
+
+Revision ID: e9b04f6d2a17
+Revises: d5e7a3c91b04
+Create Date: 2026-10-17 17:41:09.283551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9b04f6d2a17'
+down_revision: Union[str, Sequence[str], None] = 'd5e7a3c91b04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'changes',
+        sa.Column('seq', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('entity', sa.String(), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('op', sa.String(), nullable=False),
+        sa.Column('data', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False),
+    )
+    op.create_index('ix_changes_project_id_seq', 'changes', ['project_id', 'seq'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_changes_project_id_seq', table_name='changes')
+    op.drop_table('changes')
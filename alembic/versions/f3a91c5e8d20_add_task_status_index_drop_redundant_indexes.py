@@ -0,0 +1,42 @@
+"""Add (project_id, status, id) task index, drop redundant single-column indexes
+
+Revision ID: f3a91c5e8d20
+Revises: e9b04f6d2a17
+Create Date: 2026-10-17 19:12:40.518337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a91c5e8d20'
+down_revision: Union[str, Sequence[str], None] = 'e9b04f6d2a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        # Status-filtered task listings: both equality columns lead, the keyset order follows
+        op.create_index(
+            'ix_tasks_project_id_status_id', 'tasks', ['project_id', 'status', 'id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        # Duplicates of the primary key indexes, and a prefix of ix_tasks_project_id_id;
+        # they only cost writes
+        op.drop_index('ix_tasks_id', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_projects_id', table_name='projects', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_project_id', table_name='tasks', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_tasks_project_id', 'tasks', ['project_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_projects_id', 'projects', ['id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_tasks_id', 'tasks', ['id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_tasks_project_id_status_id', table_name='tasks', postgresql_concurrently=True)
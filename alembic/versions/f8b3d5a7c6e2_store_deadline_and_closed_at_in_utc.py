@@ -0,0 +1,82 @@
+"""Store tasks.deadline and tasks.closed_at as naive UTC like every other timestamp
+
+Revision ID: f8b3d5a7c6e2
+Revises: d3e8a1f5c270
+Create Date: 2026-10-18 10:12:33.508164
+
+"""
+import os
+from datetime import datetime
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8b3d5a7c6e2'
+down_revision: Union[str, Sequence[str], None] = 'd3e8a1f5c270'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# ChangeRepository's CHANGES_LOCK: the converted tasks are published like a publish step would
+CHANGES_LOCK = 0x7A60
+
+# Sync clients hold the old values: every converted task gets an "updated" entry with its new data
+RECORD_UPDATES = """
+    INSERT INTO changes (seq, project_id, entity, entity_id, op, data)
+    SELECT (SELECT coalesce(max(seq), 0) FROM changes) + row_number() OVER (ORDER BY t.id),
+           t.project_id, 'task', t.id, 'updated',
+           json_build_object(
+               'title', t.title, 'description', t.description, 'deadline', t.deadline,
+               'id', t.id, 'project_id', t.project_id, 'status', t.status, 'closed_at', t.closed_at
+           )
+    FROM tasks t
+    WHERE t.project_id IS NOT NULL AND (t.deadline IS NOT NULL OR t.closed_at IS NOT NULL)
+"""
+
+
+def local_time_zone() -> Optional[str]:
+    """IANA name of the zone the API servers ran in: APP_TIMEZONE, TZ, or this host's /etc/localtime."""
+    name = os.getenv("APP_TIMEZONE") or os.getenv("TZ")
+    if name:
+        return name.lstrip(":")
+    try:
+        return os.path.realpath("/etc/localtime").split("zoneinfo/", 1)[1]
+    except (OSError, IndexError):
+        return None
+
+
+def convert(source_zone: str, target_zone: str) -> None:
+    # The project_stats triggers see every row change, so close_seconds_sum is recomputed against
+    # created_at (always UTC) on the way. Rewrites the affected rows once: run in a maintenance window.
+    op.execute(sa.text("""
+        UPDATE tasks SET
+            deadline = (deadline AT TIME ZONE :source) AT TIME ZONE :target,
+            closed_at = (closed_at AT TIME ZONE :source) AT TIME ZONE :target
+        WHERE deadline IS NOT NULL OR closed_at IS NOT NULL
+    """).bindparams(source=source_zone, target=target_zone))
+    op.execute(sa.text("SELECT pg_advisory_xact_lock(:key)").bindparams(key=CHANGES_LOCK))
+    op.execute(RECORD_UPDATES)
+    op.execute("SELECT pg_notify('changes', coalesce(max(seq), 0)::text) FROM changes")
+
+
+def zone_or_offset() -> str:
+    zone = local_time_zone()
+    if zone:
+        return zone
+    # Without a zone name only the current offset is known (no DST history); POSIX signs are inverted
+    offset = datetime.now().astimezone().utcoffset().total_seconds()
+    print(f"WARNING: local time zone unknown, converting with a fixed offset of {offset / 3600:+g}h; set APP_TIMEZONE")
+    minutes = abs(int(offset)) // 60
+    return f"UTC{'-' if offset >= 0 else '+'}{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    convert(zone_or_offset(), 'UTC')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    convert('UTC', zone_or_offset())
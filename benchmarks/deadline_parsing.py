@@ -0,0 +1,73 @@
+"""
+Micro-benchmark of deadline handling on the task write path.
+
+Times, per call, on a mix of naive and offset-carrying deadlines:
+  - before:  datetime -> isoformat() -> dateutil.parser.parse, what create_task/update_task did
+  - after:   normalize_deadline(datetime), what the services do with the schema's datetime now
+  - cli:     parse_deadline(str) from the console, strict ISO fast path behind an LRU cache,
+             for distinct strings (cache misses) and for one repeated string (hits)
+  - dateutil free-form parsing of the same strings, the CLI fallback
+
+Runs in process against an in-memory SQLite database (nothing is written).
+
+Usage:
+    python benchmarks/deadline_parsing.py --calls 100000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# The console imports the services, which connect on import
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from dateutil import parser as date_parser  # noqa: E402
+
+from src.cli.console import parse_deadline  # noqa: E402
+from src.repositories.task_repository import normalize_deadline  # noqa: E402
+
+
+def per_call_us(fn: Callable[[int], object], calls: int) -> float:
+    started = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    base = datetime(2026, 1, 1, 9, 30)
+    offset = timezone(timedelta(hours=2))
+    deadlines: List[datetime] = [
+        base + timedelta(minutes=i) if i % 2 else (base + timedelta(minutes=i)).replace(tzinfo=offset)
+        for i in range(1000)
+    ]
+    strings = [deadline.isoformat() for deadline in deadlines]
+    # Distinct strings for the cache-miss case; more than the cache holds
+    distinct = [(base + timedelta(seconds=i)).isoformat() for i in range(args.calls)]
+    n = len(deadlines)
+
+    results = {
+        "before (isoformat + dateutil)": per_call_us(lambda i: date_parser.parse(deadlines[i % n].isoformat()), args.calls),
+        "after (normalize_deadline)": per_call_us(lambda i: normalize_deadline(deadlines[i % n]), args.calls),
+        "cli parse_deadline, misses": per_call_us(lambda i: parse_deadline(distinct[i]), args.calls),
+        "cli parse_deadline, hits": per_call_us(lambda i: parse_deadline(strings[0]), args.calls),
+        "dateutil free-form": per_call_us(lambda i: date_parser.parse(strings[i % n]), args.calls),
+    }
+
+    print(f"{'path':<34}{'us/call':>10}")
+    for name, us in results.items():
+        print(f"{name:<34}{us:>10.2f}")
+    before, after = results["before (isoformat + dateutil)"], results["after (normalize_deadline)"]
+    print(f"\nWrite path: {before / after:.0f}x less time spent on the deadline per task")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Import-time profile of the entry points: what a cold start pays before serving anything.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter for each entry point
+(the API app, the console, the deadline scheduler) and summarizes the report: total import
+time, the top-level packages that cost the most (self time summed over their modules) and
+the slowest individual imports (cumulative time). No database is needed or contacted.
+
+Usage:
+    python benchmarks/import_time.py --top 15
+    python benchmarks/import_time.py --module main --json import-time.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_POINTS = ["main", "src.cli.console", "src.commands.scheduler"]
+
+
+def profile(module: str) -> List[Dict[str, Any]]:
+    """Returns one entry (name, depth, self_us, cumulative_us) per module imported by `module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        entries.append({
+            "name": name.strip(),
+            # Nested imports are indented by two spaces per level
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        })
+    return entries
+
+
+def summarize(module: str, entries: List[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    by_package: Dict[str, int] = defaultdict(int)
+    for entry in entries:
+        by_package[entry["name"].split(".")[0]] += entry["self_us"]
+    return {
+        "module": module,
+        "total_ms": round(sum(entry["cumulative_us"] for entry in entries if entry["depth"] == 0) / 1000, 1),
+        "modules": len(entries),
+        "packages": [
+            {"package": package, "self_ms": round(us / 1000, 1)}
+            for package, us in sorted(by_package.items(), key=lambda item: -item[1])[:top]
+        ],
+        "slowest": [
+            {"name": entry["name"], "cumulative_ms": round(entry["cumulative_us"] / 1000, 1)}
+            for entry in sorted(entries, key=lambda entry: -entry["cumulative_us"])[:top]
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", action="append", help="Entry point to profile (repeatable); defaults to all")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", dest="json_path", help="Also write the summaries to this file")
+    args = parser.parse_args()
+
+    summaries = [summarize(module, profile(module), args.top) for module in args.module or ENTRY_POINTS]
+    for summary in summaries:
+        print(f"\nimport {summary['module']}: {summary['total_ms']} ms, {summary['modules']} modules")
+        print(f"  {'package':<28}{'self ms':>9}      {'slowest import':<40}{'cumul. ms':>10}")
+        for package, slowest in zip(summary["packages"], summary["slowest"]):
+            print(f"  {package['package']:<28}{package['self_ms']:>9.1f}      {slowest['name']:<40}{slowest['cumulative_ms']:>10.1f}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(summaries, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Load benchmark: sync (psycopg2, threadpool) vs async (asyncpg, AsyncSession) API stack.
+
+Starts `uvicorn main:app` once per stack (USE_ASYNC_DB=false/true) against the Postgres
+configured in .env, seeds one project with tasks, then drives the read endpoints with
+concurrent HTTP clients and reports requests/second and latency percentiles.
+
+Usage:
+    python benchmarks/load_sync_vs_async.py --concurrency 200 --duration 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become ready")
+
+
+def seed(base_url: str, tasks: int) -> Tuple[int, int]:
+    """Creates the benchmark project; returns its ID and the ID of its first task."""
+    with httpx.Client(base_url=base_url) as client:
+        project = client.post("/v1/projects/", json={"name": "load benchmark"}).json()
+        task_ids = [
+            client.post(f"/v1/projects/{project['id']}/tasks/", json={"title": f"task {i}"}).json()["id"]
+            for i in range(max(tasks, 1))
+        ]
+    return project["id"], task_ids[0]
+
+
+async def drive(base_url: str, paths: List[str], concurrency: int, duration: float) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    stop_at = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        async def worker(offset: int) -> None:
+            nonlocal errors
+            i = offset
+            while time.monotonic() < stop_at:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(paths[i % len(paths)])
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+                i += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "req_per_s": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def run_stack(name: str, use_async: bool, args: argparse.Namespace, port: int) -> Dict[str, float]:
+    env = dict(os.environ, USE_ASYNC_DB="true" if use_async else "false")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning",
+         "--workers", str(args.workers)],
+        cwd=ROOT, env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(base_url)
+        project_id, task_id = seed(base_url, args.tasks)
+        paths = [
+            f"/v1/projects/{project_id}",
+            f"/v1/projects/{project_id}/tasks/?limit=50",
+            f"/v1/projects/{project_id}/tasks/{task_id}",
+            "/v1/projects/?limit=20",
+        ]
+        asyncio.run(drive(base_url, paths, args.concurrency, args.warmup))
+        result = asyncio.run(drive(base_url, paths, args.concurrency, args.duration))
+        result["stack"] = name
+        return result
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=15.0, help="Measured seconds per stack")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Unmeasured seconds per stack")
+    parser.add_argument("--tasks", type=int, default=200, help="Tasks seeded into the benchmark project")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    results = [
+        run_stack("sync", False, args, args.port),
+        run_stack("async", True, args, args.port + 1),
+    ]
+
+    print(f"{'stack':<8}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for r in results:
+        print(f"{r['stack']:<8}{r['requests']:>10}{r['errors']:>8}{r['req_per_s']:>10.1f}{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
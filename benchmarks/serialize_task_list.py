@@ -0,0 +1,99 @@
+"""
+Serialization benchmark: FastAPI's default response path vs the pre-compiled TypeAdapter path
+(src/api/fast_json.py) on one large task page.
+
+Runs in process, without a database or server: builds `--tasks` ORM Task objects and the
+equivalent plain rows (as the repositories return them), then times
+  - default: TaskPage.model_validate (from_attributes) -> model_dump(mode="json") -> json.dumps,
+    which is what FastAPI does for a route returning a response_model
+  - fast: row._asdict() -> TASK_PAGE.dump_json, which is what the list routes now do
+and checks that both produce the same document.
+
+Usage:
+    python benchmarks/serialize_task_list.py --tasks 10000 --repeat 20
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.api.fast_json import TASK_PAGE, task_rows  # noqa: E402
+from src.models.task import Task, TaskStatus  # noqa: E402
+from src.repositories.task_repository import TASK_COLUMNS  # noqa: E402
+from src.schemas import TaskPage  # noqa: E402
+
+FIELDS = [column.key for column in TASK_COLUMNS]
+# Stands in for sqlalchemy Row: attribute access and _asdict() over the same columns
+PlainRow = namedtuple("PlainRow", FIELDS)
+
+
+def build(tasks: int):
+    """Returns the same page as ORM objects and as rows carrying the TASK_COLUMNS."""
+    now = datetime(2026, 1, 1)
+    statuses = list(TaskStatus)
+    values = [
+        (
+            i,
+            1,
+            f"task {i}",
+            f"description of task {i}" if i % 2 else None,
+            statuses[i % len(statuses)],
+            now + timedelta(days=i % 30) if i % 3 else None,
+            now if statuses[i % len(statuses)] == TaskStatus.DONE else None,
+        )
+        for i in range(1, tasks + 1)
+    ]
+    objects = [Task(**dict(zip(FIELDS, value))) for value in values]
+    rows = [PlainRow(*value) for value in values]
+    return objects, rows
+
+
+def default_path(objects: List[Task]) -> bytes:
+    page = TaskPage.model_validate({"items": objects, "next_cursor": None}, from_attributes=True)
+    return json.dumps(page.model_dump(mode="json"), separators=(",", ":")).encode()
+
+
+def fast_path(rows: List[PlainRow]) -> bytes:
+    return TASK_PAGE.dump_json({"items": task_rows(rows), "next_cursor": None})
+
+
+def measure(encode: Callable[[], bytes], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode()
+        samples.append(time.perf_counter() - started)
+    return {"median_ms": statistics.median(samples) * 1000, "min_ms": min(samples) * 1000}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    objects, rows = build(args.tasks)
+    if json.loads(default_path(objects)) != json.loads(fast_path(rows)):
+        raise SystemExit("The two paths produce different documents")
+
+    results = {
+        "default": measure(lambda: default_path(objects), args.repeat),
+        "fast": measure(lambda: fast_path(rows), args.repeat),
+    }
+    print(f"{'path':<10}{'median ms':>12}{'min ms':>10}")
+    for name, result in results.items():
+        print(f"{name:<10}{result['median_ms']:>12.2f}{result['min_ms']:>10.2f}")
+    speedup = results["default"]["median_ms"] / results["fast"]["median_ms"]
+    print(f"\n{args.tasks} tasks: the fast path is {speedup:.1f}x faster (median)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,71 @@
-from fastapi import FastAPI
+import os
+from contextlib import asynccontextmanager
+from dotenv import load_dotenv
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+load_dotenv()
+
+# USE_ASYNC_DB=true serves the same endpoints from the asyncpg/AsyncSession stack
+USE_ASYNC_DB = os.getenv("USE_ASYNC_DB", "false").lower() in ("1", "true", "yes")
+
 # 💡 Import both routers
-from src.api.v1.routers import projects, tasks 
+if USE_ASYNC_DB:
+    from src.api.v1.routers import async_projects as projects, async_tasks as tasks
+else:
+    from src.api.v1.routers import projects, tasks 
+from src.api.v1.routers import tasks_batch, metrics, imports, search, stats, events, sync
+from src.db.pool import DB_POOL_TIMEOUT
+from src.db.session import dispose_engine, get_engine
+from src.api.instrumentation import RequestMetricsMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Importing the app builds no engine; it is created here, before the first request,
+    # so a misconfigured database fails the startup instead of the first request
+    get_engine()
+    yield
+    dispose_engine()
+    if USE_ASYNC_DB:
+        from src.db.async_session import async_engine
+        await async_engine.dispose()
 
 
 app = FastAPI(
     title="ToDoList API",
     description="A RESTful API for managing ToDo Projects and Tasks.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Per-request SQL count, DB / pool wait / serialization time (Server-Timing) and latency histograms
+app.add_middleware(RequestMetricsMiddleware)
+
 # 1. Include Routers (Controllers)
+# search and stats go first: /projects/search and /projects/stats must win over /projects/{project_id}
+app.include_router(search.router, prefix="/v1")
+app.include_router(stats.router, prefix="/v1")
 app.include_router(projects.router, prefix="/v1")
 # 💡 شامل کردن router جدید تسک‌ها
 app.include_router(tasks.router, prefix="/v1") 
+app.include_router(tasks_batch.router, prefix="/v1")
+app.include_router(metrics.router, prefix="/v1")
+app.include_router(metrics.prometheus_router)
+app.include_router(imports.router, prefix="/v1")
+app.include_router(events.router, prefix="/v1")
+app.include_router(sync.router, prefix="/v1")
+
+
+# 2. Pool exhaustion is a transient overload, not a server bug: ask clients to retry
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database connection pool exhausted, please retry."},
+        headers={"Retry-After": str(max(int(DB_POOL_TIMEOUT), 1))},
+    )
 
 
 @app.get("/", tags=["Root"])
@@ -0,0 +1,210 @@
+import asyncio
+import json
+import os
+import select
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Set, Tuple
+
+from src.db.pool import DB_POOL_MODE
+from src.db.session import IS_POSTGRES, connect_direct
+from src.repositories.change_repository import CHANGES_CHANNEL
+from src.services.unit_of_work import UnitOfWork
+
+# LISTEN needs a session-level Postgres connection (not pgbouncer in transaction mode, not SQLite);
+# without it the feed polls the changes table every CHANGE_FEED_POLL_SECONDS
+CHANGE_FEED_USE_NOTIFY = os.getenv(
+    "CHANGE_FEED_USE_NOTIFY", "true" if IS_POSTGRES and DB_POOL_MODE != "pgbouncer" else "false"
+).lower() in ("1", "true", "yes")
+CHANGE_FEED_POLL_SECONDS = float(os.getenv("CHANGE_FEED_POLL_SECONDS", "1"))
+# Events buffered per stream; a stream that falls further behind catches up from the table
+CHANGE_FEED_QUEUE_SIZE = int(os.getenv("CHANGE_FEED_QUEUE_SIZE", "1000"))
+# Idle streams send an SSE comment this often, so proxies keep the connection open
+CHANGE_FEED_HEARTBEAT_SECONDS = float(os.getenv("CHANGE_FEED_HEARTBEAT_SECONDS", "15"))
+# Changes read per query, both by the feed and when a stream replays
+CHANGE_FEED_BATCH_SIZE = 1000
+
+
+def change_event(change: Any) -> Dict[str, Any]:
+    """Serializes a row of the changes log as the event data clients receive."""
+    return {
+        "seq": change.seq,
+        "project_id": change.project_id,
+        "entity": change.entity,
+        "entity_id": change.entity_id,
+        "op": change.op,
+        "data": change.data,
+        "created_at": change.created_at.isoformat() if change.created_at else None,
+    }
+
+
+def load_changes(after_seq: int, project_id: Optional[int] = None, limit: int = CHANGE_FEED_BATCH_SIZE) -> list:
+    with UnitOfWork() as uow:
+        return [change_event(change) for change in uow.changes.get_since(after_seq, project_id=project_id, limit=limit)]
+
+
+def load_last_seq() -> int:
+    with UnitOfWork() as uow:
+        return uow.changes.get_last_seq()
+
+
+def load_pruned_through() -> int:
+    with UnitOfWork() as uow:
+        return uow.changes.get_pruned_through()
+
+
+def load_backlog(after_seq: int, project_id: int) -> Tuple[list, bool]:
+    """A stream's replay batch, and whether `after_seq` fell behind the pruned part of the log."""
+    with UnitOfWork() as uow:
+        changes = uow.changes.get_since(after_seq, project_id=project_id, limit=CHANGE_FEED_BATCH_SIZE)
+        events = [change_event(change) for change in changes]
+        # Read after the batch, as in SyncService.get_changes
+        return events, 0 < after_seq < uow.changes.get_pruned_through()
+
+
+def publish_orphans() -> None:
+    """Publishes entries whose writer committed them but died before its publish step."""
+    with UnitOfWork() as uow:
+        uow.changes.publish()
+        uow.commit()
+
+
+class Subscription:
+    """One open event stream: a bounded queue filled from the feed thread."""
+    def __init__(self, project_id: int, loop: asyncio.AbstractEventLoop):
+        self.project_id = project_id
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=CHANGE_FEED_QUEUE_SIZE)
+        # Set when events were dropped; the stream then replays from the table
+        self.lagged = False
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        # Runs on the event loop (scheduled from the feed thread)
+        if self.lagged:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.lagged = True
+
+
+class ChangeFeed:
+    """
+    Fans new rows of the changes log out to the event streams of this process.
+    A background thread, started with the first subscription, wakes up on NOTIFYs from
+    the writers (or polls), reads everything past its cursor in one query and hands each
+    change to the streams of its project. Every API replica runs its own feed, so a write
+    on any replica reaches the streams of all of them.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscriptions: Dict[int, Set[Subscription]] = {}
+        self.thread: Optional[threading.Thread] = None
+        self.cursor = 0
+
+    def subscribe(self, project_id: int) -> Subscription:
+        subscription = Subscription(project_id, asyncio.get_running_loop())
+        with self.lock:
+            self.subscriptions.setdefault(project_id, set()).add(subscription)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="change-feed", daemon=True)
+                self.thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self.lock:
+            subscribers = self.subscriptions.get(subscription.project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self.subscriptions[subscription.project_id]
+
+    def _run(self) -> None:
+        connection = None
+        self.cursor = load_last_seq()
+        next_sweep = time.monotonic()
+        while True:
+            try:
+                if CHANGE_FEED_USE_NOTIFY:
+                    if connection is None:
+                        connection = connect_direct()
+                        with connection.cursor() as cursor:
+                            cursor.execute(f"LISTEN {CHANGES_CHANNEL}")
+                    # The timeout doubles as a safety poll in case a notification is missed
+                    if select.select([connection], [], [], CHANGE_FEED_POLL_SECONDS * 10) != ([], [], []):
+                        connection.poll()
+                        connection.notifies.clear()
+                else:
+                    time.sleep(CHANGE_FEED_POLL_SECONDS)
+                if time.monotonic() >= next_sweep:
+                    publish_orphans()
+                    next_sweep = time.monotonic() + CHANGE_FEED_POLL_SECONDS * 10
+                self._dispatch_new()
+            except Exception as e:
+                print(f"ERROR in the change feed, retrying: {e}")
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+                    connection = None
+                time.sleep(CHANGE_FEED_POLL_SECONDS)
+
+    def _dispatch_new(self) -> None:
+        while True:
+            events = load_changes(self.cursor)
+            for event in events:
+                with self.lock:
+                    subscribers = list(self.subscriptions.get(event["project_id"], ()))
+                for subscription in subscribers:
+                    subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            if events:
+                self.cursor = events[-1]["seq"]
+            if len(events) < CHANGE_FEED_BATCH_SIZE:
+                return
+
+
+# One feed per process
+FEED = ChangeFeed()
+
+
+def format_event(event: Dict[str, Any]) -> str:
+    return f"id: {event['seq']}\nevent: {event['entity']}.{event['op']}\ndata: {json.dumps(event)}\n\n"
+
+
+async def stream_events(subscription: Subscription, after_seq: int) -> AsyncIterator[str]:
+    """
+    Yields the SSE frames of a project's changes after `after_seq`: first the backlog from the
+    table, then live events. Live events already covered by the backlog are skipped by seq.
+    A stream whose backlog was pruned meanwhile gets a `resync` event and is closed.
+    """
+    # Imported here so the module does not require Starlette outside the API
+    from starlette.concurrency import run_in_threadpool
+
+    last_seq = after_seq
+    replay = True
+    try:
+        while True:
+            if replay or subscription.lagged:
+                subscription.lagged = False
+                events, resync = await run_in_threadpool(load_backlog, last_seq, subscription.project_id)
+                if resync:
+                    yield f"event: resync\ndata: {json.dumps({'since': last_seq})}\n\n"
+                    return
+                for event in events:
+                    yield format_event(event)
+                    last_seq = event["seq"]
+                # A full batch means more backlog is waiting
+                replay = len(events) == CHANGE_FEED_BATCH_SIZE
+                continue
+
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=CHANGE_FEED_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event["seq"] > last_seq:
+                yield format_event(event)
+                last_seq = event["seq"]
+    finally:
+        FEED.unsubscribe(subscription)
@@ -0,0 +1,96 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response, status
+
+# Conditional GET helpers: routers probe a resource's version first and answer
+# 304 Not Modified without loading or serializing it when the client's copy is current.
+# Conditional writes (If-Match) use the same ETags: a stale copy is answered with 412.
+
+
+def make_etag(*parts: Any) -> str:
+    """Builds a strong ETag from the values a representation depends on."""
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def project_validators(row: Any, *extra: Any) -> Tuple[str, datetime]:
+    """
+    ETag and Last-Modified of a project and its tasks, from a ProjectRepository.get_validators row.
+    tasks_version moves on with every insert, update and delete of the project's tasks.
+    `extra` (e.g. the query string of a list endpoint) is folded into the ETag.
+    """
+    etag = make_etag("p", row.version, row.tasks_version, *extra)
+    last_modified = max(row.updated_at, row.tasks_updated_at or row.updated_at)
+    return etag, last_modified
+
+
+def task_validators(row: Any) -> Tuple[str, datetime]:
+    """ETag and Last-Modified of a single task, from a TaskRepository.get_validators row."""
+    return make_etag("t", row.version), row.updated_at
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """
+    Evaluates If-None-Match / If-Modified-Since against the current validators (RFC 9110:
+    If-Modified-Since is ignored when If-None-Match is present).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison: a W/ prefix does not matter for GET
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        since = _parse_http_date(if_modified_since)
+        # HTTP dates have second precision
+        return since is not None and _as_utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def is_precondition_failed(request: Request, etag: str) -> bool:
+    """
+    Evaluates If-Match against the current ETag (RFC 9110: strong comparison, so a W/ tag
+    never matches; `*` matches any current representation). False when the header is absent.
+    """
+    if_match = request.headers.get("if-match")
+    if if_match is None:
+        return False
+    candidates = {tag.strip() for tag in if_match.split(",")}
+    return "*" not in candidates and etag not in candidates
+
+
+def precondition_failed(etag: str) -> HTTPException:
+    """A 412 error carrying the current ETag, so the client can refetch and retry."""
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="The resource was modified since it was fetched.",
+        headers={"ETag": etag},
+    )
+
+
+def set_validators(response: Response, etag: str, last_modified: datetime) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+
+
+def not_modified(etag: str, last_modified: datetime) -> Response:
+    """An empty 304 response carrying the current validators."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
+
+
+def _as_utc(value: datetime) -> datetime:
+    # updated_at columns are naive UTC timestamps
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    try:
+        return _as_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
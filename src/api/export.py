@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Iterable, Iterator, List
+
+from src.repositories.task_repository import TASK_COLUMNS
+
+# Task export serializers: every batch of plain rows becomes one chunk of the
+# streamed body, without building ORM objects or Pydantic models per row.
+
+EXPORT_FIELDS = [column.key for column in TASK_COLUMNS]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def ndjson_chunk(rows: Iterable[Any]) -> str:
+    """One JSON object per row and line; TaskStatus serializes as its string value."""
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, row)), default=_json_default, ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+def csv_chunk(rows: Iterable[Any]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+
+def csv_header() -> str:
+    return csv_chunk([EXPORT_FIELDS])
+
+
+def encode_batches(batches: Iterator[List[Any]], format: str) -> Iterator[str]:
+    """Serializes batches of task rows in the given export format."""
+    if format == "csv":
+        yield csv_header()
+        for rows in batches:
+            yield csv_chunk(rows)
+    else:
+        for rows in batches:
+            yield ndjson_chunk(rows)
+
+
+async def encode_batches_async(batches: AsyncIterator[List[Any]], format: str) -> AsyncIterator[str]:
+    """Async counterpart of encode_batches."""
+    if format == "csv":
+        yield csv_header()
+        async for rows in batches:
+            yield csv_chunk(rows)
+    else:
+        async for rows in batches:
+            yield ndjson_chunk(rows)
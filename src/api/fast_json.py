@@ -0,0 +1,85 @@
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
+from src.db.request_stats import record_serialization
+from src.models.task import TaskStatus
+
+# Fast serialization path for the list endpoints: repositories return plain rows, and the
+# body is encoded in one pass by a TypeAdapter compiled at import time. FastAPI's default
+# path validates every item into a response_model instance, dumps it back to Python
+# objects and only then encodes JSON; the routes keep their response_model for the
+# OpenAPI schema but return a ready Response, which FastAPI passes through untouched.
+# Field order matches src/schemas.py, so clients receive the same documents as before.
+
+
+class TaskRow(TypedDict):
+    title: str
+    description: Optional[str]
+    deadline: Optional[datetime]
+    id: int
+    project_id: int
+    status: TaskStatus
+    closed_at: Optional[datetime]
+
+
+class TaskPageBody(TypedDict):
+    items: List[TaskRow]
+    next_cursor: Optional[int]
+
+
+class ProjectRow(TypedDict):
+    name: str
+    description: Optional[str]
+    id: int
+    tasks: List[TaskRow]
+
+
+class TaskCountsRow(TypedDict):
+    todo: int
+    doing: int
+    done: int
+    overdue: int
+
+
+class ProjectSummaryRow(TypedDict):
+    name: str
+    description: Optional[str]
+    id: int
+    task_counts: TaskCountsRow
+
+
+TASK_PAGE = TypeAdapter(TaskPageBody)
+PROJECTS_WITH_TASKS = TypeAdapter(List[ProjectRow])
+PROJECT_SUMMARIES = TypeAdapter(List[ProjectSummaryRow])
+
+
+def task_rows(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Turns rows carrying the TASK_COLUMNS into the dicts the adapters serialize."""
+    return [row._asdict() for row in rows]
+
+
+def json_response(adapter: TypeAdapter, data: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    # dump_json serializes against the compiled schema without validating the input first
+    started = time.perf_counter()
+    content = adapter.dump_json(data)
+    record_serialization(time.perf_counter() - started)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def task_page_response(rows: Iterable[Any], next_cursor: Optional[int], headers: Optional[Dict[str, str]] = None) -> Response:
+    return json_response(TASK_PAGE, {"items": task_rows(rows), "next_cursor": next_cursor}, headers)
+
+
+def projects_with_tasks_response(projects: List[Dict[str, Any]]) -> Response:
+    for project in projects:
+        project["tasks"] = task_rows(project["tasks"])
+    return json_response(PROJECTS_WITH_TASKS, projects)
+
+
+def project_summaries_response(summaries: List[Dict[str, Any]]) -> Response:
+    return json_response(PROJECT_SUMMARIES, summaries)
@@ -0,0 +1,150 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from src.db.request_stats import CURRENT_REQUEST_STATS, RequestStats
+
+# Request instrumentation: every request gets a RequestStats that the engine and pool hooks
+# (src/db/request_stats.py) fill in; the middleware reports it as a Server-Timing header and
+# folds it into per-route histograms, rendered in the Prometheus text format at /metrics.
+# The per-statement cost is one ContextVar lookup and two perf_counter calls.
+
+REQUEST_METRICS_ENABLED = os.getenv("REQUEST_METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+# Requests issuing more statements than this are logged: usually an N+1 query pattern
+REQUEST_MAX_QUERIES = int(os.getenv("REQUEST_MAX_QUERIES", "20"))
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RouteHistogram:
+    """Latency histogram plus statement and DB time totals of one route."""
+    __slots__ = ("buckets", "count", "seconds_sum", "statements", "db_seconds")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.seconds_sum = 0.0
+        self.statements = 0
+        self.db_seconds = 0.0
+
+
+class RequestMetrics:
+    """Thread-safe per-route request metrics of this process, keyed by (method, route, status)."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: Dict[Tuple[str, str, int], RouteHistogram] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        with self._lock:
+            histogram = self.routes.get((method, route, status))
+            if histogram is None:
+                histogram = self.routes[(method, route, status)] = RouteHistogram()
+            histogram.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            histogram.count += 1
+            histogram.seconds_sum += seconds
+            histogram.statements += stats.statements
+            histogram.db_seconds += stats.db_seconds
+
+    def render(self) -> str:
+        """Renders the histograms in the Prometheus text exposition format."""
+        with self._lock:
+            routes = [(key, list(h.buckets), h.count, h.seconds_sum, h.statements, h.db_seconds) for key, h in self.routes.items()]
+
+        lines: List[str] = [
+            "# HELP http_request_duration_seconds Request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route, status), buckets, count, seconds_sum, _, _ in routes:
+            labels = f'method="{method}",route="{route}",status="{status}"'
+            cumulative = 0
+            for bound, observed in zip(LATENCY_BUCKETS, buckets):
+                cumulative += observed
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {seconds_sum}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {count}")
+
+        lines += [
+            "# HELP http_request_sql_statements_total SQL statements issued by requests, by route.",
+            "# TYPE http_request_sql_statements_total counter",
+        ]
+        for (method, route, status), _, _, _, statements, _ in routes:
+            lines.append(f'http_request_sql_statements_total{{method="{method}",route="{route}",status="{status}"}} {statements}')
+
+        lines += [
+            "# HELP http_request_db_seconds_total Time spent executing SQL statements, by route.",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        for (method, route, status), _, _, _, _, db_seconds in routes:
+            lines.append(f'http_request_db_seconds_total{{method="{method}",route="{route}",status="{status}"}} {db_seconds}')
+        return "\n".join(lines) + "\n"
+
+
+# One registry per process
+REQUEST_METRICS = RequestMetrics()
+
+
+def server_timing(stats: RequestStats, app_seconds: float) -> str:
+    """The Server-Timing header value: DB, pool wait and serialization time, and the total until the response started."""
+    return (
+        f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.statements} queries", '
+        f"pool;dur={stats.pool_wait_seconds * 1000:.2f}, "
+        f"serialize;dur={stats.serialize_seconds * 1000:.2f}, "
+        f"app;dur={app_seconds * 1000:.2f}"
+    )
+
+
+def log(message: str) -> None:
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
+
+
+class RequestMetricsMiddleware:
+    """
+    ASGI middleware that measures each HTTP request. Written against raw ASGI rather than
+    BaseHTTPMiddleware so it adds no extra task or body buffering per request, and so
+    streamed responses (exports, event streams) pass through untouched.
+    """
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or not REQUEST_METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = CURRENT_REQUEST_STATS.set(stats)
+        started = time.perf_counter()
+        status = 500
+        streaming = False
+
+        async def send_with_timing(message: Dict[str, Any]) -> None:
+            nonlocal status, streaming
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                streaming = any(
+                    name == b"content-type" and value.startswith(b"text/event-stream") for name, value in headers
+                )
+                headers.append((b"server-timing", server_timing(stats, time.perf_counter() - started).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            CURRENT_REQUEST_STATS.reset(token)
+            # The route template, not the raw path, keeps the label set bounded
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            method = scope["method"]
+            # Event streams stay open for as long as the client listens; their duration is not latency
+            if not streaming:
+                REQUEST_METRICS.observe(method, route, status, time.perf_counter() - started, stats)
+            if stats.statements > REQUEST_MAX_QUERIES:
+                log(
+                    f"WARNING {method} {route} issued {stats.statements} SQL statements "
+                    f"(more than REQUEST_MAX_QUERIES={REQUEST_MAX_QUERIES}); possible N+1 query pattern"
+                )
@@ -0,0 +1,112 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from typing import List, Literal, Optional, Union
+
+# Import Schemas
+from src.schemas import ProjectCreate, ProjectInDB, ProjectSummary
+
+# Import Services and Repositories
+from src.services.async_project_service import AsyncProjectService
+from src.db.dependencies import get_async_uow
+from src.services.unit_of_work import AsyncUnitOfWork
+from src.exceptions.repository_exceptions import NotFoundException
+from src.api.fast_json import project_summaries_response, projects_with_tasks_response
+from src.api.conditional import is_not_modified, not_modified, project_validators, set_validators
+
+# Same paths as src/api/v1/routers/projects.py, served by the asyncpg stack (see USE_ASYNC_DB in main.py)
+router = APIRouter(prefix="/projects", tags=["Projects"])
+
+def get_project_service(uow: AsyncUnitOfWork = Depends(get_async_uow)) -> AsyncProjectService:
+    """Dependency injection for AsyncProjectService."""
+    return AsyncProjectService(uow)
+
+
+# ------------------ Endpoints ------------------
+
+@router.post("/", response_model=ProjectInDB, status_code=status.HTTP_201_CREATED)
+async def create_project(
+    project_data: ProjectCreate,
+    service: AsyncProjectService = Depends(get_project_service)
+):
+    """Create a new project."""
+    try:
+        return await service.create_project(
+            name=project_data.name,
+            description=project_data.description
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/", response_model=Union[List[ProjectSummary], List[ProjectInDB]])
+async def list_projects(
+    include: Optional[Literal["tasks"]] = Query(None, description="Pass `tasks` to embed the full task list of each project"),
+    after_id: Optional[int] = Query(None, description="ID of the last project of the previous page"),
+    limit: int = Query(100, ge=1, le=500),
+    service: AsyncProjectService = Depends(get_project_service)
+):
+    """
+    Retrieve one page of projects, ordered by ID.
+    By default each project carries aggregate task counts; `?include=tasks` returns the full task tree.
+    """
+    # Plain rows encoded by a pre-compiled TypeAdapter; see src/api/fast_json.py
+    if include == "tasks":
+        return projects_with_tasks_response(await service.list_projects_with_tasks(after_id=after_id, limit=limit))
+
+    return project_summaries_response(await service.list_project_summaries(after_id=after_id, limit=limit))
+
+
+@router.get("/{project_id}", response_model=ProjectInDB)
+async def get_project(
+    project_id: int,
+    request: Request,
+    response: Response,
+    service: AsyncProjectService = Depends(get_project_service)
+):
+    """
+    Retrieve a single project by ID.
+    Supports If-None-Match / If-Modified-Since: an unchanged project is answered with 304.
+    """
+    try:
+        etag, last_modified = project_validators(await service.get_validators(project_id))
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
+
+        project = await service.get_project(project_id)
+        set_validators(response, etag, last_modified)
+        return project
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.put("/{project_id}", response_model=ProjectInDB)
+async def update_project(
+    project_id: int,
+    project_data: ProjectCreate,
+    service: AsyncProjectService = Depends(get_project_service)
+):
+    """Update an existing project."""
+    try:
+        return await service.update_project(
+            project_id=project_id,
+            name=project_data.name,
+            description=project_data.description
+        )
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_project(
+    project_id: int,
+    service: AsyncProjectService = Depends(get_project_service)
+):
+    """Delete a project."""
+    try:
+        await service.delete_project(project_id)
+        return
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,191 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Literal, Optional
+from datetime import datetime
+
+# Import Schemas, Models, Services
+from src.schemas import TaskCreate, TaskUpdate, TaskInDB, TaskPage
+from src.models.task import TaskStatus
+from src.services.async_task_service import AsyncTaskService
+from src.db.dependencies import get_async_uow
+from src.services.unit_of_work import AsyncUnitOfWork
+from src.exceptions.repository_exceptions import NotFoundException, VersionConflictException
+from src.api.fast_json import task_page_response
+from src.api.export import MEDIA_TYPES, encode_batches_async
+from src.api.conditional import (
+    is_not_modified, is_precondition_failed, not_modified, precondition_failed, project_validators, set_validators, task_validators,
+)
+
+# Same paths as src/api/v1/routers/tasks.py, served by the asyncpg stack (see USE_ASYNC_DB in main.py)
+router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["Tasks"])
+
+def get_task_service(uow: AsyncUnitOfWork = Depends(get_async_uow)) -> AsyncTaskService:
+    """Dependency injection for AsyncTaskService."""
+    return AsyncTaskService(uow)
+
+# ------------------ Endpoints ------------------
+
+@router.post("/", response_model=TaskInDB, status_code=status.HTTP_201_CREATED)
+async def create_task_for_project(
+    project_id: int,
+    task_data: TaskCreate,
+    service: AsyncTaskService = Depends(get_task_service)
+):
+    """Create a new task within a specified project."""
+    try:
+        return await service.create_task(
+            project_id=project_id,
+            title=task_data.title,
+            description=task_data.description,
+            deadline=task_data.deadline
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/", response_model=TaskPage)
+async def list_tasks_for_project(
+    project_id: int,
+    request: Request,
+    after_id: Optional[int] = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    limit: int = Query(50, ge=1, le=500),
+    status_filter: Optional[List[TaskStatus]] = Query(None, alias="status"),
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    closed_from: Optional[datetime] = None,
+    closed_to: Optional[datetime] = None,
+    service: AsyncTaskService = Depends(get_task_service)
+):
+    """
+    Retrieve one page of tasks for a specific project, ordered by ID.
+    Filters are applied in SQL; follow `next_cursor` to stream further pages.
+    Supports If-None-Match / If-Modified-Since: when no task of the project changed, the answer is 304.
+    """
+    # One aggregate probe over the project's tasks covers every page and filter combination
+    validators = await service.get_project_validators(project_id)
+    if validators:
+        etag, last_modified = project_validators(validators, request.url.query)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
+
+    tasks, next_cursor = await service.list_tasks_page(
+        project_id=project_id,
+        after_id=after_id,
+        limit=limit,
+        statuses=status_filter,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+        closed_from=closed_from,
+        closed_to=closed_to,
+    )
+    # Plain rows encoded by a pre-compiled TypeAdapter; see src/api/fast_json.py
+    page = task_page_response(tasks, next_cursor)
+    if validators:
+        set_validators(page, etag, last_modified)
+    return page
+
+
+# Registered before /{task_id}, which would otherwise capture "export"
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks_for_project(
+    project_id: int,
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    service: AsyncTaskService = Depends(get_task_service)
+):
+    """
+    Export all tasks of a project as NDJSON or CSV.
+    Rows are streamed from a server-side cursor in batches, so memory stays flat for any project size.
+    """
+    try:
+        await service.ensure_project_exists(project_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    async def body() -> AsyncIterator[str]:
+        # The stream outlives the request's unit of work, so it reads through its own session
+        async with AsyncUnitOfWork() as uow:
+            async for chunk in encode_batches_async(AsyncTaskService(uow).export_tasks(project_id), format):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}-tasks.{format}"'}
+    )
+
+
+@router.get("/{task_id}", response_model=TaskInDB)
+async def get_task_for_project(
+    project_id: int,
+    task_id: int,
+    request: Request,
+    response: Response,
+    service: AsyncTaskService = Depends(get_task_service)
+):
+    """
+    Retrieve a single task by its ID.
+    Supports If-None-Match / If-Modified-Since: an unchanged task is answered with 304.
+    """
+    try:
+        etag, last_modified = task_validators(await service.get_task_validators(project_id, task_id))
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
+
+        task = await service.get_task_by_id(project_id, task_id)
+        set_validators(response, etag, last_modified)
+        return task
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.put("/{task_id}", response_model=TaskInDB)
+async def update_task_for_project(
+    project_id: int,
+    task_id: int,
+    task_data: TaskUpdate,
+    request: Request,
+    response: Response,
+    service: AsyncTaskService = Depends(get_task_service)
+):
+    """Update an existing task; supports If-Match like the sync route (412 on a stale ETag)."""
+    expected_version = None
+    try:
+        if request.headers.get("if-match") is not None:
+            validators = await service.get_task_validators(project_id, task_id)
+            etag, _ = task_validators(validators)
+            if is_precondition_failed(request, etag):
+                raise precondition_failed(etag)
+            expected_version = validators.version
+
+        updated_task = await service.update_task(
+            project_id=project_id,
+            task_id=task_id,
+            title=task_data.title,
+            description=task_data.description,
+            deadline=task_data.deadline,
+            status=task_data.status,
+            expected_version=expected_version
+        )
+        set_validators(response, *task_validators(updated_task))
+        return updated_task
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except VersionConflictException as e:
+        code = status.HTTP_412_PRECONDITION_FAILED if expected_version is not None else status.HTTP_409_CONFLICT
+        raise HTTPException(status_code=code, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_task_for_project(
+    project_id: int,
+    task_id: int,
+    service: AsyncTaskService = Depends(get_task_service)
+):
+    """Delete a task."""
+    try:
+        await service.delete_task(project_id, task_id)
+        return
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Optional
+
+from src.api.change_feed import FEED, load_last_seq, load_pruned_through, stream_events
+from src.exceptions.repository_exceptions import NotFoundException
+from src.services.task_service import TaskService
+from src.services.unit_of_work import UnitOfWork
+
+router = APIRouter(prefix="/projects", tags=["Events"])
+
+
+def ensure_project_exists(project_id: int) -> None:
+    with UnitOfWork() as uow:
+        TaskService(uow).ensure_project_exists(project_id)
+
+# ------------------ Endpoints ------------------
+
+@router.get("/{project_id}/events")
+async def stream_project_events(
+    project_id: int,
+    since: Optional[int] = Query(None, ge=0, description="Resume after this sequence number"),
+    last_event_id: Optional[str] = Header(None, description="Sent by EventSource on reconnect; same as `since`"),
+):
+    """
+    Server-Sent Events stream of the project's task and project changes
+    (`task.created`, `task.updated`, `task.deleted`, `task.autoclosed`, `project.updated`, ...).
+    Each event's `id` is its sequence number: reconnect with `Last-Event-ID` or `since`
+    to receive every change made in between. Without either, the stream starts with new changes.
+    Responds 410 when that point is older than the retained log; a stream that falls that far
+    behind later receives a `resync` event and is closed. Reload the project, then stream anew.
+    """
+    try:
+        await run_in_threadpool(ensure_project_exists, project_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    if since is None and last_event_id is not None:
+        if not last_event_id.isdigit():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Last-Event-ID must be a sequence number.")
+        since = int(last_event_id)
+
+    if since and since < await run_in_threadpool(load_pruned_through):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Changes after this point were pruned; reload the project and stream anew."
+        )
+
+    # Subscribe before reading the starting point, so no change falls in between
+    subscription = FEED.subscribe(project_id)
+    if since is None:
+        try:
+            since = await run_in_threadpool(load_last_seq)
+        except Exception:
+            FEED.unsubscribe(subscription)
+            raise
+
+    return StreamingResponse(
+        stream_events(subscription, since),
+        media_type="text/event-stream",
+        # No caching, and no response buffering by nginx-style proxies
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
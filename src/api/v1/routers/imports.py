@@ -0,0 +1,48 @@
+import io
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile, status
+from typing import Any, Dict, Literal
+
+from src.commands.bulk_import import BulkImportCommand
+from src.services.unit_of_work import UnitOfWork
+
+router = APIRouter(tags=["Imports"])
+
+
+def run_import(kind: str, file: UploadFile, format: str) -> Dict[str, Any]:
+    """Runs a bulk import over an uploaded file (spooled to disk by Starlette, so memory stays bounded)."""
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        with UnitOfWork() as uow:
+            return BulkImportCommand(uow, kind).execute(stream, format)
+    except UnicodeDecodeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Input is not valid UTF-8: {e}")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    finally:
+        # Keep the underlying upload open for Starlette to close
+        stream.detach()
+
+# ------------------ Endpoints ------------------
+
+@router.post("/projects:import")
+def import_projects(
+    file: UploadFile = File(..., description="CSV with a name,description header, or NDJSON"),
+    format: Literal["csv", "ndjson"] = Query("csv")
+):
+    """
+    Bulk-load projects with PostgreSQL COPY in a single transaction.
+    Returns the imported/rejected counts, the first rejected lines and the throughput.
+    """
+    return run_import("projects", file, format)
+
+
+@router.post("/tasks:import")
+def import_tasks(
+    file: UploadFile = File(..., description="CSV with a project_id,title,description,deadline header, or NDJSON"),
+    format: Literal["csv", "ndjson"] = Query("csv")
+):
+    """
+    Bulk-load tasks with PostgreSQL COPY in a single transaction.
+    Rows referencing unknown projects are rejected and reported by line.
+    """
+    return run_import("tasks", file, format)
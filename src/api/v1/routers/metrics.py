@@ -0,0 +1,36 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from typing import Any, Dict
+
+from src.db.pool import POOL_METRICS
+from src.cache.read_through import get_cache
+from src.api.instrumentation import REQUEST_METRICS
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+# Scrape target at the conventional /metrics path, included in main.py without the /v1 prefix
+prometheus_router = APIRouter(tags=["Metrics"])
+
+# ------------------ Endpoints ------------------
+
+@router.get("/pool")
+def get_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Connection pool statistics of each database engine ("sync", and "async" when the
+    asyncpg stack is loaded): connections in use, peak usage, checkout wait times and timeouts.
+    """
+    return {name: metrics.snapshot() for name, metrics in POOL_METRICS.items()}
+
+
+@router.get("/cache")
+def get_cache_metrics() -> Dict[str, Any]:
+    """Read-through cache statistics of this process: backend, hits, misses and hit ratio."""
+    return get_cache().stats()
+
+
+@prometheus_router.get("/metrics", response_class=PlainTextResponse)
+def get_request_metrics() -> PlainTextResponse:
+    """
+    Per-route request latency histograms, SQL statement counts and DB time of this process,
+    in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(REQUEST_METRICS.render(), media_type="text/plain; version=0.0.4")
@@ -1,23 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from typing import List, Literal, Optional, Union
 
 # Import Schemas
-from src.schemas import ProjectCreate, ProjectInDB
+from src.schemas import ProjectCreate, ProjectInDB, ProjectSummary
 
 # Import Services and Repositories
-from src.repositories.project_repository import ProjectRepository
 from src.services.project_service import ProjectService
-from src.db.dependencies import get_db
+from src.db.dependencies import get_uow
+from src.services.unit_of_work import UnitOfWork
 from src.exceptions.repository_exceptions import NotFoundException
+from src.api.fast_json import project_summaries_response, projects_with_tasks_response
+from src.api.conditional import is_not_modified, not_modified, project_validators, set_validators
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
 # Dependency that creates and provides the ProjectService
-def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
+def get_project_service(uow: UnitOfWork = Depends(get_uow)) -> ProjectService:
     """Dependency injection for ProjectService."""
-    repo = ProjectRepository(db)
-    return ProjectService(repo)
+    return ProjectService(uow)
 
 
 # ------------------ Endpoints ------------------
@@ -39,20 +39,43 @@ def create_project(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/", response_model=List[ProjectInDB])
-def list_projects(service: ProjectService = Depends(get_project_service)):
-    """Retrieve a list of all projects."""
-    return service.list_projects()
+@router.get("/", response_model=Union[List[ProjectSummary], List[ProjectInDB]])
+def list_projects(
+    include: Optional[Literal["tasks"]] = Query(None, description="Pass `tasks` to embed the full task list of each project"),
+    after_id: Optional[int] = Query(None, description="ID of the last project of the previous page"),
+    limit: int = Query(100, ge=1, le=500),
+    service: ProjectService = Depends(get_project_service)
+):
+    """
+    Retrieve one page of projects, ordered by ID.
+    By default each project carries aggregate task counts; `?include=tasks` returns the full task tree.
+    """
+    # Plain rows encoded by a pre-compiled TypeAdapter; see src/api/fast_json.py
+    if include == "tasks":
+        return projects_with_tasks_response(service.list_projects_with_tasks(after_id=after_id, limit=limit))
+
+    return project_summaries_response(service.list_project_summaries(after_id=after_id, limit=limit))
 
 
 @router.get("/{project_id}", response_model=ProjectInDB)
-def get_project(project_id: int, service: ProjectService = Depends(get_project_service)):
-    """Retrieve a single project by ID."""
+def get_project(
+    project_id: int,
+    request: Request,
+    response: Response,
+    service: ProjectService = Depends(get_project_service)
+):
+    """
+    Retrieve a single project by ID.
+    Supports If-None-Match / If-Modified-Since: an unchanged project is answered with 304.
+    """
     try:
-        # Use repository directly for simple read operations where no business logic is needed
-        project = service.repo.get_by_id(project_id) 
-        if not project:
-             raise NotFoundException
+        etag, last_modified = project_validators(service.get_validators(project_id))
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
+
+        # Served from the read-through cache; write paths in the services invalidate it
+        project = service.get_project(project_id, version=etag)
+        set_validators(response, etag, last_modified)
         return project
     except NotFoundException:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Project {project_id} not found")
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Optional
+
+# Import Schemas, Services
+from src.schemas import ProjectMatch, TaskSearchPage
+from src.services.project_service import ProjectService
+from src.services.task_service import TaskService
+from src.db.dependencies import get_uow
+from src.services.unit_of_work import UnitOfWork
+
+# Included before the projects router in main.py, whose /projects/{project_id} would capture "search"
+router = APIRouter(tags=["Search"])
+
+def get_task_service(uow: UnitOfWork = Depends(get_uow)) -> TaskService:
+    """Dependency injection for TaskService."""
+    return TaskService(uow)
+
+def get_project_service(uow: UnitOfWork = Depends(get_uow)) -> ProjectService:
+    """Dependency injection for ProjectService."""
+    return ProjectService(uow)
+
+# ------------------ Endpoints ------------------
+
+@router.get("/tasks/search", response_model=TaskSearchPage)
+def search_tasks(
+    q: str = Query(..., min_length=1, description='Web search syntax: words, "quoted phrases", OR, -excluded'),
+    project_id: Optional[int] = Query(None, description="Restrict the search to one project"),
+    cursor: Optional[str] = Query(None, description="`next_cursor` of the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    service: TaskService = Depends(get_task_service)
+):
+    """
+    Full-text search over task titles and descriptions, best matches first.
+    Backed by a GIN index on a generated tsvector column; follow `next_cursor` for further pages.
+    """
+    try:
+        items, next_cursor = service.search_tasks(q, project_id=project_id, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return TaskSearchPage(items=items, next_cursor=next_cursor)
+
+
+@router.get("/projects/search", response_model=List[ProjectMatch])
+def search_projects(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    service: ProjectService = Depends(get_project_service)
+):
+    """Find projects by name prefix or fuzzy (trigram) similarity, most similar first."""
+    try:
+        return service.search_projects(q, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
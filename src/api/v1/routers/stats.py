@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+# Import Schemas, Services
+from src.schemas import ProjectTaskStats, TaskStatsRollup
+from src.services.project_service import ProjectService
+from src.db.dependencies import get_uow
+from src.services.unit_of_work import UnitOfWork
+from src.exceptions.repository_exceptions import NotFoundException
+
+# Included before the projects router in main.py, whose /projects/{project_id} would capture "stats"
+router = APIRouter(prefix="/projects", tags=["Stats"])
+
+def get_project_service(uow: UnitOfWork = Depends(get_uow)) -> ProjectService:
+    """Dependency injection for ProjectService."""
+    return ProjectService(uow)
+
+# ------------------ Endpoints ------------------
+
+@router.get("/stats", response_model=TaskStatsRollup)
+def get_stats_rollup(service: ProjectService = Depends(get_project_service)):
+    """Task counts by status, overdue count and average time-to-close over all projects."""
+    return service.get_stats_rollup()
+
+
+@router.get("/{project_id}/stats", response_model=ProjectTaskStats)
+def get_project_stats(project_id: int, service: ProjectService = Depends(get_project_service)):
+    """
+    Task counts by status, overdue count and average time-to-close of one project.
+    Read from counters maintained on every task write, so the cost does not grow with the project.
+    """
+    try:
+        return service.get_project_stats(project_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
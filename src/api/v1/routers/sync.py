@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+
+# Import Schemas, Services
+from src.exceptions.service_exceptions import ResyncRequiredException
+from src.schemas import SyncPage
+from src.services.sync_service import SyncService
+from src.db.dependencies import get_uow
+from src.services.unit_of_work import UnitOfWork
+
+router = APIRouter(tags=["Sync"])
+
+def get_sync_service(uow: UnitOfWork = Depends(get_uow)) -> SyncService:
+    """Dependency injection for SyncService."""
+    return SyncService(uow)
+
+# ------------------ Endpoints ------------------
+
+@router.get("/sync", response_model=SyncPage)
+def sync(
+    since: int = Query(0, ge=0, description="`next_since` of the previous sync; 0 for everything"),
+    limit: int = Query(1000, ge=1, le=5000, description="Maximum number of log entries read"),
+    project_id: Optional[int] = Query(None, description="Restrict the sync to one project"),
+    service: SyncService = Depends(get_sync_service)
+):
+    """
+    Everything that changed after sequence number `since`: the latest state of each created or
+    updated task and project, and the IDs of deleted ones. Costs O(changes), not O(data).
+    While `has_more` is true, call again with `next_since`.
+    Responds 410 when `since` is older than the retained log: drop local state and sync from 0.
+    """
+    try:
+        return service.get_changes(since, limit=limit, project_id=project_id)
+    except ResyncRequiredException as e:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
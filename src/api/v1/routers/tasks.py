@@ -1,21 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Iterator, List, Literal, Optional
+from datetime import datetime
 
 # Import Schemas, Models, Services
-from src.schemas import TaskCreate, TaskUpdate, TaskInDB
+from src.schemas import TaskCreate, TaskUpdate, TaskInDB, TaskPage
 from src.models.task import TaskStatus
-from src.repositories.task_repository import TaskRepository
 from src.services.task_service import TaskService
-from src.db.dependencies import get_db
-from src.exceptions.repository_exceptions import NotFoundException
+from src.db.dependencies import get_uow
+from src.services.unit_of_work import UnitOfWork
+from src.exceptions.repository_exceptions import NotFoundException, VersionConflictException
+from src.api.fast_json import task_page_response
+from src.api.export import MEDIA_TYPES, encode_batches
+from src.api.conditional import (
+    is_not_modified, is_precondition_failed, not_modified, precondition_failed, project_validators, set_validators, task_validators,
+)
 
 router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["Tasks"])
 
-def get_task_service(db: Session = Depends(get_db)) -> TaskService:
+def get_task_service(uow: UnitOfWork = Depends(get_uow)) -> TaskService:
     """Dependency injection for TaskService."""
-    repo = TaskRepository(db)
-    return TaskService(repo)
+    return TaskService(uow)
 
 # ------------------ Endpoints ------------------
 
@@ -31,7 +36,7 @@ def create_task_for_project(
             project_id=project_id,
             title=task_data.title,
             description=task_data.description,
-            deadline=task_data.deadline.isoformat() if task_data.deadline else None 
+            deadline=task_data.deadline 
         )
         return task
     except ValueError as e:
@@ -39,28 +44,97 @@ def create_task_for_project(
 
 
 # 💡 اضافه شدن این متد حیاتی برای GET /v1/projects/{project_id}/tasks/
-@router.get("/", response_model=List[TaskInDB]) 
+@router.get("/", response_model=TaskPage) 
 def list_tasks_for_project(
     project_id: int, 
+    request: Request,
+    after_id: Optional[int] = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    limit: int = Query(50, ge=1, le=500),
+    status_filter: Optional[List[TaskStatus]] = Query(None, alias="status"),
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    closed_from: Optional[datetime] = None,
+    closed_to: Optional[datetime] = None,
     service: TaskService = Depends(get_task_service)
 ):
-    """Retrieve a list of all tasks for a specific project."""
-    # Note: If list_tasks_by_project logic ensures project existence, 
-    # we might need to add ProjectService dependency here to check for 404 on project_id.
-    # For now, relying on list_tasks_by_project to return an empty list if project exists 
-    # but has no tasks, or letting an IntegrityError pass as 500 if project doesn't exist.
-    return service.list_tasks_by_project(project_id)
+    """
+    Retrieve one page of tasks for a specific project, ordered by ID.
+    Filters are applied in SQL; follow `next_cursor` to stream further pages.
+    Supports If-None-Match / If-Modified-Since: when no task of the project changed, the answer is 304.
+    """
+    # One aggregate probe over the project's tasks covers every page and filter combination
+    validators = service.get_project_validators(project_id)
+    if validators:
+        etag, last_modified = project_validators(validators, request.url.query)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
+
+    # Note: A project without tasks (or a missing project) returns an empty page.
+    tasks, next_cursor = service.list_tasks_page(
+        project_id=project_id,
+        after_id=after_id,
+        limit=limit,
+        statuses=status_filter,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+        closed_from=closed_from,
+        closed_to=closed_to,
+    )
+    # Plain rows encoded by a pre-compiled TypeAdapter; see src/api/fast_json.py
+    page = task_page_response(tasks, next_cursor)
+    if validators:
+        set_validators(page, etag, last_modified)
+    return page
+
+
+# Registered before /{task_id}, which would otherwise capture "export"
+@router.get("/export", response_class=StreamingResponse)
+def export_tasks_for_project(
+    project_id: int,
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    service: TaskService = Depends(get_task_service)
+):
+    """
+    Export all tasks of a project as NDJSON or CSV.
+    Rows are streamed from a server-side cursor in batches, so memory stays flat for any project size.
+    """
+    try:
+        service.ensure_project_exists(project_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    def body() -> Iterator[str]:
+        # The stream outlives the request's unit of work, so it reads through its own session
+        with UnitOfWork() as uow:
+            yield from encode_batches(TaskService(uow).export_tasks(project_id), format)
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}-tasks.{format}"'}
+    )
 
 
 @router.get("/{task_id}", response_model=TaskInDB)
 def get_task_for_project(
     project_id: int, 
     task_id: int, 
+    request: Request,
+    response: Response,
     service: TaskService = Depends(get_task_service)
 ):
-    """Retrieve a single task by its ID."""
+    """
+    Retrieve a single task by its ID.
+    Supports If-None-Match / If-Modified-Since: an unchanged task is answered with 304.
+    """
     try:
-        task = service.get_task_by_id(project_id, task_id)
+        etag, last_modified = task_validators(service.get_task_validators(project_id, task_id))
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
+
+        # Served from the read-through cache; write paths in the services invalidate it
+        task = service.get_task(project_id, task_id, version=etag)
+        set_validators(response, etag, last_modified)
         return task
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -71,21 +145,41 @@ def update_task_for_project(
     project_id: int, 
     task_id: int,
     task_data: TaskUpdate,
+    request: Request,
+    response: Response,
     service: TaskService = Depends(get_task_service)
 ):
-    """Update an existing task."""
+    """
+    Update an existing task.
+    Supports If-Match with the task's ETag: the update is applied only to that version of the
+    task and answered with 412 when it has changed since. The response carries the new ETag.
+    """
+    expected_version = None
     try:
+        if request.headers.get("if-match") is not None:
+            validators = service.get_task_validators(project_id, task_id)
+            etag, _ = task_validators(validators)
+            if is_precondition_failed(request, etag):
+                raise precondition_failed(etag)
+            expected_version = validators.version
+
         updated_task = service.update_task(
             project_id=project_id,
             task_id=task_id,
             title=task_data.title,
             description=task_data.description,
-            deadline=task_data.deadline.isoformat() if task_data.deadline else None,
-            status=task_data.status
+            deadline=task_data.deadline,
+            status=task_data.status,
+            expected_version=expected_version
         )
+        set_validators(response, *task_validators(updated_task))
         return updated_task
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except VersionConflictException as e:
+        # 412 when the client's If-Match lost a race with another write; 409 when even the retries did
+        code = status.HTTP_412_PRECONDITION_FAILED if expected_version is not None else status.HTTP_409_CONFLICT
+        raise HTTPException(status_code=code, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -0,0 +1,97 @@
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from typing import Any, Dict, Iterator, List, Tuple, Type
+
+# Import Schemas, Services
+from src.schemas import TaskBatchCreateItem, TaskBatchUpdateItem, TaskBatchDelete, TaskBatchResult
+from src.services.task_service import TaskService
+from src.db.dependencies import get_uow
+from src.services.unit_of_work import UnitOfWork
+
+# Upper bound on items per request; larger imports should be split client-side
+MAX_BATCH_ITEMS = 5000
+
+router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+def get_task_service(uow: UnitOfWork = Depends(get_uow)) -> TaskService:
+    """Dependency injection for TaskService."""
+    return TaskService(uow)
+
+
+def validate_items(
+    raw_items: List[Dict[str, Any]], schema: Type[BaseModel]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Validates every item on its own so one bad item does not reject the whole batch.
+    Returns the valid items (as dicts tagged with their index) and the per-item errors.
+    """
+    if len(raw_items) > MAX_BATCH_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"A batch may contain at most {MAX_BATCH_ITEMS} items."
+        )
+
+    valid, errors = [], []
+    for index, raw in enumerate(raw_items):
+        try:
+            item = schema.model_validate(raw)
+        except ValidationError as e:
+            message = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+            errors.append({"index": index, "status": "error", "error": message})
+            continue
+        valid.append(dict(item.model_dump(), index=index))
+    return valid, errors
+
+
+def stream_results(results: List[Dict[str, Any]]) -> StreamingResponse:
+    """Streams batch results as NDJSON, one line per request item in request order."""
+    def lines() -> Iterator[str]:
+        for result in sorted(results, key=lambda r: r["index"]):
+            yield TaskBatchResult.model_validate(result).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+# ------------------ Endpoints ------------------
+
+@router.post(":batch", response_model=TaskBatchResult)
+def create_tasks_batch(
+    items: List[Dict[str, Any]] = Body(..., description="Array of TaskCreate objects, each with a project_id"),
+    service: TaskService = Depends(get_task_service)
+):
+    """
+    Create many tasks in a single transaction.
+    The response is NDJSON with one TaskBatchResult per item, in request order.
+    """
+    valid, errors = validate_items(items, TaskBatchCreateItem)
+    return stream_results(errors + service.create_tasks_batch(valid))
+
+
+@router.patch(":batch", response_model=TaskBatchResult)
+def update_tasks_batch(
+    items: List[Dict[str, Any]] = Body(..., description="Array of TaskUpdate objects, each with the task id"),
+    service: TaskService = Depends(get_task_service)
+):
+    """
+    Update many tasks in a single transaction.
+    The response is NDJSON with one TaskBatchResult per item, in request order.
+    """
+    valid, errors = validate_items(items, TaskBatchUpdateItem)
+    return stream_results(errors + service.update_tasks_batch(valid))
+
+
+@router.delete(":batch", response_model=TaskBatchResult)
+def delete_tasks_batch(
+    body: TaskBatchDelete,
+    service: TaskService = Depends(get_task_service)
+):
+    """
+    Delete many tasks in a single statement.
+    The response is NDJSON with one TaskBatchResult per ID, in request order.
+    """
+    if len(body.ids) > MAX_BATCH_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"A batch may contain at most {MAX_BATCH_ITEMS} items."
+        )
+    return stream_results(service.delete_tasks_batch(body.ids))
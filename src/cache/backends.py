@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class CacheBackend(ABC):
+    """
+    Key/value store used by ReadThroughCache. Values expire after their TTL.
+    Values are JSON-serializable (dicts of JSON types, lists, tuples), so shared backends
+    store them as JSON; a tuple may come back as a list.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value, or None if the key is missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Stores `value` under `key` for `ttl` seconds."""
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """Removes the given keys; missing keys are ignored."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every entry of this cache."""
+
+
+class LRUCacheBackend(CacheBackend):
+    """
+    In-process cache bounded to `max_entries`; the least recently used entry is evicted first.
+    Each process keeps its own copy, so writes in another process only become visible
+    here through TTL expiry.
+    """
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by every API process, stored in Redis (or any server speaking its protocol).
+    Values are stored as JSON, never pickled: whoever can write to Redis must not be able
+    to run code in the API. Requires the optional `redis` package, unless `client` is given.
+    """
+    def __init__(self, url: str, prefix: str = "todolist:", client: Any = None):
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError("CACHE_BACKEND=redis requires the 'redis' package (poetry install -E cache)") from e
+            client = redis.Redis.from_url(url)
+
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            # Not written by this backend (or by an older, pickling version): a miss, overwritten on load
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.client.set(self.prefix + key, json.dumps(value, separators=(",", ":")), px=int(ttl * 1000))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self) -> None:
+        # SCAN instead of FLUSHDB: the Redis database may be shared with other applications
+        keys = list(self.client.scan_iter(match=self.prefix + "*", count=1000))
+        if keys:
+            self.client.delete(*keys)
@@ -0,0 +1,126 @@
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+from dotenv import load_dotenv
+
+from src.cache.backends import CacheBackend, LRUCacheBackend, RedisCacheBackend
+
+load_dotenv()
+
+# Cache settings, read from .env / the environment
+# CACHE_BACKEND: "memory" (per-process LRU), "redis" (shared, needs REDIS_URL) or "none"
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+CACHE_TTL = float(os.getenv("CACHE_TTL", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+def project_key(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def task_key(task_id: int) -> str:
+    return f"task:{task_id}"
+
+
+class ReadThroughCache:
+    """
+    Read-through cache of serialized project and task payloads with hit/miss counters.
+    Reads go through get_or_load(); services invalidate the affected keys after they commit.
+    A project payload embeds its tasks, so every task write also invalidates its project.
+    """
+    def __init__(self, backend: Optional[CacheBackend], ttl: float = CACHE_TTL):
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Optional[Any]],
+        version: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Returns the cached value of `key`, or calls `loader` and caches its result (unless None).
+        When `version` is given (e.g. a freshly probed ETag), an entry stored under another
+        version counts as a miss, so the cache can never serve a payload older than the probe.
+        """
+        if self.backend is None:
+            return loader()
+
+        entry = self.backend.get(key)
+        if entry is not None and (version is None or entry[0] == version):
+            self._count(hit=True)
+            return entry[1]
+
+        self._count(hit=False)
+        value = loader()
+        if value is not None:
+            self.backend.set(key, (version, value), self.ttl)
+        return value
+
+    def invalidate(self, *keys: str) -> None:
+        if self.backend is not None and keys:
+            self.backend.delete(*keys)
+
+    def invalidate_project(self, project_id: int) -> None:
+        self.invalidate(project_key(project_id))
+
+    def invalidate_tasks(self, task_ids: Iterable[int], project_ids: Iterable[int]) -> None:
+        """Invalidates the given tasks together with the projects embedding them."""
+        keys = {task_key(task_id) for task_id in task_ids}
+        keys.update(project_key(project_id) for project_id in project_ids)
+        self.invalidate(*keys)
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats: Dict[str, Any] = {
+                "backend": CACHE_BACKEND if self.backend is not None else "none",
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+        if isinstance(self.backend, LRUCacheBackend):
+            stats.update(entries=len(self.backend), max_entries=self.backend.max_entries)
+        return stats
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+_cache: Optional[ReadThroughCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ReadThroughCache:
+    """Returns the process-wide cache, building its backend from CACHE_BACKEND on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                if CACHE_BACKEND == "memory":
+                    backend: Optional[CacheBackend] = LRUCacheBackend(CACHE_MAX_ENTRIES)
+                elif CACHE_BACKEND == "redis":
+                    backend = RedisCacheBackend(REDIS_URL)
+                elif CACHE_BACKEND == "none":
+                    backend = None
+                else:
+                    raise ValueError(f"Unknown CACHE_BACKEND {CACHE_BACKEND!r}; expected 'memory', 'redis' or 'none'")
+                _cache = ReadThroughCache(backend)
+    return _cache
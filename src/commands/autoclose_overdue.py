@@ -1,34 +1,116 @@
-from sqlalchemy.orm import Session
-from src.repositories.task_repository import TaskRepository
-from src.models.task import TaskStatus
+import os
+import random
+import time
+from typing import Collection, Optional
+from sqlalchemy.exc import DBAPIError
+from src.services.unit_of_work import UnitOfWork
+from src.repositories.change_repository import task_change
+from src.repositories.task_repository import utc_now
 from datetime import datetime
 
+# Number of tasks closed per UPDATE statement (and per committed transaction)
+DEFAULT_CHUNK_SIZE = int(os.getenv("AUTOCLOSE_CHUNK_SIZE", "1000"))
+
+# Retry policy: a chunk that fails with a transient error (serialization failure, deadlock,
+# lock timeout, a busy SQLite file) is rolled back and retried after an exponential backoff
+# with jitter, starting at AUTOCLOSE_RETRY_SECONDS; after AUTOCLOSE_MAX_RETRIES the error is raised.
+# Overdue tasks skipped because another transaction held them locked get the same number of
+# backoff sweeps before the run ends (the next run picks up whatever is still left).
+AUTOCLOSE_MAX_RETRIES = int(os.getenv("AUTOCLOSE_MAX_RETRIES", "5"))
+AUTOCLOSE_RETRY_SECONDS = float(os.getenv("AUTOCLOSE_RETRY_SECONDS", "0.1"))
+
+# serialization_failure, deadlock_detected, lock_not_available
+TRANSIENT_PGCODES = {"40001", "40P01", "55P03"}
+
+
+def is_transient(error: DBAPIError) -> bool:
+    """Whether retrying the transaction that raised `error` can succeed."""
+    if error.connection_invalidated:
+        return True
+    return getattr(error.orig, "pgcode", None) in TRANSIENT_PGCODES or "database is locked" in str(error.orig)
+
+
 class AutocloseOverdueTasksCommand:
     """
     Command to automatically close tasks that are past their deadline
     and still in 'todo' or 'doing' status.
     """
-    def __init__(self, task_repo: TaskRepository):
-        self.task_repo = task_repo
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        chunk_size: Optional[int] = None,
+        shards: Optional[Collection[int]] = None,
+        shard_count: int = 1,
+        shard_width: int = 1,
+        max_retries: int = AUTOCLOSE_MAX_RETRIES,
+        retry_seconds: float = AUTOCLOSE_RETRY_SECONDS,
+    ):
+        self.uow = uow
+        self.task_repo = uow.tasks
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        # Restricts the run to some project_id shards (see TaskRepository.close_overdue_chunk)
+        self.shards = shards
+        self.shard_count = shard_count
+        self.shard_width = shard_width
+        self.max_retries = max_retries
+        self.retry_seconds = retry_seconds
+        # Retries and lock sweeps taken by the last execute()
+        self.retries = 0
+
+    def _backoff(self, attempt: int) -> None:
+        time.sleep(self.retry_seconds * 2 ** attempt * random.uniform(0.5, 1.5))
+
+    def _close_chunk(self, now: datetime) -> int:
+        """Closes and commits one chunk, retrying it on transient errors. Returns the number of tasks closed."""
+        attempt = 0
+        while True:
+            try:
+                closed = self.task_repo.close_overdue_chunk(
+                    now=now,
+                    chunk_size=self.chunk_size,
+                    shards=self.shards,
+                    shard_count=self.shard_count,
+                    shard_width=self.shard_width,
+                )
+                self.uow.changes.record([task_change("autoclosed", row.project_id, row.id, row) for row in closed])
+                # Commit per chunk: releases the row locks and keeps transactions short
+                self.uow.commit()
+            except DBAPIError as e:
+                self.uow.rollback()
+                if attempt >= self.max_retries or not is_transient(e):
+                    raise
+                self._backoff(attempt)
+                attempt += 1
+                self.retries += 1
+                continue
+            self.uow.cache.invalidate_tasks((row.id for row in closed), {row.project_id for row in closed})
+            return len(closed)
 
     def execute(self) -> int:
         """
-        Finds overdue tasks and changes their status to DONE.
+        Closes overdue tasks in set-based chunks until no overdue task is left.
         Returns the number of tasks closed.
         """
         closed_count = 0
-        
-        # 1. Get all tasks that are overdue and not yet done (using repo query)
-        overdue_tasks = self.task_repo.get_overdue_and_open_tasks()
-
-        for task in overdue_tasks:
-            # 2. Update the task status and set closed_at timestamp
-            task.status = TaskStatus.DONE
-            task.closed_at = datetime.now()
-            
-            # Note: We are committing one by one inside the loop 
-            # for simplicity, but a single batch commit is often better for performance.
-            self.task_repo.db.commit() 
-            closed_count += 1
-            
+        sweeps = 0
+        self.retries = 0
+        # A fixed cut-off keeps the loop finite while new tasks become overdue
+        now = utc_now()
+
+        while True:
+            closed = self._close_chunk(now)
+            closed_count += closed
+
+            if closed < self.chunk_size:
+                # A short chunk means the backlog is drained, or the rest is locked: by another
+                # replica (which closes it) or by a task update in flight (which may leave it open)
+                if sweeps >= self.max_retries or not self.task_repo.has_overdue(
+                    now, shards=self.shards, shard_count=self.shard_count, shard_width=self.shard_width
+                ):
+                    break
+                self.uow.rollback()
+                self._backoff(sweeps)
+                sweeps += 1
+                self.retries += 1
+
         return closed_count
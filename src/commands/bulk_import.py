@@ -0,0 +1,214 @@
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from src.repositories.import_repository import STAGING, ImportRepository
+from src.repositories.task_repository import RELOAD_DEADLINES, normalize_deadline
+from src.schemas import ProjectCreate, TaskBatchCreateItem
+from src.services.unit_of_work import UnitOfWork
+
+# Rows validated and COPY'd per batch; bounds memory regardless of input size
+DEFAULT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "10000"))
+# Rejected rows listed individually in the report (all of them are counted)
+MAX_REPORTED_ERRORS = 1000
+
+# Input rows are validated against the same schemas as the API
+SCHEMAS: Dict[str, Type[BaseModel]] = {
+    "projects": ProjectCreate,
+    "tasks": TaskBatchCreateItem,
+}
+
+
+class BulkImportCommand:
+    """
+    Command to load projects or tasks from a CSV or NDJSON stream.
+    Rows are validated in batches, streamed into a staging table with COPY and merged
+    into the target table with one set-based INSERT, all in a single transaction.
+    """
+    def __init__(self, uow: UnitOfWork, kind: str, batch_size: Optional[int] = None):
+        if kind not in STAGING:
+            raise ValueError(f"Unknown import kind {kind!r}; expected one of {sorted(STAGING)}.")
+        if uow.session.get_bind().dialect.name != "postgresql":
+            raise ValueError("Bulk import uses COPY and requires PostgreSQL.")
+        self.uow = uow
+        self.import_repo = ImportRepository(uow.session)
+        self.kind = kind
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+        self.schema = SCHEMAS[kind]
+        self.adapter = TypeAdapter(List[self.schema])
+        self.columns = STAGING[kind]["columns"][1:]
+
+    def execute(self, stream: TextIO, format: str) -> Dict[str, Any]:
+        """
+        Imports every row of `stream` ("csv" with a header row, or "ndjson").
+        Returns a report with the imported and rejected counts, the first rejected
+        rows with their line numbers and the throughput.
+        """
+        started = time.perf_counter()
+        received = 0
+        rejected = 0
+        errors: List[Dict[str, Any]] = []
+
+        self.import_repo.create_staging(self.kind)
+        for batch, parse_errors in self._batches(self._read(stream, format)):
+            received += len(batch) + len(parse_errors)
+            valid, batch_errors = self._validate(batch)
+            batch_errors = parse_errors + batch_errors
+            rejected += len(batch_errors)
+            errors.extend(batch_errors[:MAX_REPORTED_ERRORS - len(errors)])
+            if valid:
+                self.import_repo.copy_batch(self.kind, self._to_csv(valid))
+
+        orphan_count, orphans = self.import_repo.get_orphans(self.kind, MAX_REPORTED_ERRORS - len(errors))
+        # The merge appends to the changes log itself; the entries are published after the commit
+        imported = self.import_repo.merge(self.kind)
+        if imported:
+            self.uow.changes.mark_unpublished()
+        if self.kind == "tasks" and imported:
+            # Imported deadlines reach the deadline scheduler through one reload
+            self.uow.tasks.notify_deadlines([RELOAD_DEADLINES])
+        self.uow.commit()
+        rejected += orphan_count
+        errors = sorted(errors + orphans, key=lambda error: error["line"])
+
+        seconds = time.perf_counter() - started
+        return {
+            "kind": self.kind,
+            "received": received,
+            "imported": imported,
+            "rejected": rejected,
+            "errors": errors,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(received / seconds) if seconds else 0,
+        }
+
+    # ------------------ Parsing and validation ------------------
+
+    @staticmethod
+    def _read(stream: TextIO, format: str) -> Iterator[Tuple[int, Any]]:
+        """Yields (line number, raw row) pairs; a raw row is a dict, or an error message string."""
+        if format == "csv":
+            reader = csv.DictReader(stream)
+            for row in reader:
+                # An empty CSV field means "not set", as for optional JSON fields
+                yield reader.line_num, {key: (value if value != "" else None) for key, value in row.items()}
+        elif format == "ndjson":
+            for line_number, line in enumerate(stream, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, f"Invalid JSON: {e.msg}"
+        else:
+            raise ValueError(f"Unknown import format {format!r}; expected 'csv' or 'ndjson'.")
+
+    def _batches(self, rows: Iterator[Tuple[int, Any]]) -> Iterator[Tuple[List[Tuple[int, Dict[str, Any]]], List[Dict[str, Any]]]]:
+        """Groups raw rows into batches of parsed rows plus the parse errors met along the way."""
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        errors: List[Dict[str, Any]] = []
+        for line, raw in rows:
+            if isinstance(raw, dict):
+                batch.append((line, raw))
+            else:
+                errors.append({"line": line, "error": raw if isinstance(raw, str) else "Row must be a JSON object."})
+            if len(batch) >= self.batch_size:
+                yield batch, errors
+                batch, errors = [], []
+        if batch or errors:
+            yield batch, errors
+
+    def _validate(self, batch: List[Tuple[int, Dict[str, Any]]]) -> Tuple[List[Tuple[int, BaseModel]], List[Dict[str, Any]]]:
+        """
+        Validates a whole batch with one TypeAdapter call. When some rows fail, they are
+        reported by line and the remaining rows are validated again, still in one call.
+        """
+        raw_rows = [raw for _, raw in batch]
+        try:
+            items = self.adapter.validate_python(raw_rows)
+            return self._apply_rules(list(zip((line for line, _ in batch), items)))
+        except ValidationError as e:
+            messages: Dict[int, List[str]] = {}
+            for error in e.errors():
+                index, *location = error["loc"]
+                messages.setdefault(index, []).append(f"{'.'.join(map(str, location))}: {error['msg']}")
+
+        errors = [
+            {"line": batch[index][0], "error": "; ".join(parts)}
+            for index, parts in sorted(messages.items())
+        ]
+        remaining = [entry for index, entry in enumerate(batch) if index not in messages]
+        items = self.adapter.validate_python([raw for _, raw in remaining])
+        valid, rule_errors = self._apply_rules(list(zip((line for line, _ in remaining), items)))
+        return valid, errors + rule_errors
+
+    def _apply_rules(self, items: List[Tuple[int, BaseModel]]) -> Tuple[List[Tuple[int, BaseModel]], List[Dict[str, Any]]]:
+        """Applies the business rules the services enforce on single creates."""
+        if self.kind != "projects":
+            return items, []
+        valid, errors = [], []
+        for line, item in items:
+            # Same rule as ProjectService.create_project
+            if len(item.name.split()) > 10:
+                errors.append({"line": line, "error": "Project name must be <= 10 words."})
+            else:
+                valid.append((line, item))
+        return valid, errors
+
+    def _to_csv(self, items: List[Tuple[int, BaseModel]]) -> io.StringIO:
+        """
+        Writes validated rows in COPY's CSV format: strings are always quoted so an empty
+        string stays empty, while None becomes an unquoted empty field, which COPY reads as NULL.
+        """
+        buffer = io.StringIO()
+        for line, item in items:
+            fields = [str(line)] + [_csv_field(getattr(item, column)) for column in self.columns]
+            buffer.write(",".join(fields) + "\n")
+        buffer.seek(0)
+        return buffer
+
+
+def _csv_field(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, datetime):
+        # The columns are naive UTC timestamps; an offset would be dropped, not converted
+        value = normalize_deadline(value).isoformat()
+    elif hasattr(value, "isoformat"):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.commands.bulk_import tasks tasks.csv --format csv
+    parser = argparse.ArgumentParser(description="Bulk import projects or tasks with PostgreSQL COPY.")
+    parser.add_argument("kind", choices=sorted(STAGING))
+    parser.add_argument("path", help="Input file, or - for stdin")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+
+    stream = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8-sig", newline="")
+    try:
+        with UnitOfWork() as uow:
+            report = BulkImportCommand(uow, args.kind, batch_size=args.batch_size).execute(stream, args.format)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    print(
+        f"Imported {report['imported']} of {report['received']} {args.kind} "
+        f"in {report['seconds']}s ({report['rows_per_second']} rows/s); {report['rejected']} rejected."
+    )
+    for error in report["errors"]:
+        print(f"  line {error['line']}: {error['error']}")
@@ -0,0 +1,172 @@
+import argparse
+import os
+import sys
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from sqlalchemy import event, func, select, text
+
+from src.db.session import IS_POSTGRES
+from src.models.task import Task, TaskStatus
+from src.repositories.change_repository import ChangeRepository
+from src.repositories.project_repository import ProjectRepository
+from src.repositories.stats_repository import StatsRepository
+from src.repositories.task_repository import TaskRepository, utc_now
+from src.services.unit_of_work import UnitOfWork
+
+# Sequential scans over tables with at least this many (estimated) rows are flagged
+EXPLAIN_MIN_ROWS = int(os.getenv("EXPLAIN_MIN_ROWS", "10000"))
+
+# (name, call) of every repository query; each call gets the uncached repositories and a sample
+# project / task picked from the data. Writes are explained too: everything is rolled back.
+RepositoryCall = Callable[[Dict[str, Any], Dict[str, Any]], Any]
+QUERIES: List[Tuple[str, RepositoryCall]] = [
+    ("task.get_by_project", lambda r, s: r["tasks"].get_by_project(s["project_id"])),
+    ("task.get_page_by_project", lambda r, s: r["tasks"].get_page_by_project(s["project_id"], after_id=s["task_id"], limit=50)),
+    ("task.get_page_by_project[status]", lambda r, s: r["tasks"].get_page_by_project(
+        s["project_id"], limit=50, statuses=[TaskStatus.TODO, TaskStatus.DOING])),
+    ("task.get_page_by_project[deadline]", lambda r, s: r["tasks"].get_page_by_project(
+        s["project_id"], limit=50, deadline_from=s["now"] - timedelta(days=30), deadline_to=s["now"])),
+    ("task.search", lambda r, s: r["tasks"].search("task", limit=50)),
+    ("task.stream_by_project", lambda r, s: [len(batch) for batch in r["tasks"].stream_by_project(s["project_id"])]),
+    ("task.get_validators", lambda r, s: r["tasks"].get_validators(s["project_id"], s["task_id"])),
+    ("task.get_by_id", lambda r, s: r["tasks"].get_by_id(s["project_id"], s["task_id"])),
+    ("task.update", lambda r, s: r["tasks"].update(
+        r["tasks"].get_by_id(s["project_id"], s["task_id"]), "explain", None, None, TaskStatus.DOING, None)),
+    ("task.update_if_version", lambda r, s: r["tasks"].update_if_version(
+        s["project_id"], s["task_id"], r["tasks"].get_current(s["project_id"], s["task_id"]).version, {"title": "explain"})),
+    ("task.get_upcoming_deadlines", lambda r, s: r["tasks"].get_upcoming_deadlines(s["now"] + timedelta(hours=1), limit=1000)),
+    ("task.close_overdue_chunk", lambda r, s: r["tasks"].close_overdue_chunk(s["now"], chunk_size=1000)),
+    ("task.has_overdue", lambda r, s: r["tasks"].has_overdue(s["now"])),
+    ("task.get_many", lambda r, s: r["tasks"].get_many(range(s["task_id"], s["task_id"] + 100))),
+    ("project.get_summaries", lambda r, s: r["projects"].get_summaries(s["now"], limit=100)),
+    ("project.get_page_with_tasks", lambda r, s: r["projects"].get_page_with_tasks(limit=20)),
+    ("project.search_by_name", lambda r, s: r["projects"].search_by_name("pro", limit=20)),
+    ("project.get_validators", lambda r, s: r["projects"].get_validators(s["project_id"])),
+    ("project.get_by_id", lambda r, s: r["projects"].get_by_id(s["project_id"])),
+    ("stats.get_project_stats", lambda r, s: r["stats"].get_project_stats(s["project_id"], s["now"])),
+    ("stats.get_rollup", lambda r, s: r["stats"].get_rollup(s["now"])),
+    ("changes.get_last_seq", lambda r, s: r["changes"].get_last_seq()),
+    ("changes.get_since", lambda r, s: r["changes"].get_since(0, project_id=s["project_id"], limit=1000)),
+]
+
+# Full scans that are the point of the query, not a missing index
+EXPECTED_SEQ_SCANS: Dict[str, Set[str]] = {
+    "stats.get_rollup": {"projects", "project_stats"},
+}
+
+
+def _walk(plan: Dict[str, Any]):
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from _walk(child)
+
+
+class ExplainRepositoryQueriesCommand:
+    """
+    Command to run EXPLAIN (ANALYZE, BUFFERS) on every SQL statement issued by the repository
+    queries in QUERIES and flag sequential scans over large tables: a query-plan regression
+    check to run after schema or query changes, against a database holding realistic data.
+    Each query runs in its own transaction, which is rolled back together with its EXPLAINs,
+    so writes (EXPLAIN ANALYZE executes them) leave no trace. Postgres only.
+    """
+    def __init__(self, uow: UnitOfWork, min_rows: int = EXPLAIN_MIN_ROWS):
+        self.uow = uow
+        self.min_rows = min_rows
+
+    def _sample(self) -> Dict[str, Any]:
+        # The project with the most tasks: the plan that matters is the one for large projects
+        row = self.uow.session.execute(
+            select(Task.project_id, func.min(Task.id).label("task_id"))
+            .group_by(Task.project_id)
+            .order_by(func.count().desc())
+            .limit(1)
+        ).first()
+        if row is None:
+            raise ValueError("The tasks table is empty; load some data before explaining the queries.")
+        return {"project_id": row.project_id, "task_id": row.task_id, "now": utc_now()}
+
+    def _table_rows(self) -> Dict[str, float]:
+        return dict(self.uow.session.execute(
+            text("SELECT relname, reltuples FROM pg_class WHERE relkind = 'r' AND relnamespace = 'public'::regnamespace")
+        ).all())
+
+    def _explain(self, name: str, call: RepositoryCall, sample: Dict[str, Any], table_rows: Dict[str, float]) -> List[Dict[str, Any]]:
+        session = self.uow.session
+        repositories = {
+            "tasks": TaskRepository(session),
+            "projects": ProjectRepository(session),
+            "stats": StatsRepository(session),
+            "changes": ChangeRepository(session),
+        }
+        connection = session.connection()
+        statements: List[Tuple[str, Any]] = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "INSERT", "WITH")):
+                statements.append((statement, parameters))
+
+        event.listen(connection, "before_cursor_execute", capture)
+        try:
+            call(repositories, sample)
+            session.flush()
+        finally:
+            event.remove(connection, "before_cursor_execute", capture)
+
+        reports = []
+        for statement, parameters in statements:
+            plan = connection.exec_driver_sql(
+                f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+            ).scalar()[0]
+            seq_scans = sorted({
+                node["Relation Name"] for node in _walk(plan["Plan"])
+                if node["Node Type"] == "Seq Scan" and table_rows.get(node["Relation Name"], 0) >= self.min_rows
+            } - EXPECTED_SEQ_SCANS.get(name, set()))
+            reports.append({
+                "query": name,
+                "statement": " ".join(statement.split()),
+                "execution_ms": plan.get("Execution Time"),
+                "shared_hit": plan["Plan"].get("Shared Hit Blocks", 0),
+                "shared_read": plan["Plan"].get("Shared Read Blocks", 0),
+                "seq_scans": seq_scans,
+            })
+        self.uow.rollback()
+        return reports
+
+    def execute(self) -> List[Dict[str, Any]]:
+        """Explains every repository query; returns one report per SQL statement, in QUERIES order."""
+        if not IS_POSTGRES:
+            raise ValueError("Query plans are only checked on Postgres.")
+        sample = self._sample()
+        table_rows = self._table_rows()
+        self.uow.rollback()
+
+        reports = []
+        for name, call in QUERIES:
+            reports.extend(self._explain(name, call, sample, table_rows))
+        return reports
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.commands.explain_queries --min-rows 10000 [--verbose]
+    parser = argparse.ArgumentParser(description="EXPLAIN ANALYZE every repository query and flag sequential scans over large tables.")
+    parser.add_argument("--min-rows", type=int, default=EXPLAIN_MIN_ROWS)
+    parser.add_argument("--verbose", action="store_true", help="Also print the statements")
+    args = parser.parse_args()
+
+    try:
+        with UnitOfWork() as uow:
+            reports = ExplainRepositoryQueriesCommand(uow, min_rows=args.min_rows).execute()
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    flagged = [report for report in reports if report["seq_scans"]]
+    for report in reports:
+        mark = "SEQ SCAN " + ", ".join(report["seq_scans"]) if report["seq_scans"] else "ok"
+        print(f"{report['query']:<40}{report['execution_ms'] or 0:>10.2f} ms  hit={report['shared_hit']:<8} read={report['shared_read']:<8} {mark}")
+        if args.verbose or report["seq_scans"]:
+            print(f"    {report['statement']}")
+    if flagged:
+        print(f"\n{len(flagged)} statement(s) scan a table of {args.min_rows}+ rows sequentially.")
+        sys.exit(1)
+    print(f"\nNo sequential scans over tables of {args.min_rows}+ rows.")
@@ -0,0 +1,60 @@
+import argparse
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from src.services.unit_of_work import UnitOfWork
+
+# Entries younger than this are never pruned; cursors older than it may have to resync
+CHANGES_RETENTION_DAYS = float(os.getenv("CHANGES_RETENTION_DAYS", "30"))
+# Seqs compacted per transaction; bounds how long a single DELETE runs
+DEFAULT_BATCH_SIZE = int(os.getenv("CHANGES_PRUNE_BATCH_SIZE", "10000"))
+
+
+class PruneChangesCommand:
+    """
+    Command to compact the changes log, e.g. from a daily cron job.
+    Everything appended before the retention window is compacted: tombstones and superseded
+    entries go, the latest entry of every live entity stays (see ChangeRepository.prune_range).
+    The horizon is committed before anything is deleted, so a reader either gets all the
+    entries it asked for or learns that it has to resync.
+    """
+    def __init__(self, uow: UnitOfWork, retention_days: Optional[float] = None, batch_size: Optional[int] = None):
+        self.uow = uow
+        self.retention = timedelta(days=CHANGES_RETENTION_DAYS if retention_days is None else retention_days)
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+
+    def execute(self) -> Dict[str, Any]:
+        """Compacts the log up to the retention horizon. Returns the horizon, the entries deleted and the time taken."""
+        started = time.perf_counter()
+        changes = self.uow.changes
+        # created_at is a naive UTC timestamp
+        before = datetime.now(timezone.utc).replace(tzinfo=None) - self.retention
+        horizon = max(changes.get_prune_horizon(before), changes.get_pruned_through())
+        first_seq = changes.get_first_seq()
+        changes.advance_pruned_through(horizon)
+        self.uow.commit()
+
+        deleted = 0
+        # Starts from the oldest entry: entries kept by an earlier run may be superseded by now
+        for range_start in range(max(first_seq, 1), horizon + 1, self.batch_size):
+            deleted += changes.prune_range(range_start, min(range_start + self.batch_size - 1, horizon))
+            self.uow.commit()
+
+        return {"pruned_through": horizon, "deleted": deleted, "seconds": round(time.perf_counter() - started, 3)}
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.commands.prune_changes --retention-days 30
+    parser = argparse.ArgumentParser(description="Compact the changes log past the retention window.")
+    parser.add_argument("--retention-days", type=float, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+
+    with UnitOfWork() as uow:
+        report = PruneChangesCommand(uow, retention_days=args.retention_days, batch_size=args.batch_size).execute()
+    print(
+        f"Pruned the changes log through seq {report['pruned_through']}: "
+        f"{report['deleted']} entries deleted in {report['seconds']}s."
+    )
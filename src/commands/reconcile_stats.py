@@ -0,0 +1,48 @@
+import argparse
+import os
+import time
+from typing import Any, Dict, Optional
+
+from src.repositories.stats_repository import StatsRepository
+from src.services.unit_of_work import UnitOfWork
+
+# Projects rebuilt per transaction; bounds how long counter rows stay locked
+DEFAULT_BATCH_SIZE = int(os.getenv("STATS_RECONCILE_BATCH_SIZE", "1000"))
+
+
+class ReconcileProjectStatsCommand:
+    """
+    Command to rebuild the project_stats counters from the tasks table, e.g. after
+    restoring a backup or disabling the triggers for maintenance.
+    Projects are rebuilt in ID ranges, one short transaction each, while the API keeps
+    writing; see StatsRepository.rebuild_range for why concurrent writes are not lost.
+    """
+    def __init__(self, uow: UnitOfWork, batch_size: Optional[int] = None):
+        self.uow = uow
+        self.stats_repo = StatsRepository(uow.session)
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+
+    def execute(self) -> Dict[str, Any]:
+        """Rebuilds the counters of every project. Returns the number of projects rebuilt and the time taken."""
+        started = time.perf_counter()
+        rebuilt = 0
+        max_id = self.stats_repo.get_max_project_id()
+        self.uow.commit()
+
+        for first_id in range(1, max_id + 1, self.batch_size):
+            rebuilt += self.stats_repo.rebuild_range(first_id, first_id + self.batch_size - 1)
+            # Commit per range: releases the counter row locks
+            self.uow.commit()
+
+        return {"projects": rebuilt, "seconds": round(time.perf_counter() - started, 3)}
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.commands.reconcile_stats --batch-size 1000
+    parser = argparse.ArgumentParser(description="Rebuild the project_stats counters from the tasks table.")
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+
+    with UnitOfWork() as uow:
+        report = ReconcileProjectStatsCommand(uow, batch_size=args.batch_size).execute()
+    print(f"Rebuilt the counters of {report['projects']} projects in {report['seconds']}s.")
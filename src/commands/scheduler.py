@@ -1,36 +1,196 @@
-import schedule
+import heapq
+import os
+import select
 import time
-from sqlalchemy.orm import Session
-from src.db.session import SessionLocal
-from src.repositories.task_repository import TaskRepository
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+from src.db.pool import DB_POOL_MODE
+from src.db.session import IS_POSTGRES, connect_direct
+from src.services.unit_of_work import UnitOfWork
 from src.commands.autoclose_overdue import AutocloseOverdueTasksCommand
+from src.repositories.task_repository import DEADLINE_CHANNEL, parse_deadline_payload, utc_now
+
+if TYPE_CHECKING:
+    # Annotations only; the driver is imported at runtime by the NOTIFY mode alone
+    import psycopg2
+
+# How far ahead deadlines are loaded into memory, and how many at most
+SCHEDULER_HORIZON = timedelta(seconds=int(os.getenv("SCHEDULER_HORIZON_SECONDS", "3600")))
+SCHEDULER_MAX_LOADED = int(os.getenv("SCHEDULER_MAX_LOADED", "10000"))
+# LISTEN needs a session-level Postgres connection, which pgbouncer in transaction mode (or SQLite)
+# cannot provide; without it the scheduler polls the deadline index every SCHEDULER_POLL_SECONDS instead
+SCHEDULER_USE_NOTIFY = os.getenv(
+    "SCHEDULER_USE_NOTIFY", "true" if IS_POSTGRES and DB_POOL_MODE != "pgbouncer" else "false"
+).lower() in ("1", "true", "yes")
+SCHEDULER_POLL_SECONDS = float(os.getenv("SCHEDULER_POLL_SECONDS", "5"))
+
+
+def log(message: str) -> None:
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
 
 # Function that runs the command
-def run_autoclose_command():
-    # 💡 A new session is created for each scheduled run
-    db: Session = SessionLocal() 
-    try:
-        task_repo = TaskRepository(db)
-        command = AutocloseOverdueTasksCommand(task_repo)
-        
-        count = command.execute()
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Auto-closed {count} overdue tasks.")
-    except Exception as e:
-        db.rollback()
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR during autoclose: {e}")
-    finally:
-        db.close()
+def run_autoclose_command() -> int:
+    # 💡 A new unit of work is created for each run
+    with UnitOfWork() as uow:
+        try:
+            command = AutocloseOverdueTasksCommand(uow)
+            
+            count = command.execute()
+            log(f"Auto-closed {count} overdue tasks.")
+            return count
+        except Exception as e:
+            uow.rollback()
+            log(f"ERROR during autoclose: {e}")
+            return 0
+
+
+class DeadlineScheduler:
+    """
+    Closes overdue tasks as their deadlines pass, instead of scanning on a fixed interval.
+    Upcoming deadlines (within the horizon) are kept in a min-heap loaded from the partial
+    index ix_tasks_open_deadline; the scheduler sleeps until the earliest one and runs the
+    autoclose command when it is due. New deadlines arrive through LISTEN/NOTIFY from the
+    task write paths, or through periodic reloads when notifications are unavailable.
+    Heap entries are only wake-up hints: a task updated or closed in the meantime simply
+    makes the autoclose run a no-op.
+
+    `on_due` replaces the autoclose run (e.g. with a sharded one), and `on_tick` is called
+    at least every `tick_seconds` for periodic housekeeping.
+    """
+    def __init__(
+        self,
+        use_notify: bool = SCHEDULER_USE_NOTIFY,
+        horizon: timedelta = SCHEDULER_HORIZON,
+        max_loaded: int = SCHEDULER_MAX_LOADED,
+        poll_seconds: float = SCHEDULER_POLL_SECONDS,
+        on_due: Callable[[], object] = run_autoclose_command,
+        on_tick: Optional[Callable[[], None]] = None,
+        tick_seconds: float = 10.0,
+    ):
+        self.use_notify = use_notify
+        self.on_due = on_due
+        self.on_tick = on_tick
+        self.tick_seconds = tick_seconds
+        self.next_tick = 0.0
+        self.horizon = horizon
+        self.max_loaded = max_loaded
+        self.poll_seconds = poll_seconds
+        self.heap: List[Tuple[datetime, int]] = []
+        # Deadlines before this moment are all in the heap; later ones wait for the next reload
+        self.loaded_until = datetime.min
+        self.connection: Optional["psycopg2.extensions.connection"] = None
+
+    def reload(self) -> None:
+        """Reloads the heap with the open deadlines of the next horizon."""
+        now = utc_now()
+        with UnitOfWork() as uow:
+            rows = uow.tasks.get_upcoming_deadlines(until=now + self.horizon, limit=self.max_loaded)
+        self.heap = [(row.deadline, row.id) for row in rows]
+        heapq.heapify(self.heap)
+        # When the limit cut the window short, it ends at the last deadline loaded
+        self.loaded_until = rows[-1].deadline if len(rows) >= self.max_loaded else now + self.horizon
+
+    def push(self, deadline: datetime, task_id: int) -> None:
+        if deadline < self.loaded_until:
+            heapq.heappush(self.heap, (deadline, task_id))
+
+    def run_due(self) -> None:
+        """Runs the autoclose command once if at least one loaded deadline has passed."""
+        now = utc_now()
+        if not self.heap or self.heap[0][0] > now:
+            return
+        while self.heap and self.heap[0][0] <= now:
+            heapq.heappop(self.heap)
+        # One set-based run closes every overdue task, including those due at the same moment
+        self.on_due()
+
+    def seconds_until_next_event(self) -> float:
+        """Seconds until the earliest loaded deadline, or until the loaded window runs out."""
+        next_event = self.loaded_until
+        if self.heap:
+            next_event = min(next_event, self.heap[0][0])
+        seconds = (next_event - utc_now()).total_seconds()
+        if self.on_tick is not None:
+            seconds = min(seconds, self.next_tick - time.monotonic())
+        # Small floor so clock skew against the database cannot cause a busy loop
+        return max(seconds, 0.05)
+
+    def tick(self) -> None:
+        if self.on_tick is not None and time.monotonic() >= self.next_tick:
+            self.on_tick()
+            self.next_tick = time.monotonic() + self.tick_seconds
+
+    def run_forever(self) -> None:
+        self.tick()
+        # Catch up on everything that became overdue while no scheduler was running
+        self.on_due()
+        self.reload()
+        mode = "LISTEN/NOTIFY" if self.use_notify else f"polling every {self.poll_seconds}s"
+        log(f"Deadline scheduler started ({mode}); {len(self.heap)} deadlines loaded.")
+
+        while True:
+            self.tick()
+            self.run_due()
+            if utc_now() >= self.loaded_until:
+                self.reload()
+
+            timeout = self.seconds_until_next_event()
+            if self.use_notify:
+                self.wait_for_notifications(timeout)
+            else:
+                time.sleep(min(timeout, self.poll_seconds))
+                # Polling fallback: one cheap range scan of the partial index
+                self.reload()
+
+    def wait_for_notifications(self, timeout: float) -> None:
+        """Blocks until a deadline notification arrives or `timeout` seconds pass."""
+        # Only the NOTIFY mode needs the driver module; SQLite deployments never load it
+        import psycopg2
+
+        try:
+            if self.connection is None:
+                self.connection = self._listen()
+                # Notifications sent while no connection was listening are lost
+                self.reload()
+            if select.select([self.connection], [], [], timeout) == ([], [], []):
+                return
+            self.connection.poll()
+        except psycopg2.Error as e:
+            log(f"ERROR on the notification connection, reconnecting: {e}")
+            self._close()
+            time.sleep(min(timeout, self.poll_seconds))
+            return
+
+        reload = False
+        for notification in self.connection.notifies:
+            entry = parse_deadline_payload(notification.payload)
+            if entry is None:
+                reload = True
+            else:
+                self.push(*entry)
+        self.connection.notifies.clear()
+        if reload:
+            self.reload()
+
+    def _listen(self) -> "psycopg2.extensions.connection":
+        connection = connect_direct()
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {DEADLINE_CHANNEL}")
+        return connection
+
+    def _close(self) -> None:
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            finally:
+                self.connection = None
+
 
 def start_scheduler():
-    # Schedule the command to run every 1 minute
-    schedule.every(1).minutes.do(run_autoclose_command)
-    print("Scheduler started. Overdue task check runs every 1 minute.")
-    
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+    DeadlineScheduler().run_forever()
 
 if __name__ == "__main__":
     # To run this standalone, you can execute this file directly: 
-    # python src/commands/scheduler.py 
+    # python -m src.commands.scheduler
     start_scheduler()
@@ -0,0 +1,196 @@
+import json
+import math
+import os
+import time
+from typing import Collection, Optional, Set
+
+import psycopg2
+
+from src.services.unit_of_work import UnitOfWork
+from src.commands.autoclose_overdue import AutocloseOverdueTasksCommand
+from src.db.session import IS_POSTGRES, connect_direct
+from src.commands.scheduler import DeadlineScheduler, log
+
+# Projects are cut into ranges of WORKER_SHARD_WIDTH IDs, dealt round-robin over WORKER_SHARDS
+# shards: shard = (project_id // width) % shards. Neighbouring projects stay together while the
+# shards stay balanced as new projects are added. The shard count bounds the useful number of workers.
+WORKER_SHARDS = int(os.getenv("WORKER_SHARDS", "64"))
+WORKER_SHARD_WIDTH = int(os.getenv("WORKER_SHARD_WIDTH", "1000"))
+# Upper bound of concurrently running workers (membership slots)
+WORKER_MAX_WORKERS = int(os.getenv("WORKER_MAX_WORKERS", "64"))
+# How often shard ownership is rebalanced; also how long a dead worker's shards can stay unowned
+WORKER_REBALANCE_SECONDS = float(os.getenv("WORKER_REBALANCE_SECONDS", "10"))
+
+# Advisory lock namespaces (first key of pg_try_advisory_lock(int, int))
+LEADER_LOCK = 0x7A51
+SHARD_LOCK = 0x7A52
+MEMBER_LOCK = 0x7A53
+
+# Advisory locks held by any session of this database in one namespace
+HELD_LOCKS_SQL = """
+    SELECT objid::int FROM pg_locks
+    WHERE locktype = 'advisory' AND granted AND objsubid = 2
+      AND database = (SELECT oid FROM pg_database WHERE datname = current_database())
+      AND classid = %s::oid
+"""
+
+
+class Worker:
+    """
+    One of N interchangeable autoclose workers; any number of them can run at once.
+    Coordination uses session-level advisory locks on a dedicated connection, so everything
+    a worker holds is released by Postgres as soon as its connection goes away, including
+    when the process is killed:
+      - each worker holds a membership slot, which tells the others how many are alive;
+      - shards are claimed with one lock each, every worker taking its fair share;
+      - one worker also holds the leader lock and closes the tasks of shards nobody owns,
+        so a dead worker's shards are covered until the next rebalance hands them out.
+    Autoclose runs commit per chunk and pick rows with FOR UPDATE SKIP LOCKED, so a run
+    interrupted mid-way leaves only committed chunks behind, and two workers briefly
+    covering the same shard never close a task twice.
+    """
+    def __init__(
+        self,
+        shard_count: int = WORKER_SHARDS,
+        shard_width: int = WORKER_SHARD_WIDTH,
+        max_workers: int = WORKER_MAX_WORKERS,
+    ):
+        self.shard_count = shard_count
+        self.shard_width = shard_width
+        self.max_workers = max_workers
+        self.connection: Optional[psycopg2.extensions.connection] = None
+        self.slot: Optional[int] = None
+        self.owned: Set[int] = set()
+        self.orphans: Set[int] = set()
+        self.is_leader = False
+
+    def rebalance(self) -> None:
+        """
+        Converges on a fair share of ceil(shards / live workers), renews leadership and,
+        as leader, looks up unowned shards. Newly covered shards are caught up right away,
+        since their overdue tasks may have been left behind by a dead worker.
+        """
+        try:
+            if self.connection is None and not self._join():
+                return
+            fair_share = math.ceil(self.shard_count / max(len(self._held(MEMBER_LOCK)), 1))
+
+            # Give back the highest shards first, for other workers to pick up
+            for shard in sorted(self.owned, reverse=True)[:max(len(self.owned) - fair_share, 0)]:
+                self._unlock(SHARD_LOCK, shard)
+                self.owned.discard(shard)
+            gained: Set[int] = set()
+            for shard in range(self.shard_count):
+                if len(self.owned) >= fair_share:
+                    break
+                if shard not in self.owned and self._try_lock(SHARD_LOCK, shard):
+                    self.owned.add(shard)
+                    gained.add(shard)
+
+            if not self.is_leader:
+                self.is_leader = self._try_lock(LEADER_LOCK, 0)
+            previous_orphans = self.orphans
+            self.orphans = set(range(self.shard_count)) - self._held(SHARD_LOCK) if self.is_leader else set()
+            gained |= self.orphans - previous_orphans
+        except psycopg2.Error as e:
+            log(f"ERROR on the coordination connection, dropping all shards: {e}")
+            self._close()
+            return
+
+        if gained:
+            self.run_autoclose(gained)
+
+    def run_autoclose(self, shards: Optional[Collection[int]] = None) -> int:
+        """Closes the overdue tasks of `shards` (by default every shard covered) and emits the run's metrics."""
+        if shards is None:
+            shards = self.owned | self.orphans
+        if not shards:
+            return 0
+
+        started = time.perf_counter()
+        error = None
+        count = 0
+        with UnitOfWork() as uow:
+            try:
+                count = AutocloseOverdueTasksCommand(
+                    uow,
+                    shards=sorted(shards),
+                    shard_count=self.shard_count,
+                    shard_width=self.shard_width,
+                ).execute()
+            except Exception as e:
+                uow.rollback()
+                error = str(e)
+
+        # One JSON line per run, for log-based metrics
+        log(json.dumps({
+            "event": "autoclose_run",
+            "worker": self.slot,
+            "leader": self.is_leader,
+            "shards": len(shards),
+            "rows": count,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+            "error": error,
+        }))
+        return count
+
+    def run_forever(self) -> None:
+        scheduler = DeadlineScheduler(
+            on_due=self.run_autoclose,
+            on_tick=self.rebalance,
+            tick_seconds=WORKER_REBALANCE_SECONDS,
+        )
+        try:
+            scheduler.run_forever()
+        finally:
+            # Releases every lock at once instead of waiting for Postgres to notice
+            self._close()
+
+    # ------------------ Advisory locks ------------------
+
+    def _join(self) -> bool:
+        """Opens the coordination connection and takes a free membership slot."""
+        self.connection = connect_direct()
+        for slot in range(self.max_workers):
+            if self._try_lock(MEMBER_LOCK, slot):
+                self.slot = slot
+                log(f"Worker joined in slot {slot}.")
+                return True
+        log(f"ERROR: all {self.max_workers} worker slots are taken; raise WORKER_MAX_WORKERS.")
+        self._close()
+        return False
+
+    def _try_lock(self, namespace: int, key: int) -> bool:
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s, %s)", (namespace, key))
+            return cursor.fetchone()[0]
+
+    def _unlock(self, namespace: int, key: int) -> None:
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s, %s)", (namespace, key))
+
+    def _held(self, namespace: int) -> Set[int]:
+        with self.connection.cursor() as cursor:
+            cursor.execute(HELD_LOCKS_SQL, (namespace,))
+            return {row[0] for row in cursor.fetchall()}
+
+    def _close(self) -> None:
+        self.owned.clear()
+        self.orphans.clear()
+        self.is_leader = False
+        self.slot = None
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            finally:
+                self.connection = None
+
+
+def start_worker():
+    if not IS_POSTGRES:
+        raise SystemExit("Workers coordinate through Postgres advisory locks; run src.commands.scheduler instead.")
+    Worker().run_forever()
+
+if __name__ == "__main__":
+    # Start as many as needed: python -m src.commands.worker
+    start_worker()
@@ -0,0 +1,28 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.db.pool import engine_options, instrument_engine
+from src.db.request_stats import instrument_statements
+from src.db.session import IS_SQLITE, configure_sqlite, get_database_url
+
+# Same database as the sync engine, but served by an async driver (asyncpg, or aiosqlite for SQLite).
+# An in-memory SQLite database is private to its engine, so async mode needs a file or Postgres.
+ASYNC_DATABASE_URL = get_database_url().set(
+    drivername="sqlite+aiosqlite" if IS_SQLITE else "postgresql+asyncpg"
+)
+
+# Create the async SQLAlchemy Engine
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, **engine_options("async", is_async=True, url=ASYNC_DATABASE_URL)
+)
+instrument_engine("async", async_engine.sync_engine)
+instrument_statements(async_engine.sync_engine)
+if IS_SQLITE:
+    event.listen(async_engine.sync_engine, "connect", configure_sqlite)
+
+# Configure AsyncSessionLocal
+# expire_on_commit=False: attributes cannot be lazy-loaded implicitly on an AsyncSession,
+# so objects must stay readable after commit for response serialization.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
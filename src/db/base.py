@@ -1,4 +1,32 @@
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import DateTime
 
 # Base class for our models (used by SQLAlchemy)
 Base = declarative_base()
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, rendered for the dialect in use."""
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(CreateColumn, "sqlite")
+def _skip_postgresql_only_columns(element, compiler, **kw):
+    # Columns marked postgresql_only (e.g. the tsvector search column) are left out of
+    # SQLite schemas; returning None omits the column from CREATE TABLE
+    if element.element.info.get("postgresql_only"):
+        return None
+    return compiler.visit_create_column(element, **kw)
@@ -1,6 +1,8 @@
 from src.db.session import SessionLocal
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.services.unit_of_work import AsyncUnitOfWork, UnitOfWork
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -14,3 +16,29 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         # Ensure the session is closed, even if errors occur
         db.close()
+
+def get_uow() -> Generator[UnitOfWork, None, None]:
+    """
+    Dependency function that yields a unit of work (one session and transaction) per request.
+    Services commit it; anything left uncommitted is rolled back when the request ends.
+    """
+    with UnitOfWork() as uow:
+        yield uow
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async counterpart of get_db for `async def` endpoints.
+    It automatically closes the session after the request is processed.
+    """
+    # Imported here so the sync stack never needs the asyncpg driver
+    from src.db.async_session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_async_uow() -> AsyncGenerator[AsyncUnitOfWork, None]:
+    """
+    Async counterpart of get_uow for `async def` endpoints.
+    """
+    async with AsyncUnitOfWork() as uow:
+        yield uow
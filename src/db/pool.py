@@ -0,0 +1,166 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Type
+from dotenv import load_dotenv
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.engine import URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool, StaticPool
+
+from src.db.request_stats import record_pool_wait
+
+load_dotenv()
+
+# Pool settings, read from .env / the environment
+# DB_POOL_MODE=queue keeps a local pool of connections; DB_POOL_MODE=pgbouncer opens a
+# connection per checkout (NullPool) and disables prepared statements, for running
+# behind pgbouncer in transaction pooling mode.
+DB_POOL_MODE = os.getenv("DB_POOL_MODE", "queue").lower()
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+# Seconds a request waits for a free connection before failing with 503
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+# Connections older than this many seconds are replaced on checkout (-1 disables)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Pinging on checkout costs one round trip per checkout; pool_recycle already retires stale connections
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() in ("1", "true", "yes")
+
+if DB_POOL_MODE not in ("queue", "pgbouncer"):
+    raise ValueError(f"Unknown DB_POOL_MODE {DB_POOL_MODE!r}; expected 'queue' or 'pgbouncer'")
+
+
+class PoolMetrics:
+    """
+    Thread-safe counters of one engine's pool: connections in use and
+    how long checkouts waited for a free connection.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.engine: Any = None
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def on_checkout(self, *args) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def on_checkin(self, *args) -> None:
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the current counters together with the pool's own sizing."""
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "mode": DB_POOL_MODE,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+        pool = self.engine.pool if self.engine is not None else None
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                max_overflow=pool._max_overflow,
+                timeout=pool.timeout(),
+            )
+        return stats
+
+
+# Metrics of every engine built through engine_options(), keyed by name ("sync", "async")
+POOL_METRICS: Dict[str, PoolMetrics] = {}
+
+
+def _timed_pool_class(base: Type[QueuePool], metrics: PoolMetrics) -> Type[QueuePool]:
+    """
+    Returns a subclass of `base` that records how long each checkout waited.
+    The metrics live on the class so they survive Pool.recreate() after dispose().
+    """
+    class TimedPool(base):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeoutError:
+                metrics.record_timeout()
+                raise
+            waited = time.perf_counter() - start
+            metrics.record_wait(waited)
+            record_pool_wait(waited)
+            return connection
+
+    TimedPool.__name__ = f"Timed{base.__name__}"
+    return TimedPool
+
+
+def is_memory_sqlite(url: URL) -> bool:
+    return url.database in (None, "", ":memory:") or (url.query.get("mode") == "memory")
+
+
+def engine_options(name: str, is_async: bool = False, url: Optional[URL] = None) -> Dict[str, Any]:
+    """
+    Builds the pool-related keyword arguments of create_engine / create_async_engine
+    from the DB_POOL_* settings and registers a PoolMetrics entry under `name`.
+    """
+    metrics = POOL_METRICS.setdefault(name, PoolMetrics(name))
+    options: Dict[str, Any] = {"pool_pre_ping": DB_POOL_PRE_PING}
+
+    if url is not None and url.get_backend_name() == "sqlite":
+        # Connections are shared across the threads serving requests
+        options["connect_args"] = {"check_same_thread": False}
+        if is_memory_sqlite(url):
+            # An in-memory database lives in its connection: every checkout must get the same one
+            options["poolclass"] = StaticPool
+            return options
+
+    if DB_POOL_MODE == "pgbouncer":
+        # pgbouncer owns the pooling; keeping idle connections here would pin server connections
+        options["poolclass"] = NullPool
+        if is_async:
+            # Transaction pooling hands each transaction to any server connection, where
+            # asyncpg's named prepared statements may not exist
+            options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        return options
+
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    options.update(
+        poolclass=_timed_pool_class(base, metrics),
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+    return options
+
+
+def instrument_engine(name: str, engine: Any) -> None:
+    """Attaches the checkout/checkin listeners of POOL_METRICS[name] to a (sync) Engine."""
+    metrics = POOL_METRICS.setdefault(name, PoolMetrics(name))
+    metrics.engine = engine
+    event.listen(engine, "checkout", metrics.on_checkout)
+    event.listen(engine, "checkin", metrics.on_checkin)
@@ -0,0 +1,64 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from sqlalchemy import event
+
+
+class RequestStats:
+    """
+    Database and serialization costs of one API request, filled in by the engine and pool
+    hooks while the request runs. Outside a request (CLI, workers) nothing is recorded.
+    """
+    __slots__ = ("statements", "db_seconds", "pool_wait_seconds", "serialize_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+
+# Set by the request middleware (src/api/instrumentation.py). Sync routes run in the threadpool
+# with a copy of the request's context, which still points at the same RequestStats object.
+CURRENT_REQUEST_STATS: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+def record_pool_wait(seconds: float) -> None:
+    stats = CURRENT_REQUEST_STATS.get()
+    if stats is not None:
+        stats.pool_wait_seconds += seconds
+
+
+def record_serialization(seconds: float) -> None:
+    stats = CURRENT_REQUEST_STATS.get()
+    if stats is not None:
+        stats.serialize_seconds += seconds
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    if CURRENT_REQUEST_STATS.get() is not None:
+        conn.info.setdefault("statement_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    stats = CURRENT_REQUEST_STATS.get()
+    started = conn.info.get("statement_started")
+    if stats is None or not started:
+        return
+    stats.statements += 1
+    stats.db_seconds += time.perf_counter() - started.pop()
+
+
+def _handle_error(exception_context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("statement_started"):
+        _after_cursor_execute(conn, None, "", None, None, False)
+
+
+def instrument_statements(engine: Any) -> None:
+    """Attaches the statement count / DB time hooks to a (sync) Engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
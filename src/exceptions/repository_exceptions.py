@@ -10,6 +10,12 @@ class NotFoundException(RepositoryException):
         self.message = message
         super().__init__(self.message)
 
+class VersionConflictException(RepositoryException):
+    """Raised when an entity changed since the version a write was based on (optimistic concurrency)."""
+    def __init__(self, message="Entity was modified concurrently."):
+        self.message = message
+        super().__init__(self.message)
+
 class AlreadyExistsException(RepositoryException):
     """Raised when trying to create an entity that already exists (e.g., unique constraint violation)."""
     pass
@@ -7,3 +7,7 @@ class ServiceException(ToDoListBaseException):
 class InvalidStatusTransitionException(ServiceException):
     """Raised when trying to transition a task status to an invalid state."""
     pass
+
+class ResyncRequiredException(ServiceException):
+    """Raised when a sync cursor is older than the pruned part of the changes log."""
+    pass
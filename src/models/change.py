@@ -0,0 +1,51 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, JSON, String, text
+from src.db.base import Base, utcnow
+
+class Change(Base):
+    """
+    Append-only log of task and project mutations, one row per created / updated / deleted /
+    autoclosed entity. `seq` orders the log. Writers append rows without one, and a publish
+    step numbers them once they are committed (see ChangeRepository.publish), so rows become
+    visible in `seq` order and a reader that has seen seq N has seen every earlier change.
+    Rows outlive the entities they describe, so deletes leave a record (with no data).
+    Pruning compacts the log up to a horizon (see ChangeLogState): it keeps the latest entry
+    of every live entity and drops older entries and tombstones, so `since=0` still returns
+    everything while cursors behind the horizon have to resync.
+    """
+    __tablename__ = "changes"
+    __table_args__ = (
+        Index("ix_changes_seq", "seq", unique=True),
+        # Resuming one project's stream: changes of a project after a given seq
+        Index("ix_changes_project_id_seq", "project_id", "seq"),
+        # Pruning: later changes of the same entity
+        Index("ix_changes_entity_seq", "entity", "entity_id", "seq"),
+        # Rows waiting for the publish step
+        Index(
+            "ix_changes_unpublished", "id",
+            postgresql_where=text("seq IS NULL"),
+            sqlite_where=text("seq IS NULL")
+        ),
+    )
+
+    # Insertion order; SQLite only auto-increments INTEGER PRIMARY KEY columns
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    # Position in the log, null until published
+    seq = Column(BigInteger, nullable=True)
+    project_id = Column(Integer, nullable=False)
+    entity = Column(String, nullable=False)  # "task" or "project"
+    entity_id = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)  # "created", "updated", "deleted" or "autoclosed"
+    # The entity as the API returns it after the change; null for deletes
+    data = Column(JSON, nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+
+
+class ChangeLogState(Base):
+    """
+    Single-row bookkeeping of the changes log: `pruned_through` is the seq up to which the log
+    was compacted. A cursor below it may have missed tombstones and must resync from 0.
+    """
+    __tablename__ = "change_log_state"
+
+    id = Column(Integer, primary_key=True)
+    pruned_through = Column(BigInteger, nullable=False, default=0)
@@ -1,16 +1,33 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, DateTime, Index, literal_column
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, utcnow
 
 class Project(Base):
     __tablename__ = "projects" 
+    __table_args__ = (
+        # Trigram index for prefix / fuzzy name lookup (requires the pg_trgm extension)
+        Index("ix_projects_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
+        # SQLite otherwise reuses the IDs of deleted rows (see Task)
+        {"sqlite_autoincrement": True},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, index=True)
     description = Column(String, nullable=True)
+    # Bumped by every UPDATE; together with the task aggregates they back the ETag / Last-Modified headers
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version") + 1)
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=utcnow(),
+        onupdate=utcnow()
+    )
     
     # Cascade="all, delete-orphan" ensures tasks are deleted when the project is deleted.
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
 
+    # Read the bumped version / updated_at back through RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     def __str__(self):
         return f"Project {self.id}: {self.name}"
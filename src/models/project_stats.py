@@ -0,0 +1,64 @@
+from sqlalchemy import BigInteger, Column, DDL, DateTime, Float, ForeignKey, Integer, event
+from src.db.base import Base
+
+class ProjectStats(Base):
+    """
+    Per-project task counters, maintained by triggers on `tasks` in the same transaction
+    as every task write (single, batch, COPY import, autoclose). Overdue counts depend on
+    the clock rather than on writes, so they are not stored here.
+    Rebuilt in bulk by `python -m src.commands.reconcile_stats`.
+    """
+    __tablename__ = "project_stats"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    todo = Column(Integer, nullable=False, default=0, server_default="0")
+    doing = Column(Integer, nullable=False, default=0, server_default="0")
+    done = Column(Integer, nullable=False, default=0, server_default="0")
+    # Closed tasks with a known created_at, and the sum of their closed_at - created_at
+    closed_count = Column(Integer, nullable=False, default=0, server_default="0")
+    close_seconds_sum = Column(Float, nullable=False, default=0, server_default="0")
+    # Change token of the project's tasks: bumped by every task write, so the project ETag is
+    # read from this one row instead of aggregating the tasks; null time until the first write
+    tasks_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    tasks_updated_at = Column(DateTime, nullable=True)
+
+
+# The Postgres triggers live in the Alembic migration; SQLite schemas are built by
+# create_all, so their (row-level) triggers are attached here, once all tables exist.
+_SQLITE_TASK_DELTA = """
+    INSERT INTO project_stats (project_id, todo, doing, done, closed_count, close_seconds_sum, tasks_version, tasks_updated_at)
+    SELECT
+        {row}.project_id,
+        {sign} * ({row}.status = 'todo'),
+        {sign} * ({row}.status = 'doing'),
+        {sign} * ({row}.status = 'done'),
+        {sign} * ({row}.closed_at IS NOT NULL AND {row}.created_at IS NOT NULL),
+        {sign} * coalesce((julianday({row}.closed_at) - julianday({row}.created_at)) * 86400, 0),
+        1,
+        CURRENT_TIMESTAMP
+    WHERE {row}.project_id IS NOT NULL
+    ON CONFLICT (project_id) DO UPDATE SET
+        todo = todo + excluded.todo,
+        doing = doing + excluded.doing,
+        done = done + excluded.done,
+        closed_count = closed_count + excluded.closed_count,
+        close_seconds_sum = close_seconds_sum + excluded.close_seconds_sum,
+        tasks_version = tasks_version + excluded.tasks_version,
+        tasks_updated_at = excluded.tasks_updated_at;
+"""
+
+for _name, _event, _body in (
+    ("tasks_stats_insert", "AFTER INSERT", _SQLITE_TASK_DELTA.format(row="NEW", sign=1)),
+    ("tasks_stats_delete", "AFTER DELETE", _SQLITE_TASK_DELTA.format(row="OLD", sign=-1)),
+    (
+        # Any column: every task write bumps tasks_version
+        "tasks_stats_update",
+        "AFTER UPDATE",
+        _SQLITE_TASK_DELTA.format(row="OLD", sign=-1) + _SQLITE_TASK_DELTA.format(row="NEW", sign=1),
+    ),
+):
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(f"CREATE TRIGGER IF NOT EXISTS {_name} {_event} ON tasks BEGIN {_body} END").execute_if(dialect="sqlite"),
+    )
@@ -1,7 +1,8 @@
 import enum
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Computed, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, Index, literal_column, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, utcnow
 
 class TaskStatus(str, enum.Enum):
     TODO = "todo"
@@ -10,9 +11,34 @@ class TaskStatus(str, enum.Enum):
 
 class Task(Base):
     __tablename__ = "tasks" 
+    __table_args__ = (
+        # Composite indexes backing keyset pagination and range filters on the task listing
+        Index("ix_tasks_project_id_id", "project_id", "id"),
+        Index("ix_tasks_project_id_deadline", "project_id", "deadline"),
+        Index("ix_tasks_project_id_closed_at", "project_id", "closed_at"),
+        # Status-filtered listing: equality on both leading columns, then the keyset order by ID
+        Index("ix_tasks_project_id_status_id", "project_id", "status", "id"),
+        # Open tasks by deadline: what the deadline scheduler loads and the autoclose scans
+        Index(
+            "ix_tasks_open_deadline", "deadline",
+            postgresql_where=text("status <> 'done' AND deadline IS NOT NULL"),
+            sqlite_where=text("status <> 'done' AND deadline IS NOT NULL")
+        ),
+        # Open tasks of one project by deadline: live overdue counts next to project_stats
+        Index(
+            "ix_tasks_open_project_deadline", "project_id", "deadline",
+            postgresql_where=text("status <> 'done' AND deadline IS NOT NULL"),
+            sqlite_where=text("status <> 'done' AND deadline IS NOT NULL")
+        ),
+        # Full-text search over title + description
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        # SQLite otherwise reuses the IDs of deleted rows, which ETags and sync clients would mistake for the old task
+        {"sqlite_autoincrement": True},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), index=True) 
+    # The primary key and ix_tasks_project_id_id already index these columns
+    id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.id"))
     title = Column(String)
     description = Column(String, nullable=True)
     status = Column(
@@ -20,12 +46,42 @@ class Task(Base):
         default=TaskStatus.TODO.value,
         nullable=False
 	)	 
+    # Every timestamp column is a naive UTC timestamp: the server defaults use utcnow(), and the
+    # application sets deadline and closed_at from utc_now() / normalize_deadline()
     deadline = Column(DateTime, nullable=True)
     closed_at = Column(DateTime, nullable=True) # Added for autoclose feature
+    # Null for tasks created before the column existed; those are left out of time-to-close stats
+    created_at = Column(DateTime, nullable=True, server_default=utcnow())
+    # Bumped by every UPDATE (ORM or bulk); back the ETag / Last-Modified headers
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version") + 1)
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=utcnow(),
+        onupdate=utcnow()
+    )
+    # Maintained by Postgres. The 'simple' configuration does no stemming, so it works for any language.
+    search_vector = Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))", persisted=True),
+        info={"postgresql_only": True}
+    )
     
     # Relationship back to the project
     project = relationship("Project", back_populates="tasks")
 
+    # Read the bumped version / updated_at back through RETURNING instead of a later SELECT.
+    # search_vector stays table-only (Task.__table__.c.search_vector) so the ORM never loads it.
+    # version doubles as the ORM version counter: flushed UPDATEs / DELETEs of a Task carry
+    # "AND version = <loaded>" and raise StaleDataError when a concurrent write got there first.
+    # The bump itself is the column's onupdate, so bulk statements advance it too.
+    __mapper_args__ = {
+        "eager_defaults": True,
+        "exclude_properties": ["search_vector"],
+        "version_id_col": version,
+        "version_id_generator": False,
+    }
+
     def __str__(self):
         dl = self.deadline.isoformat() if self.deadline else "None"
         return f"Task {self.id}: {self.title} ({self.status.value}) Deadline: {dl}"
@@ -0,0 +1,40 @@
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List
+
+from src.models.change import Change, ChangeLogState
+from src.repositories.change_repository import CHANGES_CHANNEL, CHANGES_LOCK, publish_statement
+
+class AsyncChangeRepository:
+    """
+    Async counterpart of ChangeRepository (appends and publishes only).
+    Writes are only flushed; the AsyncUnitOfWork owning the session commits them and publishes.
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.session = db_session
+        self.unpublished = False
+
+    async def record(self, changes: List[Dict[str, Any]]) -> None:
+        """Async counterpart of ChangeRepository.record."""
+        if not changes:
+            return
+        await self.session.execute(insert(Change), changes)
+        self.unpublished = True
+
+    async def publish(self) -> int:
+        """Async counterpart of ChangeRepository.publish."""
+        is_postgres = self.session.bind.dialect.name == "postgresql"
+        if is_postgres:
+            await self.session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": CHANGES_LOCK})
+        last_seq = max(
+            await self.session.scalar(select(func.coalesce(func.max(Change.seq), 0))),
+            await self.session.scalar(select(func.coalesce(func.max(ChangeLogState.pruned_through), 0))),
+        )
+        published = (await self.session.execute(publish_statement(last_seq))).rowcount
+        self.unpublished = False
+        if published and is_postgres:
+            await self.session.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": CHANGES_CHANNEL, "payload": str(last_seq + published)}
+            )
+        return last_seq + published
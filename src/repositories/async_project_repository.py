@@ -0,0 +1,122 @@
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+from src.models.project import Project
+from src.models.project_stats import ProjectStats
+from src.models.task import Task, TaskStatus
+from src.repositories.task_repository import TASK_COLUMNS
+
+class AsyncProjectRepository:
+    """
+    Async counterpart of ProjectRepository, used by the `async def` API endpoints.
+    Relationships are never lazy-loaded on an AsyncSession, so every read that is
+    serialized together with its tasks loads them eagerly.
+    Writes are only flushed; the AsyncUnitOfWork owning the session commits them.
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.session = db_session
+
+    async def add(self, name: str, description: Optional[str]) -> Project:
+        """Adds a new Project to the database; the row is read back through RETURNING."""
+        new_project = await self.session.scalar(
+            insert(Project)
+            .values(name=name, description=description)
+            .returning(Project)
+        )
+        set_committed_value(new_project, "tasks", [])
+        return new_project
+
+    async def get_all(self) -> List[Project]:
+        """Retrieves all projects."""
+        result = await self.session.scalars(select(Project))
+        return list(result)
+
+    async def get_summaries(self, now: datetime, after_id: Optional[int] = None, limit: int = 100) -> List[Any]:
+        """
+        Retrieves one page of projects with per-status task counts, in a single grouped query.
+        Each row has id, name, description, todo, doing, done and overdue columns.
+        """
+        page = select(Project.id, Project.name, Project.description)
+        if after_id is not None:
+            page = page.where(Project.id > after_id)
+        page = page.order_by(Project.id).limit(limit).subquery()
+
+        result = await self.session.execute(
+            select(
+                page.c.id,
+                page.c.name,
+                page.c.description,
+                func.count(Task.id).filter(Task.status == TaskStatus.TODO).label("todo"),
+                func.count(Task.id).filter(Task.status == TaskStatus.DOING).label("doing"),
+                func.count(Task.id).filter(Task.status == TaskStatus.DONE).label("done"),
+                func.count(Task.id).filter(
+                    Task.status != TaskStatus.DONE,
+                    Task.deadline < now
+                ).label("overdue"),
+            )
+            .outerjoin(Task, Task.project_id == page.c.id)
+            .group_by(page.c.id, page.c.name, page.c.description)
+            .order_by(page.c.id)
+        )
+        return list(result)
+
+    async def get_page_with_tasks(self, after_id: Optional[int] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Async counterpart of ProjectRepository.get_page_with_tasks (plain rows, no ORM objects)."""
+        query = select(Project.id, Project.name, Project.description)
+        if after_id is not None:
+            query = query.where(Project.id > after_id)
+        result = await self.session.execute(query.order_by(Project.id).limit(limit))
+        projects = [{**row._asdict(), "tasks": []} for row in result]
+        if projects:
+            by_id = {project["id"]: project for project in projects}
+            task_rows = await self.session.execute(
+                select(*TASK_COLUMNS).where(Task.project_id.in_(by_id)).order_by(Task.project_id, Task.id)
+            )
+            for row in task_rows:
+                by_id[row.project_id]["tasks"].append(row)
+        return projects
+
+    async def get_validators(self, project_id: int) -> Optional[Any]:
+        """Async counterpart of ProjectRepository.get_validators."""
+        result = await self.session.execute(
+            select(
+                Project.version,
+                Project.updated_at,
+                func.coalesce(ProjectStats.tasks_version, 0).label("tasks_version"),
+                ProjectStats.tasks_updated_at,
+            )
+            .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+            .where(Project.id == project_id)
+        )
+        return result.first()
+
+    async def get_by_id(self, project_id: int) -> Optional[Project]:
+        """Retrieves a single project by its ID, with its tasks loaded."""
+        result = await self.session.scalars(
+            select(Project).options(selectinload(Project.tasks)).where(Project.id == project_id)
+        )
+        return result.first()
+
+    async def update(self, project: Project, name: str, description: Optional[str]) -> None:
+        """Updates an existing project object and flushes the changes."""
+        project.name = name
+        project.description = description
+        await self.session.flush()
+
+    async def delete(self, project: Project) -> List[int]:
+        """Deletes a project object together with its tasks. Returns the IDs of the deleted tasks."""
+        deleted_task_ids = list(await self.session.scalars(
+            delete(Task)
+            .where(Task.project_id == project.id)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        ))
+        await self.session.execute(
+            delete(Project).where(Project.id == project.id).execution_options(synchronize_session=False)
+        )
+        self.session.expunge(project)
+        return deleted_task_ids
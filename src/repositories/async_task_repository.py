@@ -0,0 +1,145 @@
+from sqlalchemy import delete, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, AsyncIterator, Dict, List, Optional
+from datetime import datetime
+
+from src.models.task import Task, TaskStatus
+from src.models.project import Project
+from src.repositories.task_repository import DEADLINE_CHANNEL, TASK_COLUMNS
+
+class AsyncTaskRepository:
+    """
+    Async counterpart of TaskRepository, used by the `async def` API endpoints.
+    Writes are only flushed; the AsyncUnitOfWork owning the session commits them.
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.session = db_session
+
+    async def add(self, project_id: int, title: str, description: Optional[str], deadline: Optional[datetime]) -> Task:
+        """Adds a new Task to the database."""
+        # The row (with its generated ID and defaults) comes back through RETURNING
+        return await self.session.scalar(
+            insert(Task)
+            .values(
+                project_id=project_id,
+                title=title,
+                description=description,
+                deadline=deadline,
+                status=TaskStatus.TODO
+            )
+            .returning(Task)
+        )
+
+    async def get_by_project(self, project_id: int) -> List[Task]:
+        """Retrieves all tasks for a given project ID."""
+        result = await self.session.scalars(select(Task).where(Task.project_id == project_id))
+        return list(result)
+
+    async def notify_deadlines(self, payloads: List[str]) -> None:
+        """Async counterpart of TaskRepository.notify_deadlines."""
+        if payloads and self.session.bind.dialect.name == "postgresql":
+            await self.session.execute(
+                text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+                {"channel": DEADLINE_CHANNEL, "payloads": payloads}
+            )
+
+    async def project_exists(self, project_id: int) -> bool:
+        """Returns whether a project with the given ID exists."""
+        return await self.session.scalar(select(Project.id).where(Project.id == project_id)) is not None
+
+    async def stream_by_project(self, project_id: int, batch_size: int = 1000) -> AsyncIterator[List[Any]]:
+        """Async counterpart of TaskRepository.stream_by_project, read through a server-side cursor."""
+        result = await self.session.stream(
+            select(*TASK_COLUMNS)
+            .where(Task.project_id == project_id)
+            .order_by(Task.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            yield partition
+
+    async def get_page_by_project(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        statuses: Optional[List[TaskStatus]] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+        closed_from: Optional[datetime] = None,
+        closed_to: Optional[datetime] = None,
+    ) -> List[Any]:
+        """Retrieves one keyset page of tasks for a project, ordered by ID, as rows of TASK_COLUMNS."""
+        query = select(*TASK_COLUMNS).where(Task.project_id == project_id)
+
+        if after_id is not None:
+            query = query.where(Task.id > after_id)
+        if statuses:
+            query = query.where(Task.status.in_(statuses))
+        if deadline_from is not None:
+            query = query.where(Task.deadline >= deadline_from)
+        if deadline_to is not None:
+            query = query.where(Task.deadline < deadline_to)
+        if closed_from is not None:
+            query = query.where(Task.closed_at >= closed_from)
+        if closed_to is not None:
+            query = query.where(Task.closed_at < closed_to)
+
+        result = await self.session.execute(query.order_by(Task.id).limit(limit))
+        return list(result)
+
+    async def get_validators(self, project_id: int, task_id: int) -> Optional[Any]:
+        """Returns the (version, updated_at) row behind a task's ETag / Last-Modified, or None if it does not exist."""
+        result = await self.session.execute(
+            select(Task.version, Task.updated_at).where(Task.id == task_id, Task.project_id == project_id)
+        )
+        return result.first()
+
+    async def get_by_id(self, project_id: int, task_id: int) -> Optional[Task]:
+        """Retrieves a single task by its ID and project ID."""
+        result = await self.session.scalars(
+            select(Task).where(Task.id == task_id, Task.project_id == project_id)
+        )
+        return result.first()
+
+    async def get_current(self, project_id: int, task_id: int) -> Optional[Any]:
+        """Returns the current row of a task (TASK_COLUMNS plus version), or None if it does not exist."""
+        result = await self.session.execute(
+            select(*TASK_COLUMNS, Task.version).where(Task.id == task_id, Task.project_id == project_id)
+        )
+        return result.first()
+
+    async def update_if_version(self, project_id: int, task_id: int, expected_version: int, values: Dict[str, Any]) -> Optional[Any]:
+        """Async counterpart of TaskRepository.update_if_version (compare-and-swap on the version)."""
+        result = await self.session.execute(
+            update(Task)
+            .where(Task.id == task_id, Task.project_id == project_id, Task.version == expected_version)
+            .values(**values)
+            .returning(*TASK_COLUMNS, Task.version, Task.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        return result.first()
+
+    async def update(
+        self,
+        task: Task,
+        title: str,
+        description: Optional[str],
+        deadline: Optional[datetime],
+        status: TaskStatus,
+        closed_at: Optional[datetime]
+    ) -> None:
+        """Updates an existing task object and flushes the changes."""
+        task.title = title
+        task.description = description
+        task.deadline = deadline
+        task.status = status
+        task.closed_at = closed_at
+        await self.session.flush()
+
+    async def delete(self, task: Task) -> None:
+        """Deletes a task object, whatever its version (a delete does not depend on the task's state)."""
+        await self.session.execute(
+            delete(Task).where(Task.id == task.id).execution_options(synchronize_session=False)
+        )
+        self.session.expunge(task)
@@ -0,0 +1,59 @@
+from typing import Any, Dict, Optional
+
+from src.cache.read_through import ReadThroughCache, project_key, task_key
+from src.repositories.project_repository import ProjectRepository
+from src.repositories.task_repository import TaskRepository
+from src.models.task import Task
+from src.schemas import ProjectInDB, TaskInDB
+
+
+class CachedProjectRepository:
+    """
+    Wraps a ProjectRepository with read-through caching of single-project reads.
+    Cached reads return serialized payloads (JSON-mode dicts), never ORM objects, so they can
+    be shared across sessions and processes; every other call goes to the wrapped repository.
+    """
+    def __init__(self, repo: ProjectRepository, cache: ReadThroughCache):
+        self.repo = repo
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.repo, name)
+
+    def get_cached(self, project_id: int, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Returns the ProjectInDB payload of a project (with its tasks), or None if it does not exist.
+        `version` is the project's current ETag; entries cached under an older one are reloaded.
+        """
+        def load() -> Optional[Dict[str, Any]]:
+            project = self.repo.get_by_id(project_id)
+            return ProjectInDB.model_validate(project).model_dump(mode="json") if project else None
+
+        return self.cache.get_or_load(project_key(project_id), load, version)
+
+
+class CachedTaskRepository:
+    """
+    Wraps a TaskRepository with read-through caching of single-task reads.
+    Entries are keyed by task ID alone so batch writes, which only know IDs, can invalidate them.
+    """
+    def __init__(self, repo: TaskRepository, cache: ReadThroughCache):
+        self.repo = repo
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.repo, name)
+
+    def get_cached(self, project_id: int, task_id: int, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Returns the TaskInDB payload of a task, or None if it does not exist in the given project.
+        `version` is the task's current ETag; entries cached under an older one are reloaded.
+        """
+        def load() -> Optional[Dict[str, Any]]:
+            task = self.repo.session.get(Task, task_id)
+            return TaskInDB.model_validate(task).model_dump(mode="json") if task else None
+
+        payload = self.cache.get_or_load(task_key(task_id), load, version)
+        if payload is None or payload["project_id"] != project_id:
+            return None
+        return payload
@@ -0,0 +1,147 @@
+from datetime import datetime
+from sqlalchemy import delete, exists, func, insert, or_, select, text, update
+from sqlalchemy.orm import Session, aliased
+from typing import Any, Dict, List, Optional
+
+from src.models.change import Change, ChangeLogState
+from src.schemas import TaskInDB
+
+# NOTIFY channel announcing new rows in `changes`; the payload is the last seq published
+CHANGES_CHANNEL = "changes"
+# Advisory lock key serializing the publish steps (never held by writing transactions)
+CHANGES_LOCK = 0x7A60
+
+def task_change(op: str, project_id: int, task_id: int, task: Any = None) -> Dict[str, Any]:
+    """Builds a change entry for a task; `task` (ORM object, row or dict) becomes its data."""
+    data = TaskInDB.model_validate(task).model_dump(mode="json") if task is not None else None
+    return {"project_id": project_id, "entity": "task", "entity_id": task_id, "op": op, "data": data}
+
+def project_change(op: str, project: Any = None, project_id: Optional[int] = None) -> Dict[str, Any]:
+    """Builds a change entry for a project; its data is the project without tasks."""
+    data = None
+    if project is not None:
+        project_id = project.id
+        data = {"id": project.id, "name": project.name, "description": project.description}
+    return {"project_id": project_id, "entity": "project", "entity_id": project_id, "op": op, "data": data}
+
+
+def publish_statement(last_seq: Any) -> Any:
+    """
+    The UPDATE numbering every unpublished row after `last_seq`, in insertion order.
+    Shared by the sync and async repositories.
+    """
+    numbered = (
+        select(Change.id, (last_seq + func.row_number().over(order_by=Change.id)).label("seq"))
+        .where(Change.seq.is_(None))
+        .subquery()
+    )
+    return (
+        update(Change)
+        .where(Change.id == numbered.c.id)
+        .values(seq=numbered.c.seq)
+        .execution_options(synchronize_session=False)
+    )
+
+
+class ChangeRepository:
+    """
+    Appends to and reads the `changes` log.
+    Writes are only flushed; the UnitOfWork owning the session commits them, then runs
+    publish() in a second, short transaction.
+
+    Entries are appended without a seq. Their seq is assigned after they committed, by the
+    publish step. Publish steps are serialized, and each one only numbers rows that are
+    already committed, so seqs become visible in increasing order. A reader that has seen
+    seq N has seen every earlier change. Writing transactions never wait for one another here.
+    """
+    def __init__(self, db_session: Session):
+        self.session = db_session
+        # Set when this unit of work appended entries that still need publishing
+        self.unpublished = False
+
+    def _is_postgres(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def record(self, changes: List[Dict[str, Any]]) -> None:
+        """Appends the given change entries with one executemany; they are published after commit."""
+        if not changes:
+            return
+        self.session.execute(insert(Change), changes)
+        self.unpublished = True
+
+    def mark_unpublished(self) -> None:
+        """Flags entries appended by a statement of its own (e.g. the bulk import merge) for publishing."""
+        self.unpublished = True
+
+    def publish(self) -> int:
+        """
+        Assigns the next seqs to every committed, unpublished entry (this unit of work's and
+        any a crashed writer left behind) and queues a NOTIFY. Must run in its own transaction,
+        committed right after. Returns the last published seq.
+        """
+        if self._is_postgres():
+            # Serializes publish steps only; each statement below then sees every earlier publish
+            self.session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": CHANGES_LOCK})
+        last_seq = self.get_last_seq()
+        published = self.session.execute(publish_statement(last_seq)).rowcount
+        self.unpublished = False
+        if published and self._is_postgres():
+            self.session.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": CHANGES_CHANNEL, "payload": str(last_seq + published)}
+            )
+        return last_seq + published
+
+    def get_last_seq(self) -> int:
+        """The last seq handed out; pruning may have deleted it, so the horizon counts too."""
+        return max(self.session.scalar(select(func.coalesce(func.max(Change.seq), 0))), self.get_pruned_through())
+
+    def get_since(self, after_seq: int, project_id: Optional[int] = None, limit: int = 1000) -> List[Change]:
+        """Returns up to `limit` changes after `after_seq`, oldest first, optionally of one project only."""
+        query = select(Change).where(Change.seq > after_seq)
+        if project_id is not None:
+            query = query.where(Change.project_id == project_id)
+        return list(self.session.scalars(query.order_by(Change.seq).limit(limit)))
+
+    # --- Retention ---
+
+    def get_pruned_through(self) -> int:
+        """The seq up to which the log was compacted; cursors below it must resync."""
+        return self.session.scalar(select(func.coalesce(func.max(ChangeLogState.pruned_through), 0)))
+
+    def advance_pruned_through(self, seq: int) -> None:
+        """Moves the pruning horizon forward to `seq` (never backwards)."""
+        state = self.session.get(ChangeLogState, 1, with_for_update=True)
+        if state is None:
+            self.session.add(ChangeLogState(id=1, pruned_through=seq))
+        elif state.pruned_through < seq:
+            state.pruned_through = seq
+        self.session.flush()
+
+    def get_prune_horizon(self, before: datetime) -> int:
+        """The last seq appended before `before`, i.e. the horizon retention allows; 0 if none."""
+        return self.session.scalar(
+            select(func.coalesce(func.max(Change.seq), 0)).where(Change.created_at < before)
+        )
+
+    def get_first_seq(self) -> int:
+        return self.session.scalar(select(func.coalesce(func.min(Change.seq), 0)))
+
+    def prune_range(self, first_seq: int, last_seq: int) -> int:
+        """
+        Compacts the entries with seq in [first_seq, last_seq]: drops tombstones and every entry
+        a later one of the same entity supersedes. The latest entry of each live entity stays,
+        so a sync from 0 still returns the current state. Returns the number of entries deleted.
+        """
+        later = aliased(Change)
+        superseded = exists().where(
+            later.entity == Change.entity,
+            later.entity_id == Change.entity_id,
+            later.seq > Change.seq,
+        )
+        statement = (
+            delete(Change)
+            .where(Change.seq.between(first_seq, last_seq), or_(Change.op == "deleted", superseded))
+            .execution_options(synchronize_session=False)
+        )
+        return self.session.execute(statement).rowcount
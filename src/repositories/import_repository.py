@@ -0,0 +1,91 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, TextIO, Tuple
+
+# Staging table and merge statements per importable resource. Staging tables are
+# TEMP ... ON COMMIT DROP, so they vanish with the import's single transaction.
+# Merges also append a "created" entry per row to the changes log, in the same statement.
+STAGING = {
+    "projects": {
+        "table": "projects_import",
+        "columns": ("line", "name", "description"),
+        "create": "CREATE TEMP TABLE projects_import (line bigint, name text, description text) ON COMMIT DROP",
+        "orphans": None,
+        "merge": (
+            "WITH merged AS ("
+            "INSERT INTO projects (name, description) "
+            "SELECT s.name, s.description FROM projects_import s ORDER BY s.line "
+            "RETURNING id, name, description) "
+            "INSERT INTO changes (project_id, entity, entity_id, op, data) "
+            "SELECT id, 'project', id, 'created', "
+            "json_build_object('id', id, 'name', name, 'description', description) FROM merged"
+        ),
+    },
+    "tasks": {
+        "table": "tasks_import",
+        "columns": ("line", "project_id", "title", "description", "deadline"),
+        "create": (
+            "CREATE TEMP TABLE tasks_import "
+            "(line bigint, project_id integer, title text, description text, deadline timestamp) ON COMMIT DROP"
+        ),
+        # Rows pointing at a project that does not exist are reported instead of failing the merge
+        "orphans": (
+            "SELECT s.line, s.project_id, count(*) OVER () AS total FROM tasks_import s "
+            "WHERE NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = s.project_id) "
+            "ORDER BY s.line LIMIT :limit"
+        ),
+        "merge": (
+            "WITH merged AS ("
+            "INSERT INTO tasks (project_id, title, description, deadline, status) "
+            "SELECT s.project_id, s.title, s.description, s.deadline, 'todo' FROM tasks_import s "
+            "WHERE EXISTS (SELECT 1 FROM projects p WHERE p.id = s.project_id) ORDER BY s.line "
+            "RETURNING id, project_id, title, description, deadline, status, closed_at) "
+            "INSERT INTO changes (project_id, entity, entity_id, op, data) "
+            "SELECT project_id, 'task', id, 'created', "
+            "json_build_object('id', id, 'project_id', project_id, 'title', title, 'description', description, "
+            "'deadline', deadline, 'status', status, 'closed_at', closed_at) FROM merged"
+        ),
+    },
+}
+
+
+class ImportRepository:
+    """
+    Bulk loading through PostgreSQL COPY: rows are streamed into a temporary staging
+    table batch by batch, then merged into the target table with one INSERT ... SELECT.
+    Nothing is committed here; the unit of work owning the session commits the import.
+    """
+    def __init__(self, db_session: Session):
+        self.session = db_session
+
+    def create_staging(self, kind: str) -> None:
+        self.session.execute(text(STAGING[kind]["create"]))
+
+    def copy_batch(self, kind: str, csv_buffer: TextIO) -> None:
+        """Loads one batch of CSV rows (in the staging column order) with COPY FROM STDIN."""
+        spec = STAGING[kind]
+        # COPY is not exposed by SQLAlchemy; use the driver connection of the session's transaction
+        dbapi_connection = self.session.connection().connection
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {spec['table']} ({', '.join(spec['columns'])}) FROM STDIN WITH (FORMAT csv)",
+                csv_buffer
+            )
+        finally:
+            cursor.close()
+
+    def get_orphans(self, kind: str, limit: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """Returns the number of staged rows that cannot be merged and up to `limit` of them."""
+        query = STAGING[kind]["orphans"]
+        if query is None:
+            return 0, []
+        # The window count is computed before LIMIT, so one query yields both the total and the sample
+        rows = self.session.execute(text(query), {"limit": max(limit, 1)}).all()
+        count = rows[0].total if rows else 0
+        sample = [{"line": row.line, "error": f"Project ID {row.project_id} not found."} for row in rows[:limit]]
+        return count, sample
+
+    def merge(self, kind: str) -> int:
+        """Inserts every mergeable staged row into the target table; returns the number inserted."""
+        return self.session.execute(text(STAGING[kind]["merge"])).rowcount
@@ -1,53 +1,155 @@
+from sqlalchemy import delete, func, insert, literal, or_, select
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import NoResultFound
-from typing import List, Optional
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Any, Dict, List, Optional
+from datetime import datetime
 
 from src.models.project import Project
-from src.exceptions.repository_exceptions import NotFoundException
+from src.models.project_stats import ProjectStats
+from src.models.task import Task, TaskStatus
+from src.repositories.task_repository import TASK_COLUMNS
 
 class ProjectRepository:
     """
     Repository layer for managing Project models in the database.
     Abstracts direct database interactions from the service layer.
+    Writes are only flushed; the UnitOfWork owning the session commits them.
     """
     def __init__(self, db_session: Session):
         self.session = db_session
 
     def add(self, name: str, description: Optional[str]) -> Project:
-        """Adds a new Project to the database."""
-        new_project = Project(
-            name=name, 
-            description=description
+        """Adds a new Project to the database; the row is read back through RETURNING."""
+        new_project = self.session.scalar(
+            insert(Project)
+            .values(name=name, description=description)
+            .returning(Project)
         )
-        self.session.add(new_project)
-        self.session.commit()
-        self.session.refresh(new_project)
+        # A new project has no tasks; mark the relationship loaded to skip a lazy SELECT
+        set_committed_value(new_project, "tasks", [])
         return new_project
 
     def get_all(self) -> List[Project]:
         """Retrieves all projects."""
         return self.session.query(Project).all()
 
+    def get_summaries(self, now: datetime, after_id: Optional[int] = None, limit: int = 100) -> List[Any]:
+        """
+        Retrieves one page of projects with per-status task counts, in a single grouped query.
+        Each row has id, name, description, todo, doing, done and overdue columns.
+        """
+        # Page the projects first so the aggregate only touches tasks of this page
+        page = self.session.query(Project.id, Project.name, Project.description)
+        if after_id is not None:
+            page = page.filter(Project.id > after_id)
+        page = page.order_by(Project.id).limit(limit).subquery()
+
+        return (
+            self.session.query(
+                page.c.id,
+                page.c.name,
+                page.c.description,
+                func.count(Task.id).filter(Task.status == TaskStatus.TODO).label("todo"),
+                func.count(Task.id).filter(Task.status == TaskStatus.DOING).label("doing"),
+                func.count(Task.id).filter(Task.status == TaskStatus.DONE).label("done"),
+                func.count(Task.id).filter(
+                    Task.status != TaskStatus.DONE,
+                    Task.deadline < now
+                ).label("overdue"),
+            )
+            .outerjoin(Task, Task.project_id == page.c.id)
+            .group_by(page.c.id, page.c.name, page.c.description)
+            .order_by(page.c.id)
+            .all()
+        )
+
+    def get_page_with_tasks(self, after_id: Optional[int] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Retrieves one page of projects with their tasks, in two queries of plain rows
+        (no ORM objects). Each item is a dict with id, name, description and tasks,
+        a list of rows carrying the TASK_COLUMNS.
+        """
+        query = self.session.query(Project.id, Project.name, Project.description)
+        if after_id is not None:
+            query = query.filter(Project.id > after_id)
+        projects = [{**row._asdict(), "tasks": []} for row in query.order_by(Project.id).limit(limit)]
+        if projects:
+            by_id = {project["id"]: project for project in projects}
+            task_rows = self.session.execute(
+                select(*TASK_COLUMNS).where(Task.project_id.in_(by_id)).order_by(Task.project_id, Task.id)
+            )
+            for row in task_rows:
+                by_id[row.project_id]["tasks"].append(row)
+        return projects
+
+    def search_by_name(self, query: str, limit: int = 20) -> List[Any]:
+        """
+        Prefix and fuzzy (trigram) lookup of projects by name, served by ix_projects_name_trgm.
+        Returns (Project, similarity) rows, most similar first.
+        Without Postgres (no pg_trgm), names containing the query match, all with similarity 0.
+        """
+        # Escape LIKE wildcards so the query is matched literally as a prefix
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        if self.session.get_bind().dialect.name == "postgresql":
+            similarity = func.similarity(Project.name, query)
+            matches = or_(Project.name.ilike(escaped + "%", escape="\\"), Project.name.op("%")(query))
+        else:
+            similarity = literal(0.0)
+            matches = Project.name.ilike("%" + escaped + "%", escape="\\")
+        return (
+            self.session.query(Project, similarity.label("similarity"))
+            .filter(matches)
+            .order_by(similarity.desc(), Project.id)
+            .limit(limit)
+            .all()
+        )
+
+    def get_validators(self, project_id: int) -> Optional[Any]:
+        """
+        Probes what the ETag / Last-Modified of a project and its tasks are built from: the
+        project row and the change token its tasks' triggers keep in project_stats, two primary
+        key lookups whatever the project's size. Returns None if the project does not exist.
+        Each row has version, updated_at, tasks_version and tasks_updated_at.
+        """
+        return (
+            self.session.query(
+                Project.version,
+                Project.updated_at,
+                func.coalesce(ProjectStats.tasks_version, 0).label("tasks_version"),
+                ProjectStats.tasks_updated_at,
+            )
+            .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+            .filter(Project.id == project_id)
+            .first()
+        )
+
     def get_by_id(self, project_id: int) -> Optional[Project]:
         """Retrieves a single project by its ID."""
         return self.session.query(Project).filter(Project.id == project_id).first()
 
     # 💡 اصلاح: اضافه شدن name و description به امضا برای رفع TypeError
     def update(self, project: Project, name: str, description: Optional[str]) -> None:
-        """Updates an existing project object and persists changes."""
+        """Updates an existing project object and flushes the changes."""
         
         # 1. Update the attributes of the existing SQLAlchemy object
         project.name = name
         project.description = description
         
-        # 2. Commit the changes to the database
-        self.session.commit()
-        
-        # 3. Refresh the object to get any database-side updates (optional but good practice)
-        self.session.refresh(project)
+        # 2. Flush the UPDATE; the object already holds the new state, so no refresh is needed
+        self.session.flush()
         # Note: We return None as the update is done in-place, and the service layer returns the object.
 
-    def delete(self, project: Project) -> None:
-        """Deletes a project object."""
-        self.session.delete(project)
-        self.session.commit()
+    def delete(self, project: Project) -> List[int]:
+        """Deletes a project object together with its tasks. Returns the IDs of the deleted tasks."""
+        # Two set-based DELETEs instead of the ORM cascade, which loads and deletes tasks one by one
+        deleted_task_ids = list(self.session.scalars(
+            delete(Task)
+            .where(Task.project_id == project.id)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        ))
+        self.session.execute(
+            delete(Project).where(Project.id == project.id).execution_options(synchronize_session=False)
+        )
+        self.session.expunge(project)
+        return deleted_task_ids
@@ -0,0 +1,137 @@
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from typing import Any, Optional
+from datetime import datetime
+
+from src.models.project import Project
+from src.models.project_stats import ProjectStats
+from src.models.task import Task, TaskStatus
+
+
+class StatsRepository:
+    """
+    Reads and rebuilds the per-project task counters in `project_stats`.
+    The counters themselves are kept current by triggers on `tasks`; only overdue
+    counts, which change with the clock, are computed on read from partial indexes.
+    """
+    def __init__(self, db_session: Session):
+        self.session = db_session
+
+    def _overdue(self, now: datetime, project_id: Optional[int] = None) -> int:
+        query = select(func.count()).select_from(Task).where(
+            Task.status != TaskStatus.DONE, Task.deadline.is_not(None), Task.deadline < now
+        )
+        if project_id is not None:
+            # Served by ix_tasks_open_project_deadline
+            query = query.where(Task.project_id == project_id)
+        return self.session.scalar(query)
+
+    def get_project_stats(self, project_id: int, now: datetime) -> Optional[Any]:
+        """
+        Returns the counters of one project (all zero for a project without tasks) plus its
+        overdue count, or None if the project does not exist.
+        Each row has todo, doing, done, closed_count, close_seconds_sum and overdue.
+        """
+        row = self.session.execute(
+            select(
+                func.coalesce(ProjectStats.todo, 0).label("todo"),
+                func.coalesce(ProjectStats.doing, 0).label("doing"),
+                func.coalesce(ProjectStats.done, 0).label("done"),
+                func.coalesce(ProjectStats.closed_count, 0).label("closed_count"),
+                func.coalesce(ProjectStats.close_seconds_sum, 0).label("close_seconds_sum"),
+            )
+            .select_from(Project)
+            .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+            .where(Project.id == project_id)
+        ).first()
+        if row is None:
+            return None
+        return {**row._asdict(), "overdue": self._overdue(now, project_id)}
+
+    def get_rollup(self, now: datetime) -> Any:
+        """Returns the counters summed over all projects, plus the project count and the overdue count."""
+        row = self.session.execute(
+            select(
+                func.count().label("projects"),
+                func.coalesce(func.sum(ProjectStats.todo), 0).label("todo"),
+                func.coalesce(func.sum(ProjectStats.doing), 0).label("doing"),
+                func.coalesce(func.sum(ProjectStats.done), 0).label("done"),
+                func.coalesce(func.sum(ProjectStats.closed_count), 0).label("closed_count"),
+                func.coalesce(func.sum(ProjectStats.close_seconds_sum), 0).label("close_seconds_sum"),
+            )
+            .select_from(Project)
+            .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+        ).one()
+        # Served by ix_tasks_open_deadline
+        return {**row._asdict(), "overdue": self._overdue(now)}
+
+    def get_max_project_id(self) -> int:
+        return self.session.scalar(select(func.coalesce(func.max(Project.id), 0)))
+
+    def rebuild_range(self, first_id: int, last_id: int) -> int:
+        """
+        Recomputes the counters of projects first_id..last_id from their tasks; returns the
+        number of projects rebuilt. Must run in its own transaction, committed right after.
+
+        Concurrent task writes stay correct: the counter rows are locked before the tasks are
+        aggregated, so a writer's trigger either committed before the aggregate (and is counted
+        by it) or waits for the lock and applies its delta on top of the rebuilt values.
+        """
+        is_postgres = self.session.get_bind().dialect.name == "postgresql"
+        dialect_insert = postgresql.insert if is_postgres else sqlite.insert
+        stats_in_range = ProjectStats.project_id.between(first_id, last_id)
+
+        # Every project gets a row first, so the trigger of a concurrent writer never races
+        # this rebuild on inserting one
+        self.session.execute(
+            dialect_insert(ProjectStats)
+            .from_select(["project_id"], select(Project.id).where(Project.id.between(first_id, last_id)))
+            .on_conflict_do_nothing()
+        )
+        locked = self.session.scalars(
+            select(ProjectStats.project_id)
+            .where(stats_in_range)
+            .order_by(ProjectStats.project_id)
+            .with_for_update()
+        ).all()
+
+        if is_postgres:
+            close_seconds = func.extract("epoch", Task.closed_at - Task.created_at)
+        else:
+            close_seconds = (func.julianday(Task.closed_at) - func.julianday(Task.created_at)) * 86400
+        closed = Task.closed_at.is_not(None) & Task.created_at.is_not(None)
+        counts = (
+            select(
+                Task.project_id,
+                func.count().filter(Task.status == TaskStatus.TODO).label("todo"),
+                func.count().filter(Task.status == TaskStatus.DOING).label("doing"),
+                func.count().filter(Task.status == TaskStatus.DONE).label("done"),
+                func.count().filter(closed).label("closed_count"),
+                func.coalesce(func.sum(close_seconds).filter(closed), 0).label("close_seconds_sum"),
+            )
+            .where(Task.project_id.between(first_id, last_id))
+            .group_by(Task.project_id)
+            .subquery()
+        )
+
+        # Zero the range, then fill in the projects that have tasks from one grouped scan
+        self.session.execute(
+            update(ProjectStats)
+            .where(stats_in_range)
+            .values(todo=0, doing=0, done=0, closed_count=0, close_seconds_sum=0)
+            .execution_options(synchronize_session=False)
+        )
+        self.session.execute(
+            update(ProjectStats)
+            .where(ProjectStats.project_id == counts.c.project_id)
+            .values(
+                todo=counts.c.todo,
+                doing=counts.c.doing,
+                done=counts.c.done,
+                closed_count=counts.c.closed_count,
+                close_seconds_sum=counts.c.close_seconds_sum,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return len(locked)
@@ -1,14 +1,51 @@
+from sqlalchemy import DateTime, Float, and_, cast, column, delete, func, insert, literal, or_, select, text, true, tuple_, update, values
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from datetime import datetime, timezone
 
 from src.models.task import Task, TaskStatus
 from src.models.project import Project
-from src.exceptions.repository_exceptions import NotFoundException
+
+# NOTIFY channel through which writers tell the deadline scheduler about new deadlines.
+# Payloads are "<task id>:<ISO deadline>", or "reload" after bulk changes.
+DEADLINE_CHANNEL = "task_deadlines"
+RELOAD_DEADLINES = "reload"
+
+def deadline_payload(task_id: int, deadline: datetime) -> str:
+    return f"{task_id}:{deadline.isoformat()}"
+
+def utc_now() -> datetime:
+    """The current time as a naive UTC timestamp, the convention of every stored timestamp."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def normalize_deadline(deadline: Optional[datetime]) -> Optional[datetime]:
+    """Deadlines are stored as naive UTC timestamps; converts aware ones, naive ones are taken as UTC."""
+    if deadline is not None and deadline.tzinfo is not None:
+        return deadline.astimezone(timezone.utc).replace(tzinfo=None)
+    return deadline
+
+def parse_deadline_payload(payload: str) -> Optional[Tuple[datetime, int]]:
+    """Returns (deadline, task id) from a notification payload, or None for a reload request."""
+    if payload == RELOAD_DEADLINES:
+        return None
+    task_id, deadline = payload.split(":", 1)
+    return normalize_deadline(datetime.fromisoformat(deadline)), int(task_id)
+
+# Columns returned by the batch methods; rows expose them as attributes like a Task does
+TASK_COLUMNS = (
+    Task.id,
+    Task.project_id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.deadline,
+    Task.closed_at,
+)
 
 class TaskRepository:
     """
     Repository layer for managing Task models in the database.
+    Writes are only flushed; the UnitOfWork owning the session commits them.
     """
     def __init__(self, db_session: Session):
         self.session = db_session
@@ -23,16 +60,18 @@ class TaskRepository:
         #     # In the service layer, we also check this, so commenting this out for repository purity
         #     # raise NotFoundException(f"Project ID {project_id} not found.")
 
-        new_task = Task(
-            project_id=project_id,
-            title=title,
-            description=description,
-            deadline=deadline
+        # The row (with its generated ID and defaults) comes back through RETURNING
+        return self.session.scalar(
+            insert(Task)
+            .values(
+                project_id=project_id,
+                title=title,
+                description=description,
+                deadline=deadline,
+                status=TaskStatus.TODO
+            )
+            .returning(Task)
         )
-        self.session.add(new_task)
-        self.session.commit()
-        self.session.refresh(new_task)
-        return new_task
     
     # ... (بقیه متدها: get_by_project, get_by_id, update, delete) ...
 
@@ -40,6 +79,99 @@ class TaskRepository:
         """Retrieves all tasks for a given project ID."""
         return self.session.query(Task).filter(Task.project_id == project_id).all()
 
+    def get_page_by_project(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        statuses: Optional[List[TaskStatus]] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+        closed_from: Optional[datetime] = None,
+        closed_to: Optional[datetime] = None,
+    ) -> List[Any]:
+        """
+        Retrieves one keyset page of tasks for a project, ordered by ID.
+        Only tasks with an ID greater than `after_id` are returned, so every page
+        costs the same regardless of how deep the client has paged.
+        Rows carry the TASK_COLUMNS as plain attributes: no ORM objects are built for a listing.
+        """
+        query = self.session.query(*TASK_COLUMNS).filter(Task.project_id == project_id)
+
+        if after_id is not None:
+            query = query.filter(Task.id > after_id)
+        if statuses:
+            query = query.filter(Task.status.in_(statuses))
+        if deadline_from is not None:
+            query = query.filter(Task.deadline >= deadline_from)
+        if deadline_to is not None:
+            query = query.filter(Task.deadline < deadline_to)
+        if closed_from is not None:
+            query = query.filter(Task.closed_at >= closed_from)
+        if closed_to is not None:
+            query = query.filter(Task.closed_at < closed_to)
+
+        return query.order_by(Task.id).limit(limit).all()
+
+    def search(
+        self,
+        query: str,
+        project_id: Optional[int] = None,
+        after: Optional[Tuple[float, int]] = None,
+        limit: int = 50,
+    ) -> List[Any]:
+        """
+        Full-text search over task titles and descriptions, best matches first.
+        `query` uses web search syntax ("quoted phrases", OR, -excluded). Returns (Task, rank)
+        rows ordered by rank then ID, both descending; pass the (rank, id) of the last row
+        as `after` to fetch the next page.
+        Without Postgres, every word must appear in the title or description and all ranks are 0.
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            search_vector = Task.__table__.c.search_vector
+            ts_query = func.websearch_to_tsquery("simple", query)
+            # ts_rank returns real; as double precision the cursor's float round-trips exactly, so
+            # the keyset comparison finds rows tied with the last one instead of repeating or skipping them
+            rank = cast(func.ts_rank(search_vector, ts_query), Float(53))
+            matches = search_vector.op("@@")(ts_query)
+        else:
+            rank = literal(0.0)
+            words = [word.strip('"') for word in query.split()]
+            matches = and_(true(), *(
+                or_(Task.title.ilike(f"%{word}%"), Task.description.ilike(f"%{word}%"))
+                for word in words if word
+            ))
+
+        statement = select(Task, rank.label("rank")).where(matches)
+        if project_id is not None:
+            statement = statement.where(Task.project_id == project_id)
+        if after is not None:
+            statement = statement.where(tuple_(rank, Task.id) < tuple_(*after))
+
+        return self.session.execute(
+            statement.order_by(rank.desc(), Task.id.desc()).limit(limit)
+        ).all()
+
+    def stream_by_project(self, project_id: int, batch_size: int = 1000) -> Iterator[List[Any]]:
+        """
+        Yields all tasks of a project, ordered by ID, in batches of up to `batch_size` rows.
+        Rows are read through a server-side cursor and carry the TASK_COLUMNS as plain
+        attributes (no ORM objects), so memory stays flat regardless of project size.
+        """
+        result = self.session.execute(
+            select(*TASK_COLUMNS)
+            .where(Task.project_id == project_id)
+            .order_by(Task.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from result.partitions()
+
+    def get_validators(self, project_id: int, task_id: int) -> Optional[Any]:
+        """Returns the (version, updated_at) row behind a task's ETag / Last-Modified, or None if it does not exist."""
+        return self.session.execute(
+            select(Task.version, Task.updated_at).where(Task.id == task_id, Task.project_id == project_id)
+        ).first()
+
     def get_by_id(self, project_id: int, task_id: int) -> Optional[Task]:
         """Retrieves a single task by its ID and project ID."""
         return self.session.query(Task).filter(
@@ -47,6 +179,27 @@ class TaskRepository:
             Task.project_id == project_id
         ).first()
 
+    def get_current(self, project_id: int, task_id: int) -> Optional[Any]:
+        """Returns the current row of a task (TASK_COLUMNS plus version), or None if it does not exist."""
+        return self.session.execute(
+            select(*TASK_COLUMNS, Task.version).where(Task.id == task_id, Task.project_id == project_id)
+        ).first()
+
+    def update_if_version(self, project_id: int, task_id: int, expected_version: int, values: Dict[str, Any]) -> Optional[Any]:
+        """
+        Compare-and-swap update: applies `values` only while the task is still at `expected_version`,
+        in one UPDATE ... WHERE version = ... RETURNING, without holding a lock between read and write.
+        Returns the updated row (TASK_COLUMNS plus version and updated_at), or None when the task
+        does not exist or another write moved its version on.
+        """
+        return self.session.execute(
+            update(Task)
+            .where(Task.id == task_id, Task.project_id == project_id, Task.version == expected_version)
+            .values(**values)
+            .returning(*TASK_COLUMNS, Task.version, Task.updated_at)
+            .execution_options(synchronize_session=False)
+        ).first()
+
     def update(
         self, 
         task: Task, 
@@ -56,7 +209,7 @@ class TaskRepository:
         status: TaskStatus, 
         closed_at: Optional[datetime]
     ) -> None:
-        """Updates an existing task object and persists changes."""
+        """Updates an existing task object and flushes the changes."""
         
         task.title = title
         task.description = description
@@ -64,10 +217,157 @@ class TaskRepository:
         task.status = status
         task.closed_at = closed_at
         
-        self.session.commit()
-        self.session.refresh(task)
+        self.session.flush()
 
     def delete(self, task: Task) -> None:
-        """Deletes a task object."""
-        self.session.delete(task)
-        self.session.commit()
+        """Deletes a task object, whatever its version (a delete does not depend on the task's state)."""
+        self.session.execute(
+            delete(Task).where(Task.id == task.id).execution_options(synchronize_session=False)
+        )
+        self.session.expunge(task)
+
+    def get_upcoming_deadlines(self, until: datetime, limit: int) -> List[Any]:
+        """
+        Returns (id, deadline) rows of open tasks due before `until`, soonest first.
+        Served by the partial index ix_tasks_open_deadline, so it stays cheap on large tables.
+        """
+        return list(self.session.execute(
+            select(Task.id, Task.deadline)
+            .where(Task.status != TaskStatus.DONE, Task.deadline.is_not(None), Task.deadline < until)
+            .order_by(Task.deadline)
+            .limit(limit)
+        ))
+
+    def notify_deadlines(self, payloads: List[str]) -> None:
+        """
+        Queues NOTIFYs on DEADLINE_CHANNEL; Postgres delivers them only when the transaction commits.
+        Other databases have no NOTIFY, and the scheduler polls them instead.
+        """
+        if payloads and self.session.get_bind().dialect.name == "postgresql":
+            self.session.execute(
+                text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+                {"channel": DEADLINE_CHANNEL, "payloads": payloads}
+            )
+
+    def close_overdue_chunk(
+        self,
+        now: datetime,
+        chunk_size: int,
+        shards: Optional[Collection[int]] = None,
+        shard_count: int = 1,
+        shard_width: int = 1,
+    ) -> List[Any]:
+        """
+        Closes up to `chunk_size` open tasks whose deadline is before `now` with a single
+        UPDATE ... RETURNING. Returns the closed tasks as rows of TASK_COLUMNS.
+        Rows already locked by a concurrent run are skipped, so several schedulers
+        can work through the same backlog without closing a task twice.
+        With `shards`, only tasks of projects in those shards are closed: projects are cut
+        into ranges of `shard_width` IDs, dealt round-robin over `shard_count` shards.
+        """
+        picked = (
+            self._overdue(now, shards, shard_count, shard_width)
+            .limit(chunk_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = self.session.execute(
+            update(Task)
+            .where(Task.id.in_(picked), Task.status.in_([TaskStatus.TODO, TaskStatus.DOING]))
+            .values(status=TaskStatus.DONE, closed_at=now)
+            .returning(*TASK_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result)
+
+    def has_overdue(
+        self,
+        now: datetime,
+        shards: Optional[Collection[int]] = None,
+        shard_count: int = 1,
+        shard_width: int = 1,
+    ) -> bool:
+        """Whether open tasks with a deadline before `now` remain, locked ones included (same filters as close_overdue_chunk)."""
+        return self.session.execute(
+            select(self._overdue(now, shards, shard_count, shard_width).exists())
+        ).scalar()
+
+    def _overdue(self, now: datetime, shards: Optional[Collection[int]], shard_count: int, shard_width: int):
+        query = select(Task.id).where(Task.deadline < now, Task.status.in_([TaskStatus.TODO, TaskStatus.DOING]))
+        if shards is not None:
+            query = query.where(((Task.project_id // shard_width) % shard_count).in_(list(shards)))
+        return query
+
+    # ------------------ Batch operations ------------------
+    # Each method runs a single statement (executemany for lists of rows).
+
+    def get_existing_project_ids(self, project_ids: Iterable[int]) -> Set[int]:
+        """Returns the subset of the given project IDs that exist."""
+        ids = set(project_ids)
+        if not ids:
+            return set()
+        return set(self.session.scalars(select(Project.id).where(Project.id.in_(ids))))
+
+    def get_many(self, task_ids: Iterable[int]) -> Dict[int, Any]:
+        """Retrieves the current rows of the given tasks (TASK_COLUMNS plus version), keyed by task ID."""
+        ids = set(task_ids)
+        if not ids:
+            return {}
+        rows = self.session.execute(select(*TASK_COLUMNS, Task.version).where(Task.id.in_(ids)))
+        return {row.id: row for row in rows}
+
+    def add_many(self, rows: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Inserts tasks with one INSERT ... RETURNING.
+        Returns the inserted rows in the same order as `rows`.
+        """
+        if not rows:
+            return []
+        result = self.session.execute(
+            insert(Task).returning(*TASK_COLUMNS, sort_by_parameter_order=True),
+            rows
+        )
+        return list(result)
+
+    def update_many(self, rows: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Compare-and-swap update of many tasks in one WITH batch AS (VALUES ...) UPDATE ... FROM batch RETURNING.
+        Each row carries the task's `id`, the `version` it was read at and the new values, and
+        is applied only while the task is still at that version; version and updated_at advance
+        as for any update. Returns the updated rows (TASK_COLUMNS plus version and updated_at);
+        tasks missing from the result were deleted or moved on by another write.
+        """
+        if not rows:
+            return []
+        table = Task.__table__
+        fields = ("title", "description", "deadline", "status", "closed_at")
+        batch = values(
+            column("task_id", table.c.id.type),
+            column("expected_version", table.c.version.type),
+            *(column(field, table.c[field].type) for field in fields),
+            name="batch",
+        ).data([(row["id"], row["version"], *(row[field] for field in fields)) for row in rows]).cte()
+
+        new_values = {field: batch.c[field] for field in fields}
+        if self.session.get_bind().dialect.name == "postgresql":
+            # A VALUES column of nothing but NULLs is typed text, which timestamp columns reject
+            new_values.update(deadline=cast(batch.c.deadline, DateTime), closed_at=cast(batch.c.closed_at, DateTime))
+        return list(self.session.execute(
+            update(Task)
+            .where(Task.id == batch.c.task_id, Task.version == batch.c.expected_version)
+            .values(**new_values)
+            .returning(*TASK_COLUMNS, Task.version, Task.updated_at)
+            .execution_options(synchronize_session=False)
+        ))
+
+    def delete_many(self, task_ids: Iterable[int]) -> List[Any]:
+        """Deletes the given tasks with one DELETE ... RETURNING. Returns the deleted tasks as (id, project_id) rows."""
+        ids = set(task_ids)
+        if not ids:
+            return []
+        result = self.session.execute(
+            delete(Task)
+            .where(Task.id.in_(ids))
+            .returning(Task.id, Task.project_id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result)
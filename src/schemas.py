@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Literal, Optional, List
 from datetime import datetime
 from src.models.task import TaskStatus # Import TaskStatus Enum
 
@@ -31,7 +31,46 @@ class TaskInDB(TaskBase):
         # Pydantic V2: Enables reading data from ORM objects (SQLAlchemy)
         from_attributes = True 
         # Note: use_enum_values = True is removed to fix the serialization error.
+
+class TaskPage(BaseModel):
+    """Schema for one keyset-paginated page of tasks."""
+    items: List[TaskInDB]
+    # Pass this value as `after_id` to fetch the next page; null on the last page
+    next_cursor: Optional[int] = None
         
+class TaskSearchHit(TaskInDB):
+    """One full-text search result; higher rank means a better match."""
+    rank: float
+
+class TaskSearchPage(BaseModel):
+    """Schema for one page of full-text search results, best matches first."""
+    items: List[TaskSearchHit]
+    # Opaque cursor; pass it as `cursor` to fetch the next page; null on the last page
+    next_cursor: Optional[str] = None
+
+# --- Task Batch Schemas ---
+
+class TaskBatchCreateItem(TaskCreate):
+    """One task of a batch create request; batches may span projects."""
+    project_id: int
+
+class TaskBatchUpdateItem(TaskUpdate):
+    """One task of a batch update request."""
+    id: int
+
+class TaskBatchDelete(BaseModel):
+    """Body of a batch delete request."""
+    ids: List[int] = Field(..., min_length=1)
+
+class TaskBatchResult(BaseModel):
+    """Outcome of one item of a batch request, streamed as one NDJSON line."""
+    # Position of the item in the request body
+    index: int
+    status: Literal["created", "updated", "deleted", "error"]
+    id: Optional[int] = None
+    task: Optional[TaskInDB] = None
+    error: Optional[str] = None
+
 # --- Project Schemas ---
 
 class ProjectBase(BaseModel):
@@ -43,6 +82,40 @@ class ProjectCreate(ProjectBase):
     """Schema for creating a new project."""
     pass
 
+class TaskCounts(BaseModel):
+    """Aggregate task counts of a project, grouped by status."""
+    todo: int = 0
+    doing: int = 0
+    done: int = 0
+    # Tasks past their deadline that are not done yet
+    overdue: int = 0
+
+class ProjectSummary(ProjectBase):
+    """Schema for listing projects without loading their tasks."""
+    id: int
+    task_counts: TaskCounts
+
+class TaskStats(BaseModel):
+    """Schema for task counters read from project_stats."""
+    task_counts: TaskCounts
+    # Closed tasks whose creation time is known; the average is taken over these
+    closed_count: int = 0
+    avg_time_to_close_seconds: Optional[float] = None
+
+class ProjectTaskStats(TaskStats):
+    """Schema for the task statistics of one project."""
+    project_id: int
+
+class TaskStatsRollup(TaskStats):
+    """Schema for the task statistics summed over all projects."""
+    projects: int
+
+class ProjectMatch(ProjectBase):
+    """Schema for a project found by name search."""
+    id: int
+    # Trigram similarity between the name and the query, from 0 to 1
+    similarity: float
+
 class ProjectInDB(ProjectBase):
     """Schema for returning Project data from the database."""
     id: int
@@ -53,3 +126,28 @@ class ProjectInDB(ProjectBase):
         # Pydantic V2: Enables reading data from ORM objects (SQLAlchemy)
         from_attributes = True
         # Note: use_enum_values = True is removed.
+
+# --- Sync Schemas ---
+
+class ProjectRecord(ProjectBase):
+    """Schema for a project without its tasks."""
+    id: int
+
+class TaskDelta(BaseModel):
+    """Tasks created or changed since the client's sequence number (latest state), and tasks deleted."""
+    upserted: List[TaskInDB] = []
+    deleted: List[int] = []
+
+class ProjectDelta(BaseModel):
+    """Projects created or changed since the client's sequence number (latest state), and projects deleted."""
+    upserted: List[ProjectRecord] = []
+    deleted: List[int] = []
+
+class SyncPage(BaseModel):
+    """Schema for one page of compacted changes."""
+    tasks: TaskDelta
+    projects: ProjectDelta
+    # Pass this value as `since` on the next call
+    next_since: int
+    # True when more changes are waiting; call again right away with next_since
+    has_more: bool
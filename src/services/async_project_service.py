@@ -0,0 +1,101 @@
+from src.services.unit_of_work import AsyncUnitOfWork
+from src.exceptions.repository_exceptions import NotFoundException
+from src.repositories.change_repository import project_change, task_change
+from src.models.project import Project
+from typing import Any, Dict, List, Optional
+from src.repositories.task_repository import utc_now
+
+class AsyncProjectService:
+    """
+    Async counterpart of ProjectService; applies the same business rules
+    on top of AsyncProjectRepository.
+    """
+    def __init__(self, uow: AsyncUnitOfWork):
+        self.uow = uow
+        self.repo = uow.projects
+
+    async def create_project(self, name: str, description: Optional[str]) -> Project:
+        """Creates a new project after basic validation."""
+        if len(name.split()) > 10:
+            raise ValueError("Project name must be <= 10 words.")
+
+        project = await self.repo.add(name=name, description=description)
+        await self.uow.changes.record([project_change("created", project)])
+        await self.uow.commit()
+        return project
+
+    async def list_projects(self) -> List[Project]:
+        """Retrieves all projects."""
+        return await self.repo.get_all()
+
+    async def list_project_summaries(self, after_id: Optional[int] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Retrieves one page of projects with aggregate task counts instead of the task tree."""
+        rows = await self.repo.get_summaries(now=utc_now(), after_id=after_id, limit=limit)
+        return [
+            {
+                "id": row.id,
+                "name": row.name,
+                "description": row.description,
+                "task_counts": {
+                    "todo": row.todo,
+                    "doing": row.doing,
+                    "done": row.done,
+                    "overdue": row.overdue,
+                },
+            }
+            for row in rows
+        ]
+
+    async def list_projects_with_tasks(self, after_id: Optional[int] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Retrieves one page of projects together with their full task lists, as plain rows."""
+        return await self.repo.get_page_with_tasks(after_id=after_id, limit=limit)
+
+    async def get_validators(self, project_id: int) -> Any:
+        """Probes the version data behind a project's ETag / Last-Modified without loading it."""
+        validators = await self.repo.get_validators(project_id)
+        if not validators:
+            raise NotFoundException(f"Project ID {project_id} not found.")
+        return validators
+
+    async def get_project(self, project_id: int) -> Project:
+        """Retrieves a single project with its tasks, raising NotFoundException if missing."""
+        project = await self.repo.get_by_id(project_id)
+        if not project:
+            raise NotFoundException(f"Project {project_id} not found")
+        return project
+
+    async def update_project(self, project_id: int, name: str, description: Optional[str]) -> Project:
+        """Updates an existing project by ID."""
+        project = await self.repo.get_by_id(project_id)
+
+        if not project:
+            raise NotFoundException(f"Project ID {project_id} not found.")
+
+        if len(name.split()) > 10:
+            raise ValueError("Project name must be <= 10 words.")
+
+        await self.repo.update(
+            project=project,
+            name=name,
+            description=description
+        )
+        await self.uow.changes.record([project_change("updated", project)])
+        await self.uow.commit()
+        self.uow.cache.invalidate_project(project_id)
+        return project
+
+    async def delete_project(self, project_id: int):
+        """Deletes a project by ID."""
+        project = await self.repo.get_by_id(project_id)
+
+        if not project:
+            raise NotFoundException(f"Project ID {project_id} not found.")
+
+        task_ids = await self.repo.delete(project)
+        # Tombstones for the tasks too, so clients tracking tasks see them go
+        await self.uow.changes.record(
+            [task_change("deleted", project_id, task_id) for task_id in task_ids]
+            + [project_change("deleted", project_id=project_id)]
+        )
+        await self.uow.commit()
+        self.uow.cache.invalidate_tasks(task_ids, [project_id])
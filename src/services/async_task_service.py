@@ -0,0 +1,147 @@
+from src.services.unit_of_work import AsyncUnitOfWork
+from src.exceptions.repository_exceptions import NotFoundException, VersionConflictException
+from src.models.task import Task, TaskStatus
+from typing import Any, AsyncIterator, List, Optional, Tuple
+from datetime import datetime
+from src.services.task_service import UPDATE_TASK_ATTEMPTS, resolve_closed_at
+from src.repositories.task_repository import deadline_payload, normalize_deadline, utc_now
+from src.repositories.change_repository import task_change
+
+class AsyncTaskService:
+    """
+    Async counterpart of TaskService; applies the same business rules
+    on top of AsyncTaskRepository.
+    """
+    def __init__(self, uow: AsyncUnitOfWork):
+        self.uow = uow
+        self.task_repo = uow.tasks
+
+    async def get_task_by_id(self, project_id: int, task_id: int) -> Task:
+        """Retrieves a single task by its ID and project ID, raising 404 if not found."""
+        task = await self.task_repo.get_by_id(project_id, task_id)
+        if not task:
+            raise NotFoundException(f"Task ID {task_id} not found in Project ID {project_id}")
+        return task
+
+    async def get_task_validators(self, project_id: int, task_id: int) -> Any:
+        """Probes the version data behind a task's ETag / Last-Modified without loading it."""
+        validators = await self.task_repo.get_validators(project_id, task_id)
+        if not validators:
+            raise NotFoundException(f"Task ID {task_id} not found in Project ID {project_id}")
+        return validators
+
+    async def get_project_validators(self, project_id: int) -> Optional[Any]:
+        """Probes the version data of a project's tasks, which covers every task listing of the project."""
+        return await self.uow.projects.get_validators(project_id)
+
+    async def create_task(self, project_id: int, title: str, description: Optional[str], deadline: Optional[datetime]) -> Task:
+        deadline_dt = normalize_deadline(deadline)
+
+        task = await self.task_repo.add(
+            project_id=project_id,
+            title=title,
+            description=description,
+            deadline=deadline_dt
+        )
+        if deadline_dt:
+            # Wakes the deadline scheduler, which closes the task once it is due
+            await self.task_repo.notify_deadlines([deadline_payload(task.id, deadline_dt)])
+        await self.uow.changes.record([task_change("created", project_id, task.id, task)])
+        await self.uow.commit()
+        self.uow.cache.invalidate_project(project_id)
+        return task
+
+    async def list_tasks_by_project(self, project_id: int) -> List[Task]:
+        """Retrieves all tasks for a specific project."""
+        return await self.task_repo.get_by_project(project_id)
+
+    async def ensure_project_exists(self, project_id: int) -> None:
+        """Raises NotFoundException unless the project exists."""
+        if not await self.task_repo.project_exists(project_id):
+            raise NotFoundException(f"Project ID {project_id} not found.")
+
+    def export_tasks(self, project_id: int, batch_size: int = 1000) -> AsyncIterator[List[Any]]:
+        """Streams all tasks of a project as batches of plain rows, for exports of any size."""
+        return self.task_repo.stream_by_project(project_id, batch_size=batch_size)
+
+    async def list_tasks_page(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        statuses: Optional[List[TaskStatus]] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+        closed_from: Optional[datetime] = None,
+        closed_to: Optional[datetime] = None,
+    ) -> Tuple[List[Any], Optional[int]]:
+        """
+        Retrieves one page of tasks for a project.
+        Returns the tasks and the cursor for the next page (None on the last page).
+        """
+        tasks = await self.task_repo.get_page_by_project(
+            project_id=project_id,
+            after_id=after_id,
+            limit=limit + 1,
+            statuses=statuses,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+            closed_from=closed_from,
+            closed_to=closed_to,
+        )
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            return tasks, tasks[-1].id
+        return tasks, None
+
+    async def update_task(
+        self,
+        project_id: int,
+        task_id: int,
+        title: str,
+        description: Optional[str],
+        deadline: Optional[datetime],
+        status: TaskStatus,
+        expected_version: Optional[int] = None
+    ) -> Any:
+        """Updates an existing task as a compare-and-swap on its version (see TaskService.update_task)."""
+        deadline_dt = normalize_deadline(deadline)
+
+        for _ in range(UPDATE_TASK_ATTEMPTS):
+            current = await self.task_repo.get_current(project_id, task_id)
+            if current is None:
+                raise NotFoundException(f"Task ID {task_id} not found in Project ID {project_id}.")
+            if expected_version is not None and current.version != expected_version:
+                raise VersionConflictException(f"Task ID {task_id} is at version {current.version}, not {expected_version}.")
+
+            closed_at = resolve_closed_at(current.status, current.closed_at, status, utc_now())
+
+            task = await self.task_repo.update_if_version(project_id, task_id, current.version, {
+                "title": title,
+                "description": description,
+                "deadline": deadline_dt,
+                "status": status,
+                "closed_at": closed_at,
+            })
+            if task is not None:
+                break
+            if expected_version is not None:
+                raise VersionConflictException(f"Task ID {task_id} was modified concurrently.")
+        else:
+            raise VersionConflictException(f"Task ID {task_id} kept changing; gave up after {UPDATE_TASK_ATTEMPTS} attempts.")
+
+        if deadline_dt and status != TaskStatus.DONE:
+            await self.task_repo.notify_deadlines([deadline_payload(task_id, deadline_dt)])
+        await self.uow.changes.record([task_change("updated", project_id, task_id, task)])
+        await self.uow.commit()
+        self.uow.cache.invalidate_tasks([task_id], [project_id])
+        return task
+
+    async def delete_task(self, project_id: int, task_id: int):
+        task = await self.task_repo.get_by_id(project_id, task_id)
+        if not task:
+            raise NotFoundException(f"Task ID {task_id} not found in Project ID {project_id}.")
+        await self.task_repo.delete(task)
+        await self.uow.changes.record([task_change("deleted", project_id, task_id)])
+        await self.uow.commit()
+        self.uow.cache.invalidate_tasks([task_id], [project_id])
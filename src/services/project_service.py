@@ -1,15 +1,21 @@
-from src.repositories.project_repository import ProjectRepository
+from src.services.unit_of_work import UnitOfWork
+from src.repositories.stats_repository import StatsRepository
 from src.exceptions.repository_exceptions import NotFoundException
+from src.repositories.change_repository import project_change, task_change
 from src.models.project import Project
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from src.repositories.task_repository import utc_now
 
 class ProjectService:
     """
     Handles business logic and domain validation for Project operations.
-    It acts as an intermediary between the API (or CLI) and the Repository.
+    It acts as an intermediary between the API (or CLI) and the Repository,
+    and commits the unit of work once a write operation has succeeded.
     """
-    def __init__(self, repo: ProjectRepository):
-        self.repo = repo
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+        self.repo = uow.projects
+        self.stats_repo = StatsRepository(uow.session)
 
     def create_project(self, name: str, description: Optional[str]) -> Project:
         """Creates a new project after basic validation."""
@@ -18,12 +24,75 @@ class ProjectService:
         if len(name.split()) > 10:
              raise ValueError("Project name must be <= 10 words.")
              
-        return self.repo.add(name=name, description=description)
+        project = self.repo.add(name=name, description=description)
+        self.uow.changes.record([project_change("created", project)])
+        self.uow.commit()
+        return project
+
+    def get_validators(self, project_id: int) -> Any:
+        """Probes the version data behind a project's ETag / Last-Modified without loading it."""
+        validators = self.repo.get_validators(project_id)
+        if not validators:
+            raise NotFoundException(f"Project ID {project_id} not found.")
+        return validators
+
+    def get_project(self, project_id: int, version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves a project with its tasks as a serialized payload, served from the cache when possible.
+        Pass the current ETag as `version` so an outdated cache entry is never served.
+        """
+        project = self.repo.get_cached(project_id, version)
+        if not project:
+            raise NotFoundException(f"Project ID {project_id} not found.")
+        return project
 
     def list_projects(self) -> List[Project]:
         """Retrieves all projects."""
         return self.repo.get_all()
 
+    def list_project_summaries(self, after_id: Optional[int] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Retrieves one page of projects with aggregate task counts instead of the task tree."""
+        rows = self.repo.get_summaries(now=utc_now(), after_id=after_id, limit=limit)
+        return [
+            {
+                "id": row.id,
+                "name": row.name,
+                "description": row.description,
+                "task_counts": {
+                    "todo": row.todo,
+                    "doing": row.doing,
+                    "done": row.done,
+                    "overdue": row.overdue,
+                },
+            }
+            for row in rows
+        ]
+
+    def get_project_stats(self, project_id: int) -> Dict[str, Any]:
+        """Returns the task counters of a project, read from project_stats instead of counting its tasks."""
+        row = self.stats_repo.get_project_stats(project_id, now=utc_now())
+        if row is None:
+            raise NotFoundException(f"Project ID {project_id} not found.")
+        return {"project_id": project_id, **_stats_payload(row)}
+
+    def get_stats_rollup(self) -> Dict[str, Any]:
+        """Returns the task counters summed over all projects."""
+        row = self.stats_repo.get_rollup(now=utc_now())
+        return {"projects": row["projects"], **_stats_payload(row)}
+
+    def search_projects(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Finds projects whose name starts with, or is similar to, the query."""
+        if not query.strip():
+            raise ValueError("Search query must not be empty.")
+        return [
+            {"id": project.id, "name": project.name, "description": project.description, "similarity": similarity}
+            for project, similarity in self.repo.search_by_name(query, limit=limit)
+        ]
+
+    def list_projects_with_tasks(self, after_id: Optional[int] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Retrieves one page of projects together with their full task lists, as plain rows."""
+        return self.repo.get_page_with_tasks(after_id=after_id, limit=limit)
+
     # 💡 اصلاح: اضافه شدن name: str و description: Optional[str] به امضای متد
     def update_project(self, project_id: int, name: str, description: Optional[str]) -> Project:
         """Updates an existing project by ID."""
@@ -41,6 +110,9 @@ class ProjectService:
             name=name,
             description=description
         )
+        self.uow.changes.record([project_change("updated", project)])
+        self.uow.commit()
+        self.uow.cache.invalidate_project(project_id)
         return project
 
     def delete_project(self, project_id: int):
@@ -56,4 +128,26 @@ class ProjectService:
         # if project.tasks:
         #     raise ValueError("Cannot delete project with active tasks.")
 
-        self.repo.delete(project)
+        task_ids = self.repo.delete(project)
+        # Tombstones for the tasks too, so clients tracking tasks see them go
+        self.uow.changes.record(
+            [task_change("deleted", project_id, task_id) for task_id in task_ids]
+            + [project_change("deleted", project_id=project_id)]
+        )
+        self.uow.commit()
+        self.uow.cache.invalidate_tasks(task_ids, [project_id])
+
+
+def _stats_payload(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "task_counts": {
+            "todo": row["todo"],
+            "doing": row["doing"],
+            "done": row["done"],
+            "overdue": row["overdue"],
+        },
+        "closed_count": row["closed_count"],
+        "avg_time_to_close_seconds": (
+            row["close_seconds_sum"] / row["closed_count"] if row["closed_count"] else None
+        ),
+    }
@@ -0,0 +1,61 @@
+from src.exceptions.service_exceptions import ResyncRequiredException
+from src.services.unit_of_work import UnitOfWork
+from typing import Any, Dict, Optional, Tuple
+
+class SyncService:
+    """
+    Serves delta sync from the changes log: clients keep the sequence number of the last
+    sync and fetch only what changed after it, instead of re-downloading whole projects.
+    """
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def get_changes(self, since: int, limit: int = 1000, project_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Returns the changes after `since` (up to `limit` log entries), compacted to one entry
+        per entity: its latest state, or its ID among the deleted ones.
+        Raises ResyncRequiredException when `since` is behind the pruned part of the log.
+        """
+        if since < 0:
+            raise ValueError("since must be >= 0.")
+
+        # Fetch one extra entry to find out whether another page exists
+        changes = self.uow.changes.get_since(since, project_id=project_id, limit=limit + 1)
+        # Checked after reading: pruning advances the horizon before it deletes anything, so
+        # entries missing from the read above always show up as a horizon past `since`.
+        # A sync from 0 needs no tombstones and is always served.
+        pruned_through = self.uow.changes.get_pruned_through()
+        if 0 < since < pruned_through:
+            raise ResyncRequiredException(
+                f"Changes up to {pruned_through} were pruned; sync again from since=0."
+            )
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        # Later entries replace earlier ones of the same entity; dicts keep first-seen order
+        latest: Dict[Tuple[str, int], Any] = {}
+        for change in changes:
+            latest.pop((change.entity, change.entity_id), None)
+            latest[(change.entity, change.entity_id)] = change
+
+        delta: Dict[str, Dict[str, list]] = {
+            "task": {"upserted": [], "deleted": []},
+            "project": {"upserted": [], "deleted": []},
+        }
+        for (entity, entity_id), change in latest.items():
+            if change.op == "deleted":
+                delta[entity]["deleted"].append(entity_id)
+            else:
+                delta[entity]["upserted"].append(change.data)
+
+        next_since = changes[-1].seq if changes else since
+        if not has_more:
+            # Entries up to the horizon may be gone; the caller has seen everything that is left
+            next_since = max(next_since, pruned_through)
+
+        return {
+            "tasks": delta["task"],
+            "projects": delta["project"],
+            "next_since": next_since,
+            "has_more": has_more,
+        }
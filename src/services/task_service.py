@@ -1,13 +1,38 @@
-from src.repositories.task_repository import TaskRepository
-from src.exceptions.repository_exceptions import NotFoundException
+from src.services.unit_of_work import UnitOfWork
+from src.exceptions.repository_exceptions import NotFoundException, VersionConflictException
 from src.models.task import Task, TaskStatus
-from typing import List, Optional
+from src.repositories.task_repository import RELOAD_DEADLINES, deadline_payload, normalize_deadline, utc_now
+from src.repositories.change_repository import task_change
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
-from dateutil import parser as date_parser # 💡 فرض می‌کنیم dateutil نصب شده است
+from src.schemas import TaskInDB
+
+# Compare-and-swap attempts of an unconditional update before giving up on a contended task
+UPDATE_TASK_ATTEMPTS = 3
+
+def resolve_closed_at(
+    current_status: TaskStatus,
+    current_closed_at: Optional[datetime],
+    new_status: TaskStatus,
+    now: datetime
+) -> Optional[datetime]:
+    """Returns the closed_at value a task gets when its status changes to `new_status`; `now` is naive UTC."""
+    # سناریو ۱: تغییر وضعیت به DONE
+    if new_status == TaskStatus.DONE and current_status != TaskStatus.DONE:
+        return now
+    # سناریو ۲: باز شدن مجدد تسک (تغییر از DONE به وضعیت دیگر)
+    if new_status != TaskStatus.DONE and current_closed_at:
+        return None
+    return current_closed_at
 
 class TaskService:
-    def __init__(self, task_repo: TaskRepository):
-        self.task_repo = task_repo
+    """
+    Handles business logic for Task operations and commits the unit of work
+    once a write operation has succeeded.
+    """
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+        self.task_repo = uow.tasks
 
     # 💡 متد کمکی برای واکشی تسک (اختیاری اما برای Update حیاتی است)
     def get_task_by_id(self, project_id: int, task_id: int) -> Task:
@@ -16,22 +41,121 @@ class TaskService:
         if not task:
             raise NotFoundException(f"Task ID {task_id} not found in Project ID {project_id}")
         return task
+
+    def get_task_validators(self, project_id: int, task_id: int) -> Any:
+        """Probes the version data behind a task's ETag / Last-Modified without loading it."""
+        validators = self.task_repo.get_validators(project_id, task_id)
+        if not validators:
+            raise NotFoundException(f"Task ID {task_id} not found in Project ID {project_id}")
+        return validators
+
+    def get_project_validators(self, project_id: int) -> Optional[Any]:
+        """Probes the version data of a project's tasks, which covers every task listing of the project."""
+        return self.uow.projects.get_validators(project_id)
+
+    def get_task(self, project_id: int, task_id: int, version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves a single task as a serialized payload, served from the cache when possible.
+        Pass the current ETag as `version` so an outdated cache entry is never served.
+        """
+        task = self.task_repo.get_cached(project_id, task_id, version)
+        if not task:
+            raise NotFoundException(f"Task ID {task_id} not found in Project ID {project_id}")
+        return task
         
-    def create_task(self, project_id: int, title: str, description: Optional[str], deadline: Optional[str]) -> Task:
+    def create_task(self, project_id: int, title: str, description: Optional[str], deadline: Optional[datetime]) -> Task:
         
-        deadline_dt = date_parser.parse(deadline) if deadline else None
+        deadline_dt = normalize_deadline(deadline)
 
-        return self.task_repo.add(
+        task = self.task_repo.add(
             project_id=project_id,
             title=title,
             description=description,
             deadline=deadline_dt
         )
+        if deadline_dt:
+            # Wakes the deadline scheduler, which closes the task once it is due
+            self.task_repo.notify_deadlines([deadline_payload(task.id, deadline_dt)])
+        self.uow.changes.record([task_change("created", project_id, task.id, task)])
+        self.uow.commit()
+        self.uow.cache.invalidate_project(project_id)
+        return task
     
     def list_tasks_by_project(self, project_id: int) -> List[Task]:
         """Retrieves all tasks for a specific project."""
         return self.task_repo.get_by_project(project_id)
-    
+
+    def ensure_project_exists(self, project_id: int) -> None:
+        """Raises NotFoundException unless the project exists."""
+        if not self.task_repo.get_existing_project_ids([project_id]):
+            raise NotFoundException(f"Project ID {project_id} not found.")
+
+    def export_tasks(self, project_id: int, batch_size: int = 1000) -> Iterator[List[Any]]:
+        """Streams all tasks of a project as batches of plain rows, for exports of any size."""
+        return self.task_repo.stream_by_project(project_id, batch_size=batch_size)
+
+    def search_tasks(
+        self,
+        query: str,
+        project_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Full-text search over tasks, optionally within one project.
+        Returns the hits (task fields plus rank) and the cursor of the next page (None on the last page).
+        """
+        if not query.strip():
+            raise ValueError("Search query must not be empty.")
+
+        after = None
+        if cursor is not None:
+            # Cursor format: "<rank>:<id>" of the last hit of the previous page
+            try:
+                rank, task_id = cursor.split(":")
+                after = (float(rank), int(task_id))
+            except ValueError:
+                raise ValueError(f"Invalid cursor {cursor!r}.")
+
+        # Fetch one extra row to find out whether another page exists
+        rows = self.task_repo.search(query, project_id=project_id, after=after, limit=limit + 1)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        hits = [dict(TaskInDB.model_validate(task).model_dump(), rank=rank) for task, rank in rows]
+        next_cursor = f"{rows[-1].rank!r}:{rows[-1].Task.id}" if has_more else None
+        return hits, next_cursor
+
+    def list_tasks_page(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        statuses: Optional[List[TaskStatus]] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+        closed_from: Optional[datetime] = None,
+        closed_to: Optional[datetime] = None,
+    ) -> Tuple[List[Any], Optional[int]]:
+        """
+        Retrieves one page of tasks for a project.
+        Returns the tasks and the cursor for the next page (None on the last page).
+        """
+        # Fetch one extra row to find out whether another page exists
+        tasks = self.task_repo.get_page_by_project(
+            project_id=project_id,
+            after_id=after_id,
+            limit=limit + 1,
+            statuses=statuses,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+            closed_from=closed_from,
+            closed_to=closed_to,
+        )
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            return tasks, tasks[-1].id
+        return tasks, None
+
     # ----------------------------------------------------
     # 💡 منطق به‌روزرسانی تسک (Update)
     # ----------------------------------------------------
@@ -41,40 +165,52 @@ class TaskService:
         task_id: int, 
         title: str, 
         description: Optional[str], 
-        deadline: Optional[str], 
-        status: TaskStatus
-    ) -> Task:
-        """Updates an existing task with business logic for status change."""
+        deadline: Optional[datetime], 
+        status: TaskStatus,
+        expected_version: Optional[int] = None
+    ) -> Any:
+        """
+        Updates an existing task with business logic for status change, as a compare-and-swap
+        on its version: closed_at is derived from the state the update is actually applied to.
+        With `expected_version` (the client's If-Match), a task at any other version raises
+        VersionConflictException. Without it, a lost race is retried on the new state.
+        Returns the updated row (TASK_COLUMNS plus version and updated_at).
+        """
+        # Deadlines arrive parsed (schemas or CLI); only the timezone is normalized
+        deadline_dt = normalize_deadline(deadline)
 
-        # 1. واکشی تسک موجود
-        task = self.task_repo.get_by_id(project_id, task_id) 
-        if not task:
-            # 💡 در صورت پیدا نشدن، خطا پرتاب می‌شود که توسط Router به 404 تبدیل می‌شود
-            raise NotFoundException(f"Task ID {task_id} not found in Project ID {project_id}.")
+        for _ in range(UPDATE_TASK_ATTEMPTS):
+            # 1. واکشی وضعیت فعلی تسک
+            current = self.task_repo.get_current(project_id, task_id)
+            if current is None:
+                # 💡 در صورت پیدا نشدن، خطا پرتاب می‌شود که توسط Router به 404 تبدیل می‌شود
+                raise NotFoundException(f"Task ID {task_id} not found in Project ID {project_id}.")
+            if expected_version is not None and current.version != expected_version:
+                raise VersionConflictException(f"Task ID {task_id} is at version {current.version}, not {expected_version}.")
 
-        # 2. تبدیل رشته deadline به datetime
-        deadline_dt = date_parser.parse(deadline) if deadline else None
-        
-        # 3. اعمال منطق تجاری برای closed_at
-        closed_at = task.closed_at
-        
-        # سناریو ۱: تغییر وضعیت به DONE
-        if status == TaskStatus.DONE and task.status != TaskStatus.DONE:
-            closed_at = datetime.now()
-        
-        # سناریو ۲: باز شدن مجدد تسک (تغییر از DONE به وضعیت دیگر)
-        elif status != TaskStatus.DONE and task.closed_at:
-             closed_at = None
-        
-        # 4. به‌روزرسانی در Repository
-        self.task_repo.update(
-            task=task,
-            title=title,
-            description=description,
-            deadline=deadline_dt,
-            status=status,
-            closed_at=closed_at
-        )
+            # 2. اعمال منطق تجاری برای closed_at
+            closed_at = resolve_closed_at(current.status, current.closed_at, status, utc_now())
+
+            # 3. به‌روزرسانی در Repository، فقط اگر نسخه عوض نشده باشد
+            task = self.task_repo.update_if_version(project_id, task_id, current.version, {
+                "title": title,
+                "description": description,
+                "deadline": deadline_dt,
+                "status": status,
+                "closed_at": closed_at,
+            })
+            if task is not None:
+                break
+            if expected_version is not None:
+                raise VersionConflictException(f"Task ID {task_id} was modified concurrently.")
+        else:
+            raise VersionConflictException(f"Task ID {task_id} kept changing; gave up after {UPDATE_TASK_ATTEMPTS} attempts.")
+
+        if deadline_dt and status != TaskStatus.DONE:
+            self.task_repo.notify_deadlines([deadline_payload(task_id, deadline_dt)])
+        self.uow.changes.record([task_change("updated", project_id, task_id, task)])
+        self.uow.commit()
+        self.uow.cache.invalidate_tasks([task_id], [project_id])
         return task
 
     def delete_task(self, project_id: int, task_id: int):
@@ -82,3 +218,142 @@ class TaskService:
         if not task:
             raise NotFoundException(f"Task ID {task_id} not found in Project ID {project_id}.")
         self.task_repo.delete(task)
+        self.uow.changes.record([task_change("deleted", project_id, task_id)])
+        self.uow.commit()
+        self.uow.cache.invalidate_tasks([task_id], [project_id])
+
+    # ----------------------------------------------------
+    # Batch operations
+    # Every item is a dict carrying its position in the request as "index";
+    # every result is a dict with "index", "status" ("created", "updated",
+    # "deleted" or "error") and either "task"/"id" or "error".
+    # ----------------------------------------------------
+    def create_tasks_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Creates many tasks in one transaction, reporting unknown projects per item."""
+        existing_projects = self.task_repo.get_existing_project_ids(item["project_id"] for item in items)
+
+        results = []
+        accepted = []
+        for item in items:
+            if item["project_id"] not in existing_projects:
+                results.append(self._batch_error(item["index"], f"Project ID {item['project_id']} not found."))
+            else:
+                accepted.append(item)
+
+        created = self.task_repo.add_many([
+            {
+                "project_id": item["project_id"],
+                "title": item["title"],
+                "description": item.get("description"),
+                "deadline": normalize_deadline(item.get("deadline")),
+                "status": TaskStatus.TODO,
+            }
+            for item in accepted
+        ])
+        if any(item.get("deadline") for item in accepted):
+            # One reload instead of a notification per task
+            self.task_repo.notify_deadlines([RELOAD_DEADLINES])
+        self.uow.changes.record([task_change("created", row.project_id, row.id, row) for row in created])
+        self.uow.commit()
+        self.uow.cache.invalidate_tasks([], {item["project_id"] for item in accepted})
+        results.extend(
+            {"index": item["index"], "status": "created", "id": row.id, "task": row}
+            for item, row in zip(accepted, created)
+        )
+        return sorted(results, key=lambda result: result["index"])
+
+    def update_tasks_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Updates many tasks in one transaction, applying the closed_at rules to each.
+        Like update_task, every item is a compare-and-swap on the version it was read at;
+        items that lose a race with another write are re-read and retried together, and
+        reported as errors once UPDATE_TASK_ATTEMPTS are spent. A task listed twice is
+        updated by its first item only.
+        """
+        results = []
+        pending = self._first_occurrences(items, results, key="id")
+
+        updated_rows = []
+        for _ in range(UPDATE_TASK_ATTEMPTS):
+            current_rows = self.task_repo.get_many(item["id"] for item in pending)
+            now = utc_now()
+            attempted = []
+            for item in pending:
+                current = current_rows.get(item["id"])
+                if current is None:
+                    results.append(self._batch_error(item["index"], f"Task ID {item['id']} not found.", item["id"]))
+                else:
+                    attempted.append((item, current))
+
+            updated = {row.id: row for row in self.task_repo.update_many([
+                {
+                    "id": item["id"],
+                    "version": current.version,
+                    "title": item["title"],
+                    "description": item.get("description"),
+                    "deadline": normalize_deadline(item.get("deadline")),
+                    "status": item["status"],
+                    "closed_at": resolve_closed_at(current.status, current.closed_at, item["status"], now),
+                }
+                for item, current in attempted
+            ])}
+            pending = []
+            for item, _ in attempted:
+                row = updated.get(item["id"])
+                if row is None:
+                    # Another write moved the task on since it was read; retry on its new state
+                    pending.append(item)
+                else:
+                    updated_rows.append(row)
+                    results.append({"index": item["index"], "status": "updated", "id": row.id, "task": row})
+            if not pending:
+                break
+        for item in pending:
+            results.append(self._batch_error(
+                item["index"], f"Task ID {item['id']} kept changing; gave up after {UPDATE_TASK_ATTEMPTS} attempts.", item["id"]
+            ))
+
+        if any(row.deadline and row.status != TaskStatus.DONE for row in updated_rows):
+            self.task_repo.notify_deadlines([RELOAD_DEADLINES])
+        self.uow.changes.record([task_change("updated", row.project_id, row.id, row) for row in updated_rows])
+        self.uow.commit()
+        self.uow.cache.invalidate_tasks((row.id for row in updated_rows), {row.project_id for row in updated_rows})
+        return sorted(results, key=lambda result: result["index"])
+
+    def delete_tasks_batch(self, task_ids: List[int]) -> List[Dict[str, Any]]:
+        """Deletes many tasks in one statement, reporting IDs that did not exist or were listed twice."""
+        results = []
+        items = self._first_occurrences(
+            [{"index": index, "id": task_id} for index, task_id in enumerate(task_ids)], results, key="id"
+        )
+        deleted = self.task_repo.delete_many(item["id"] for item in items)
+        self.uow.changes.record([task_change("deleted", row.project_id, row.id) for row in deleted])
+        self.uow.commit()
+        self.uow.cache.invalidate_tasks((row.id for row in deleted), {row.project_id for row in deleted})
+        deleted_ids = {row.id for row in deleted}
+        results.extend(
+            {"index": item["index"], "status": "deleted", "id": item["id"]}
+            if item["id"] in deleted_ids
+            else self._batch_error(item["index"], f"Task ID {item['id']} not found.", item["id"])
+            for item in items
+        )
+        return sorted(results, key=lambda result: result["index"])
+
+    @classmethod
+    def _first_occurrences(cls, items: List[Dict[str, Any]], results: List[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+        """Returns the items whose `key` was not seen before; repeats are appended to `results` as errors."""
+        seen: Set[int] = set()
+        first = []
+        for item in items:
+            if item[key] in seen:
+                results.append(cls._batch_error(
+                    item["index"], f"Task ID {item[key]} appears more than once in the batch.", item[key]
+                ))
+            else:
+                seen.add(item[key])
+                first.append(item)
+        return first
+
+    @staticmethod
+    def _batch_error(index: int, message: str, task_id: Optional[int] = None) -> Dict[str, Any]:
+        return {"index": index, "status": "error", "id": task_id, "error": message}
@@ -0,0 +1,120 @@
+from typing import Callable, Optional
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.session import SessionLocal
+from src.cache.read_through import ReadThroughCache, get_cache
+from src.repositories.project_repository import ProjectRepository
+from src.repositories.task_repository import TaskRepository
+from src.repositories.async_project_repository import AsyncProjectRepository
+from src.repositories.async_task_repository import AsyncTaskRepository
+from src.repositories.cached_repositories import CachedProjectRepository, CachedTaskRepository
+from src.repositories.change_repository import ChangeRepository
+from src.repositories.async_change_repository import AsyncChangeRepository
+
+class UnitOfWork:
+    """
+    Owns the session and transaction boundary of one request or command.
+    Repositories only flush; services call commit() once their whole
+    operation succeeded, and anything left uncommitted is rolled back on exit.
+    A commit that appended to the changes log is followed by the log's publish step.
+    Repositories are wrapped with the read-through cache, which services
+    invalidate after committing a write.
+
+    Usage:
+        with UnitOfWork() as uow:
+            service = TaskService(uow)
+            ...
+    """
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        cache: Optional[ReadThroughCache] = None
+    ):
+        self.session_factory = session_factory
+        self.cache = cache or get_cache()
+        self.session: Optional[Session] = None
+
+    def __enter__(self) -> "UnitOfWork":
+        self.session = self.session_factory()
+        self.projects = CachedProjectRepository(ProjectRepository(self.session), self.cache)
+        self.tasks = CachedTaskRepository(TaskRepository(self.session), self.cache)
+        self.changes = ChangeRepository(self.session)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is not None:
+                self.rollback()
+        finally:
+            # Closing also discards any transaction that was never committed
+            self.session.close()
+
+    def commit(self) -> None:
+        self.session.commit()
+        if self.changes.unpublished:
+            # A second, short transaction; see ChangeRepository.publish. The write itself is
+            # committed either way: entries left unpublished go out with the next publish.
+            try:
+                self.changes.publish()
+                self.session.commit()
+            except SQLAlchemyError as e:
+                self.session.rollback()
+                print(f"ERROR publishing changes, left for the next publish: {e}")
+
+    def rollback(self) -> None:
+        self.session.rollback()
+        self.changes.unpublished = False
+
+
+class AsyncUnitOfWork:
+    """
+    Async counterpart of UnitOfWork for the AsyncSession stack.
+    Reads are not cached here, but services still invalidate the shared cache on writes.
+
+    Usage:
+        async with AsyncUnitOfWork() as uow:
+            service = AsyncTaskService(uow)
+            ...
+    """
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        cache: Optional[ReadThroughCache] = None
+    ):
+        self.session_factory = session_factory
+        self.cache = cache or get_cache()
+        self.session: Optional[AsyncSession] = None
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        if self.session_factory is None:
+            # Imported here so the sync stack never needs the asyncpg driver
+            from src.db.async_session import AsyncSessionLocal
+            self.session_factory = AsyncSessionLocal
+        self.session = self.session_factory()
+        self.projects = AsyncProjectRepository(self.session)
+        self.tasks = AsyncTaskRepository(self.session)
+        self.changes = AsyncChangeRepository(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is not None:
+                await self.rollback()
+        finally:
+            await self.session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        if self.changes.unpublished:
+            try:
+                await self.changes.publish()
+                await self.session.commit()
+            except SQLAlchemyError as e:
+                await self.session.rollback()
+                print(f"ERROR publishing changes, left for the next publish: {e}")
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+        self.changes.unpublished = False
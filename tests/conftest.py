@@ -0,0 +1,56 @@
+import os
+import tempfile
+import time
+
+# The settings are read at import time, so they are fixed before anything under src is imported:
+# a throwaway SQLite file (schema created on first use) and no read-through cache
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="todolist-tests-"), "todo.db")
+os.environ["CACHE_BACKEND"] = "none"
+os.environ["USE_ASYNC_DB"] = "false"
+os.environ["CHANGE_FEED_USE_NOTIFY"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def client():
+    import main
+    from src.db.base import Base
+    from src.db.session import get_engine
+
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+    # Every test starts from empty tables
+    with get_engine().begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
+@pytest.fixture
+def project(client):
+    response = client.post("/v1/projects/", json={"name": "Test project"})
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.fixture
+def create_task(client, project):
+    def create(title: str = "Task", **fields):
+        response = client.post(f"/v1/projects/{project['id']}/tasks/", json={"title": title, **fields})
+        assert response.status_code == 201
+        return response.json()
+    return create
+
+
+@pytest.fixture
+def tehran_local_time(monkeypatch):
+    """Runs the test with the process in a time zone far from UTC (+03:30)."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available")
+    monkeypatch.setenv("TZ", "Asia/Tehran")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
@@ -0,0 +1,159 @@
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from src.commands.autoclose_overdue import AutocloseOverdueTasksCommand, is_transient
+from src.repositories.task_repository import TaskRepository
+from src.services.unit_of_work import UnitOfWork
+
+PAST = "2000-01-01T00:00:00"
+FUTURE = "2999-01-01T00:00:00"
+
+
+def get_task(client, project, task):
+    return client.get(f"/v1/projects/{project['id']}/tasks/{task['id']}").json()
+
+
+def count_chunks(monkeypatch):
+    """Records the size of every chunk close_overdue_chunk returns."""
+    original = TaskRepository.close_overdue_chunk
+    sizes = []
+
+    def close_overdue_chunk(self, *args, **kwargs):
+        rows = original(self, *args, **kwargs)
+        sizes.append(len(rows))
+        return rows
+
+    monkeypatch.setattr(TaskRepository, "close_overdue_chunk", close_overdue_chunk)
+    return sizes
+
+
+def test_overdue_tasks_are_closed_in_chunks(client, project, create_task, monkeypatch):
+    overdue = [create_task(f"Overdue {i}", deadline=PAST) for i in range(5)]
+    upcoming = create_task("Upcoming", deadline=FUTURE)
+    undated = create_task("No deadline")
+    sizes = count_chunks(monkeypatch)
+
+    with UnitOfWork() as uow:
+        closed = AutocloseOverdueTasksCommand(uow, chunk_size=2, retry_seconds=0).execute()
+
+    assert closed == 5
+    assert sizes == [2, 2, 1]
+    for task in overdue:
+        current = get_task(client, project, task)
+        assert current["status"] == "done"
+        assert current["closed_at"] is not None
+    assert get_task(client, project, upcoming)["status"] == "todo"
+    assert get_task(client, project, undated)["status"] == "todo"
+
+
+def test_done_tasks_keep_their_closed_at(client, project, create_task):
+    task = create_task("Done", deadline=PAST)
+    client.put(f"/v1/projects/{project['id']}/tasks/{task['id']}", json={"title": "Done", "status": "done"})
+    closed_at = get_task(client, project, task)["closed_at"]
+
+    with UnitOfWork() as uow:
+        assert AutocloseOverdueTasksCommand(uow, retry_seconds=0).execute() == 0
+
+    assert get_task(client, project, task)["closed_at"] == closed_at
+
+
+def test_closed_tasks_are_published_as_autoclosed(client, project, create_task):
+    task = create_task("Overdue", deadline=PAST)
+    since = client.get("/v1/sync", params={"since": 0}).json()["next_since"]
+
+    with UnitOfWork() as uow:
+        AutocloseOverdueTasksCommand(uow, chunk_size=1, retry_seconds=0).execute()
+    with UnitOfWork() as uow:
+        changes = uow.changes.get_since(since)
+
+    assert [(change.entity_id, change.op) for change in changes] == [(task["id"], "autoclosed")]
+    assert changes[0].data["status"] == "done"
+
+
+# --- Retry policy ---
+
+def fail_chunks(monkeypatch, errors):
+    """Makes the next close_overdue_chunk calls raise `errors`, one per call, then run normally."""
+    original = TaskRepository.close_overdue_chunk
+    pending = list(errors)
+
+    def close_overdue_chunk(self, *args, **kwargs):
+        if pending:
+            # Like a real failure, after the statement took effect inside the transaction
+            original(self, *args, **kwargs)
+            raise pending.pop(0)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(TaskRepository, "close_overdue_chunk", close_overdue_chunk)
+
+
+def locked():
+    return OperationalError("UPDATE tasks ...", {}, sqlite3.OperationalError("database is locked"))
+
+
+def test_transient_error_is_rolled_back_and_retried(client, project, create_task, monkeypatch):
+    tasks = [create_task(f"Overdue {i}", deadline=PAST) for i in range(3)]
+    fail_chunks(monkeypatch, [locked()])
+
+    with UnitOfWork() as uow:
+        command = AutocloseOverdueTasksCommand(uow, chunk_size=2, retry_seconds=0)
+        assert command.execute() == 3
+
+    assert command.retries == 1
+    assert all(get_task(client, project, task)["status"] == "done" for task in tasks)
+    with UnitOfWork() as uow:
+        ops = [change.op for change in uow.changes.get_since(0) if change.entity == "task"]
+    # The rolled back attempt left no entries behind
+    assert ops.count("autoclosed") == 3
+
+
+def test_error_is_raised_once_retries_run_out(client, project, create_task, monkeypatch):
+    task = create_task("Overdue", deadline=PAST)
+    fail_chunks(monkeypatch, [locked(), locked(), locked()])
+
+    with UnitOfWork() as uow:
+        command = AutocloseOverdueTasksCommand(uow, max_retries=2, retry_seconds=0)
+        with pytest.raises(OperationalError):
+            command.execute()
+
+    assert command.retries == 2
+    assert get_task(client, project, task)["status"] == "todo"
+
+
+def test_other_errors_are_not_retried(client, project, create_task, monkeypatch):
+    create_task("Overdue", deadline=PAST)
+    fail_chunks(monkeypatch, [OperationalError("UPDATE tasks ...", {}, sqlite3.OperationalError("no such column"))])
+
+    with UnitOfWork() as uow:
+        command = AutocloseOverdueTasksCommand(uow, retry_seconds=0)
+        with pytest.raises(OperationalError):
+            command.execute()
+
+    assert command.retries == 0
+
+
+def test_postgres_serialization_failures_are_transient():
+    def error(pgcode):
+        return DBAPIError("UPDATE tasks ...", {}, SimpleNamespace(pgcode=pgcode))
+
+    assert is_transient(error("40001"))
+    assert is_transient(error("40P01"))
+    assert is_transient(error("55P03"))
+    assert not is_transient(error("23505"))
+
+
+def test_autoclose_moves_the_task_version(client, project, create_task):
+    task = create_task("Overdue", deadline=PAST)
+    url = f"/v1/projects/{project['id']}/tasks/{task['id']}"
+    etag = client.get(url).headers["ETag"]
+
+    with UnitOfWork() as uow:
+        AutocloseOverdueTasksCommand(uow, retry_seconds=0).execute()
+
+    # A client that read the task before it was closed cannot overwrite the closure blindly
+    response = client.put(url, json={"title": "Reopened", "status": "todo"}, headers={"If-Match": etag})
+    assert response.status_code == 412
+    assert client.get(url).json()["status"] == "done"
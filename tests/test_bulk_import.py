@@ -0,0 +1,106 @@
+import csv
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from src.commands import bulk_import
+from src.commands.bulk_import import BulkImportCommand
+from src.repositories.task_repository import RELOAD_DEADLINES
+
+
+class RecordingImportRepository:
+    """Stands in for the COPY-based repository: keeps the staged CSV rows and merges all of them."""
+    def __init__(self, session):
+        self.rows = []
+
+    def create_staging(self, kind):
+        pass
+
+    def copy_batch(self, kind, csv_buffer):
+        self.rows.extend(csv.reader(csv_buffer))
+
+    def get_orphans(self, kind, limit):
+        return 0, []
+
+    def merge(self, kind):
+        return len(self.rows)
+
+
+@pytest.fixture
+def fake_uow(monkeypatch):
+    monkeypatch.setattr(bulk_import, "ImportRepository", RecordingImportRepository)
+    notified = []
+    return SimpleNamespace(
+        session=SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))),
+        changes=SimpleNamespace(mark_unpublished=lambda: None),
+        tasks=SimpleNamespace(notify_deadlines=notified.extend, notified=notified),
+        commit=lambda: None,
+    )
+
+
+def test_csv_rows_are_validated_and_staged_in_batches(fake_uow):
+    stream = io.StringIO(
+        "project_id,title,description,deadline\n"
+        '1,"Plain",,2030-01-01T12:00:00+03:30\n'
+        "oops,No project,,\n"
+        '2,"Quoted, ""title""",Body,\n'
+    )
+    command = BulkImportCommand(fake_uow, "tasks", batch_size=1)
+
+    report = command.execute(stream, "csv")
+
+    assert report["received"] == 3
+    assert report["imported"] == 2
+    assert report["rejected"] == 1
+    assert report["errors"][0]["line"] == 3
+    assert report["errors"][0]["error"].startswith("project_id:")
+    # Staged as line,project_id,title,description,deadline; the deadline is stored in UTC
+    assert command.import_repo.rows == [
+        ["2", "1", "Plain", "", "2030-01-01T08:30:00"],
+        ["4", "2", 'Quoted, "title"', "Body", ""],
+    ]
+    assert fake_uow.tasks.notified == [RELOAD_DEADLINES]
+
+
+def test_ndjson_parse_errors_are_reported_by_line(fake_uow):
+    stream = io.StringIO(
+        '{"name": "Kept"}\n'
+        "\n"
+        "{not json\n"
+        "[1, 2]\n"
+        '{"name": "' + " ".join(["a"] * 11) + '"}\n'
+    )
+    command = BulkImportCommand(fake_uow, "projects")
+
+    report = command.execute(stream, "ndjson")
+
+    assert report["imported"] == 1
+    assert report["rejected"] == 3
+    assert [error["line"] for error in report["errors"]] == [3, 4, 5]
+    assert report["errors"][0]["error"].startswith("Invalid JSON")
+    assert report["errors"][1]["error"] == "Row must be a JSON object."
+    assert report["errors"][2]["error"] == "Project name must be <= 10 words."
+    assert command.import_repo.rows == [["1", "Kept", ""]]
+
+
+def test_empty_strings_and_nulls_stay_distinct():
+    assert bulk_import._csv_field(None) == ""
+    assert bulk_import._csv_field("") == '""'
+    assert bulk_import._csv_field(7) == "7"
+
+
+def test_unknown_kind_and_format_are_rejected(fake_uow):
+    with pytest.raises(ValueError):
+        BulkImportCommand(fake_uow, "users")
+    with pytest.raises(ValueError):
+        BulkImportCommand(fake_uow, "tasks").execute(io.StringIO(""), "xml")
+
+
+def test_import_endpoint_needs_postgres(client):
+    response = client.post(
+        "/v1/tasks:import", params={"format": "csv"},
+        files={"file": ("tasks.csv", b"project_id,title\n1,Task\n", "text/csv")},
+    )
+    assert response.status_code == 400
+    assert "PostgreSQL" in response.json()["detail"]
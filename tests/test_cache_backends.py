@@ -0,0 +1,196 @@
+import fnmatch
+import json
+import pickle
+
+import pytest
+
+from src.cache import backends
+from src.cache.backends import LRUCacheBackend, RedisCacheBackend
+from src.cache.read_through import ReadThroughCache, project_key, task_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeRedis:
+    """The subset of the redis-py client used by RedisCacheBackend, with expiry on a fake clock."""
+    def __init__(self, clock: FakeClock):
+        self.clock = clock
+        self.data = {}
+
+    def get(self, key):
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self.clock.now:
+            del self.data[key]
+            return None
+        return value
+
+    def set(self, key, value, px=None):
+        if isinstance(value, str):
+            value = value.encode()
+        self.data[key] = (value, self.clock.now + px / 1000 if px is not None else None)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match="*", count=None):
+        return [key for key in list(self.data) if fnmatch.fnmatchcase(key, match)]
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def client(clock):
+    return FakeRedis(clock)
+
+
+@pytest.fixture
+def cache(client):
+    return ReadThroughCache(RedisCacheBackend("redis://unused", client=client), ttl=30)
+
+
+def loader(value, calls):
+    def load():
+        calls.append(value)
+        return value
+    return load
+
+
+def test_miss_then_hit(cache):
+    calls = []
+    payload = {"id": 1, "project_id": 2, "title": "t", "status": "todo", "deadline": "2026-01-01T09:30:00"}
+
+    assert cache.get_or_load(task_key(1), loader(payload, calls)) == payload
+    assert cache.get_or_load(task_key(1), loader(payload, calls)) == payload
+
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_missing_entity_is_not_cached(cache):
+    calls = []
+    assert cache.get_or_load(task_key(1), loader(None, calls)) is None
+    assert cache.get_or_load(task_key(1), loader(None, calls)) is None
+    assert len(calls) == 2
+
+
+def test_entry_expires_after_ttl(cache, clock):
+    calls = []
+    cache.get_or_load(project_key(1), loader({"id": 1}, calls))
+
+    clock.advance(29)
+    cache.get_or_load(project_key(1), loader({"id": 1}, calls))
+    assert len(calls) == 1
+
+    clock.advance(2)
+    cache.get_or_load(project_key(1), loader({"id": 1}, calls))
+    assert len(calls) == 2
+
+
+def test_other_version_is_a_miss(cache):
+    calls = []
+    cache.get_or_load(task_key(1), loader({"title": "old"}, calls), version='"v1"')
+    assert cache.get_or_load(task_key(1), loader({"title": "new"}, calls), version='"v2"') == {"title": "new"}
+    assert cache.get_or_load(task_key(1), loader({"title": "newer"}, calls), version='"v2"') == {"title": "new"}
+    assert len(calls) == 2
+
+
+def test_invalidate_tasks_drops_tasks_and_their_projects(cache, client):
+    calls = []
+    for key in (task_key(1), task_key(2), project_key(10), project_key(11)):
+        cache.get_or_load(key, loader({"key": key}, calls))
+
+    cache.invalidate_tasks([1], [10])
+
+    assert client.get("todolist:" + task_key(1)) is None
+    assert client.get("todolist:" + project_key(10)) is None
+    assert client.get("todolist:" + task_key(2)) is not None
+    assert client.get("todolist:" + project_key(11)) is not None
+
+
+def test_clear_only_removes_own_prefix(cache, client):
+    client.set("other-app:key", "x")
+    cache.get_or_load(task_key(1), loader({"id": 1}, []))
+
+    cache.clear()
+
+    assert list(client.data) == ["other-app:key"]
+
+
+def test_values_are_stored_as_json_not_pickle(cache, client):
+    cache.get_or_load(task_key(1), loader({"id": 1, "title": "t"}, []), version='"v1"')
+    raw = client.get("todolist:" + task_key(1))
+    assert json.loads(raw) == ['"v1"', {"id": 1, "title": "t"}]
+
+    # A pickle planted in Redis is never unpickled: it is a miss, replaced by the loaded value
+    client.set("todolist:" + task_key(2), pickle.dumps(("v", {"id": 2, "evil": True})))
+    assert cache.get_or_load(task_key(2), loader({"id": 2}, [])) == {"id": 2}
+    assert json.loads(client.get("todolist:" + task_key(2))) == [None, {"id": 2}]
+
+
+# --- In-process LRU backend ---
+
+@pytest.fixture
+def lru(clock, monkeypatch):
+    monkeypatch.setattr(backends.time, "monotonic", lambda: clock.now)
+    return LRUCacheBackend(max_entries=2)
+
+
+def test_lru_evicts_the_least_recently_used_entry(lru):
+    lru.set("a", 1, ttl=30)
+    lru.set("b", 2, ttl=30)
+    assert lru.get("a") == 1
+
+    lru.set("c", 3, ttl=30)
+
+    assert len(lru) == 2
+    assert lru.get("b") is None
+    assert (lru.get("a"), lru.get("c")) == (1, 3)
+
+
+def test_lru_overwrite_refreshes_value_and_ttl(lru, clock):
+    lru.set("a", 1, ttl=30)
+    clock.advance(20)
+    lru.set("a", 2, ttl=30)
+
+    clock.advance(20)
+    assert lru.get("a") == 2
+    clock.advance(11)
+    assert lru.get("a") is None
+    assert len(lru) == 0
+
+
+def test_lru_delete_and_clear(lru):
+    lru.set("a", 1, ttl=30)
+    lru.set("b", 2, ttl=30)
+
+    lru.delete("a", "missing")
+    assert (lru.get("a"), lru.get("b")) == (None, 2)
+
+    lru.clear()
+    assert len(lru) == 0
+
+
+def test_read_through_cache_over_lru_keeps_tuples(lru):
+    cache = ReadThroughCache(lru, ttl=30)
+    calls = []
+
+    cache.get_or_load(task_key(1), loader({"id": 1}, calls), version='"v1"')
+    assert cache.get_or_load(task_key(1), loader({"id": 1}, calls), version='"v1"') == {"id": 1}
+    assert lru.get(task_key(1)) == ('"v1"', {"id": 1})
+
+    cache.invalidate_tasks([1], [10])
+    cache.get_or_load(task_key(1), loader({"id": 1}, calls))
+    assert len(calls) == 2
@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+from src.api import change_feed
+from src.api.change_feed import Subscription, format_event, load_last_seq, stream_events
+from src.commands.prune_changes import PruneChangesCommand
+from src.services.unit_of_work import UnitOfWork
+
+
+def parse_frame(frame):
+    fields = dict(line.split(": ", 1) for line in frame.strip().split("\n"))
+    return fields["event"], json.loads(fields["data"])
+
+
+def collect(project_id, after_seq, count, live=()):
+    """Runs a stream without the feed thread: `count` frames, with `live` events queued up front."""
+    async def run():
+        subscription = Subscription(project_id, asyncio.get_running_loop())
+        for event in live:
+            subscription.offer(event)
+        stream = stream_events(subscription, after_seq)
+        frames = []
+        try:
+            while len(frames) < count:
+                frames.append(await stream.__anext__())
+        except StopAsyncIteration:
+            pass
+        finally:
+            await stream.aclose()
+        return frames
+    return asyncio.run(run())
+
+
+def test_stream_replays_the_backlog_then_live_events_once(client, project, create_task):
+    since = load_last_seq()
+    task = create_task("First")
+    client.put(f"/v1/projects/{project['id']}/tasks/{task['id']}", json={"title": "Renamed"})
+    backlog_end = load_last_seq()
+    # One live event the backlog already covered, one new one
+    covered = {"seq": backlog_end, "entity": "task", "op": "updated", "project_id": project["id"]}
+    new = {"seq": backlog_end + 1, "entity": "task", "op": "deleted", "project_id": project["id"]}
+
+    frames = collect(project["id"], since, 3, live=[covered, new])
+
+    assert [parse_frame(frame)[0] for frame in frames] == ["task.created", "task.updated", "task.deleted"]
+    assert frames[0].startswith(f"id: {since + 1}\n")
+    assert parse_frame(frames[1])[1]["data"]["title"] == "Renamed"
+    assert frames[2] == format_event(new)
+
+
+def test_stream_only_carries_its_project(client, project, create_task):
+    other = client.post("/v1/projects/", json={"name": "Other"}).json()
+    since = load_last_seq()
+    client.post(f"/v1/projects/{other['id']}/tasks/", json={"title": "Elsewhere"})
+    create_task("Here")
+
+    event, data = parse_frame(collect(project["id"], since, 1)[0])
+    assert (event, data["data"]["title"]) == ("task.created", "Here")
+
+
+def test_idle_stream_sends_heartbeats(client, project, monkeypatch):
+    monkeypatch.setattr(change_feed, "CHANGE_FEED_HEARTBEAT_SECONDS", 0.01)
+    assert collect(project["id"], load_last_seq(), 1) == [": keepalive\n\n"]
+
+
+def test_lagging_stream_catches_up_from_the_table(client, project, create_task):
+    since = load_last_seq()
+    create_task("First")
+
+    async def run():
+        subscription = Subscription(project["id"], asyncio.get_running_loop())
+        stream = stream_events(subscription, since)
+        try:
+            frames = [await stream.__anext__()]
+            create_task("Second")
+            # The queue overflowed: the live event was dropped and the table is read instead
+            subscription.lagged = True
+            frames.append(await stream.__anext__())
+            return frames
+        finally:
+            await stream.aclose()
+
+    frames = asyncio.run(run())
+    assert [parse_frame(frame)[1]["data"]["title"] for frame in frames] == ["First", "Second"]
+
+
+def test_stream_behind_the_pruned_log_gets_resync(client, project, create_task):
+    stale = load_last_seq()
+    create_task("First")
+    create_task("Second")
+    with UnitOfWork() as uow:
+        PruneChangesCommand(uow, retention_days=-1).execute()
+
+    frames = collect(project["id"], stale + 1, 2)
+
+    assert len(frames) == 1
+    assert parse_frame(frames[0]) == ("resync", {"since": stale + 1})
+
+
+def test_events_route_checks_project_and_cursor(client, project, create_task):
+    assert client.get("/v1/projects/999999/events").status_code == 404
+    response = client.get(f"/v1/projects/{project['id']}/events", headers={"Last-Event-ID": "abc"})
+    assert response.status_code == 400
+
+    create_task("First")
+    create_task("Second")
+    with UnitOfWork() as uow:
+        PruneChangesCommand(uow, retention_days=-1).execute()
+    assert client.get(f"/v1/projects/{project['id']}/events", params={"since": 1}).status_code == 410
@@ -0,0 +1,56 @@
+import csv
+import io
+import json
+
+from src.api.export import EXPORT_FIELDS, encode_batches
+
+
+def export_url(project, format):
+    return f"/v1/projects/{project['id']}/tasks/export?format={format}"
+
+
+def test_ndjson_export_streams_every_task(client, project, create_task):
+    first = create_task("First", deadline="2030-01-01T09:30:00")
+    second = create_task('Second, with "quotes"')
+
+    response = client.get(export_url(project, "ndjson"))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert f"project-{project['id']}-tasks.ndjson" in response.headers["content-disposition"]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [first["id"], second["id"]]
+    assert rows[0]["deadline"] == "2030-01-01T09:30:00"
+    assert rows[0]["status"] == "todo"
+    assert rows[1]["title"] == 'Second, with "quotes"'
+
+
+def test_csv_export_has_a_header_and_quotes_values(client, project, create_task):
+    create_task('Second, with "quotes"', description="line one\nline two")
+
+    response = client.get(export_url(project, "csv"))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == EXPORT_FIELDS
+    record = dict(zip(rows[0], rows[1]))
+    assert record["title"] == 'Second, with "quotes"'
+    assert record["description"] == "line one\nline two"
+    assert record["status"] == "todo"
+
+
+def test_export_of_an_empty_project(client, project):
+    assert client.get(export_url(project, "ndjson")).text == ""
+    assert list(csv.reader(io.StringIO(client.get(export_url(project, "csv")).text))) == [EXPORT_FIELDS]
+
+
+def test_export_of_a_missing_project_is_not_found(client):
+    assert client.get("/v1/projects/999999/tasks/export").status_code == 404
+
+
+def test_batches_become_chunks():
+    batches = iter([[(1, 2, "a", None, "todo", None, None)], [(3, 2, "b", None, "done", None, None)]])
+    chunks = list(encode_batches(batches, "ndjson"))
+    assert len(chunks) == 2
+    assert json.loads(chunks[1])["id"] == 3
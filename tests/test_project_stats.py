@@ -0,0 +1,69 @@
+def stats(client, project):
+    response = client.get(f"/v1/projects/{project['id']}/stats")
+    assert response.status_code == 200
+    return response.json()
+
+
+def set_status(client, project, task, status):
+    response = client.put(
+        f"/v1/projects/{project['id']}/tasks/{task['id']}",
+        json={"title": task["title"], "deadline": task["deadline"], "status": status},
+    )
+    assert response.status_code == 200
+
+
+def test_counters_follow_every_task_write(client, project, create_task):
+    first, second, third = create_task("First"), create_task("Second"), create_task("Third")
+    set_status(client, project, first, "doing")
+    set_status(client, project, second, "done")
+    client.delete(f"/v1/projects/{project['id']}/tasks/{third['id']}")
+
+    assert stats(client, project)["task_counts"] == {"todo": 0, "doing": 1, "done": 1, "overdue": 0}
+
+
+def test_batch_writes_update_the_counters(client, project):
+    client.post("/v1/tasks:batch", json=[{"project_id": project["id"], "title": f"Task {i}"} for i in range(3)])
+    ids = [task["id"] for task in client.get(f"/v1/projects/{project['id']}/tasks/").json()["items"]]
+    client.patch("/v1/tasks:batch", json=[{"id": ids[0], "title": "Done", "status": "done"}])
+    client.request("DELETE", "/v1/tasks:batch", json={"ids": [ids[1]]})
+
+    assert stats(client, project)["task_counts"] == {"todo": 1, "doing": 0, "done": 1, "overdue": 0}
+
+
+def test_overdue_counts_open_tasks_past_their_deadline(client, project, create_task):
+    create_task("Late", deadline="2000-01-01T00:00:00")
+    done = create_task("Late but done", deadline="2000-01-01T00:00:00")
+    create_task("Not yet", deadline="2999-01-01T00:00:00")
+    set_status(client, project, done, "done")
+
+    assert stats(client, project)["task_counts"]["overdue"] == 1
+
+
+def test_time_to_close_is_not_shifted_by_the_local_time_zone(client, project, create_task, tehran_local_time):
+    # created_at comes from the database clock and closed_at from the application; both are UTC
+    task = create_task()
+    set_status(client, project, task, "done")
+
+    result = stats(client, project)
+    assert result["closed_count"] == 1
+    assert 0 <= result["avg_time_to_close_seconds"] < 60
+
+
+def test_reopening_a_task_removes_it_from_time_to_close(client, project, create_task):
+    task = create_task()
+    set_status(client, project, task, "done")
+    set_status(client, project, task, "todo")
+
+    result = stats(client, project)
+    assert result["closed_count"] == 0
+    assert result["avg_time_to_close_seconds"] is None
+
+
+def test_rollup_sums_all_projects(client, project, create_task):
+    other = client.post("/v1/projects/", json={"name": "Other"}).json()
+    create_task("Mine")
+    client.post(f"/v1/projects/{other['id']}/tasks/", json={"title": "Theirs"})
+
+    rollup = client.get("/v1/projects/stats").json()
+    assert rollup["projects"] == 2
+    assert rollup["task_counts"]["todo"] == 2
@@ -0,0 +1,44 @@
+def set_status(client, project, task, status):
+    response = client.put(f"/v1/projects/{project['id']}/tasks/{task['id']}", json={"title": task["title"], "status": status})
+    assert response.status_code == 200
+
+
+def test_summaries_carry_task_counts(client, project, create_task):
+    empty = client.post("/v1/projects/", json={"name": "Empty"}).json()
+    create_task("Todo")
+    create_task("Overdue", deadline="2000-01-01T00:00:00")
+    set_status(client, project, create_task("Doing"), "doing")
+    done = create_task("Done late", deadline="2000-01-01T00:00:00")
+    set_status(client, project, done, "done")
+
+    summaries = client.get("/v1/projects/").json()
+
+    assert [summary["id"] for summary in summaries] == [project["id"], empty["id"]]
+    assert summaries[0]["name"] == project["name"]
+    assert "tasks" not in summaries[0]
+    # A done task is never overdue, whatever its deadline
+    assert summaries[0]["task_counts"] == {"todo": 2, "doing": 1, "done": 1, "overdue": 1}
+    assert summaries[1]["task_counts"] == {"todo": 0, "doing": 0, "done": 0, "overdue": 0}
+
+
+def test_summaries_are_paged_by_id(client):
+    created = [client.post("/v1/projects/", json={"name": f"Project {i}"}).json()["id"] for i in range(5)]
+
+    first = client.get("/v1/projects/", params={"limit": 2}).json()
+    rest = client.get("/v1/projects/", params={"after_id": first[-1]["id"]}).json()
+
+    assert [summary["id"] for summary in first] == created[:2]
+    assert [summary["id"] for summary in rest] == created[2:]
+    assert client.get("/v1/projects/", params={"limit": 0}).status_code == 422
+
+
+def test_include_tasks_embeds_each_task_list(client, project, create_task):
+    other = client.post("/v1/projects/", json={"name": "Other"}).json()
+    first = create_task("First", deadline="2030-01-01T09:30:00")
+    second = create_task("Second")
+
+    projects = client.get("/v1/projects/", params={"include": "tasks"}).json()
+
+    assert [item["id"] for item in projects] == [project["id"], other["id"]]
+    assert projects[0]["tasks"] == [first, second]
+    assert projects[1]["tasks"] == []
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+
+from src.commands.scheduler import DeadlineScheduler
+from src.repositories.task_repository import RELOAD_DEADLINES, deadline_payload, parse_deadline_payload, utc_now
+
+
+def scheduler(**options):
+    calls = []
+    options.setdefault("on_due", lambda: calls.append(utc_now()))
+    instance = DeadlineScheduler(use_notify=False, horizon=timedelta(hours=1), **options)
+    return instance, calls
+
+
+def in_minutes(minutes):
+    return (utc_now() + timedelta(minutes=minutes)).replace(microsecond=0)
+
+
+def test_reload_keeps_open_deadlines_within_the_horizon(client, project, create_task):
+    late = create_task("Late", deadline=in_minutes(30).isoformat())
+    soon = create_task("Soon", deadline=in_minutes(5).isoformat())
+    overdue = create_task("Overdue", deadline=in_minutes(-5).isoformat())
+    create_task("Beyond the horizon", deadline=in_minutes(90).isoformat())
+    create_task("No deadline")
+    done = create_task("Done", deadline=in_minutes(10).isoformat())
+    client.put(f"/v1/projects/{project['id']}/tasks/{done['id']}", json={"title": "Done", "status": "done"})
+    instance, _ = scheduler()
+
+    instance.reload()
+
+    assert [task_id for _, task_id in sorted(instance.heap)] == [overdue["id"], soon["id"], late["id"]]
+    assert instance.loaded_until > in_minutes(59)
+
+
+def test_limit_ends_the_window_at_the_last_loaded_deadline(client, create_task):
+    first, second, third = (in_minutes(minutes) for minutes in (5, 10, 15))
+    for deadline in (first, second, third):
+        create_task(deadline=deadline.isoformat())
+    instance, _ = scheduler(max_loaded=2)
+
+    instance.reload()
+
+    assert [deadline for deadline, _ in sorted(instance.heap)] == [first, second]
+    assert instance.loaded_until == second
+    # A deadline past the window waits for the next reload
+    instance.push(second + timedelta(minutes=2), 99)
+    assert len(instance.heap) == 2
+    instance.push(first + timedelta(minutes=2), 98)
+    assert sorted(instance.heap)[1] == (first + timedelta(minutes=2), 98)
+
+
+def test_due_deadlines_trigger_one_run():
+    instance, calls = scheduler()
+    instance.loaded_until = in_minutes(60)
+    upcoming = in_minutes(30)
+    for deadline, task_id in ((in_minutes(-1), 1), (in_minutes(-2), 2), (upcoming, 3)):
+        instance.push(deadline, task_id)
+
+    instance.run_due()
+
+    assert len(calls) == 1
+    assert instance.heap == [(upcoming, 3)]
+    instance.run_due()
+    assert len(calls) == 1
+    assert 29 * 60 < instance.seconds_until_next_event() <= 30 * 60
+
+
+def test_sleep_has_a_floor():
+    instance, _ = scheduler()
+    instance.loaded_until = in_minutes(60)
+    instance.push(in_minutes(-1), 1)
+    assert instance.seconds_until_next_event() == 0.05
+
+
+def test_notification_payloads_are_naive_utc():
+    deadline = datetime(2030, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=3, minutes=30)))
+    assert parse_deadline_payload(deadline_payload(7, deadline)) == (datetime(2030, 1, 1, 8, 30), 7)
+    assert parse_deadline_payload(RELOAD_DEADLINES) is None
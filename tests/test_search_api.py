@@ -0,0 +1,70 @@
+from sqlalchemy.dialects import postgresql
+
+from src.repositories.task_repository import TaskRepository
+
+
+def search_all(client, query, limit):
+    ids, cursor, pages = [], None, 0
+    while True:
+        params = {"q": query, "limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = client.get("/v1/tasks/search", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        ids.extend(item["id"] for item in page["items"])
+        cursor, pages = page["next_cursor"], pages + 1
+        if cursor is None or pages > 20:
+            return ids
+
+
+def test_paging_through_tied_ranks_returns_every_hit_once(client, project, create_task):
+    # Every hit ranks the same, so each page boundary falls between tied rows
+    created = [create_task(f"Report {i}")["id"] for i in range(7)]
+    create_task("Unrelated")
+
+    assert search_all(client, "report", limit=2) == sorted(created, reverse=True)
+
+
+def test_search_matches_every_word_within_one_project(client, project, create_task):
+    match = create_task("Quarterly report", description="finance")["id"]
+    create_task("Quarterly plan")
+    other = client.post("/v1/projects/", json={"name": "Other"}).json()
+    client.post(f"/v1/projects/{other['id']}/tasks/", json={"title": "Quarterly report"})
+
+    response = client.get("/v1/tasks/search", params={"q": "quarterly report", "project_id": project["id"]})
+    assert [item["id"] for item in response.json()["items"]] == [match]
+
+
+def test_invalid_cursor_is_rejected(client):
+    assert client.get("/v1/tasks/search", params={"q": "x", "cursor": "nope"}).status_code == 400
+
+
+class CapturingSession:
+    """Records the statement TaskRepository.search builds for Postgres, without a server."""
+    def __init__(self):
+        self.statement = None
+
+    def get_bind(self):
+        return self
+
+    @property
+    def dialect(self):
+        return postgresql.dialect()
+
+    def execute(self, statement):
+        self.statement = statement
+        return self
+
+    def all(self):
+        return []
+
+
+def test_postgres_rank_is_compared_as_double_precision():
+    session = CapturingSession()
+    TaskRepository(session).search("report", after=(0.0607927, 5))
+
+    sql = str(session.statement.compile(dialect=postgresql.dialect()))
+    # Both the selected rank (which becomes the cursor) and the keyset comparison use the cast
+    assert sql.count("ts_rank(") == sql.count("CAST(ts_rank(") == 3
+    assert "FLOAT(53)" in sql
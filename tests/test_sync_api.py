@@ -0,0 +1,79 @@
+from src.commands.prune_changes import PruneChangesCommand
+from src.services.unit_of_work import UnitOfWork
+
+
+def sync(client, since, **params):
+    response = client.get("/v1/sync", params={"since": since, **params})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_sync_from_zero_returns_current_state(client, project, create_task):
+    task = create_task()
+    client.put(f"/v1/projects/{project['id']}/tasks/{task['id']}", json={"title": "Renamed"})
+
+    delta = sync(client, 0)
+
+    assert [item["title"] for item in delta["tasks"]["upserted"]] == ["Renamed"]
+    assert delta["tasks"]["deleted"] == []
+    assert [item["id"] for item in delta["projects"]["upserted"]] == [project["id"]]
+    assert delta["has_more"] is False
+
+
+def test_deleted_tasks_leave_tombstones(client, project, create_task):
+    kept, removed = create_task("Kept"), create_task("Removed")
+    since = sync(client, 0)["next_since"]
+
+    client.delete(f"/v1/projects/{project['id']}/tasks/{removed['id']}")
+    delta = sync(client, since)
+
+    assert delta["tasks"] == {"upserted": [], "deleted": [removed["id"]]}
+    assert delta["next_since"] > since
+    assert kept["id"] not in delta["tasks"]["deleted"]
+
+    # A task created and deleted between two syncs only shows up as deleted
+    transient = create_task("Transient")
+    client.delete(f"/v1/projects/{project['id']}/tasks/{transient['id']}")
+    assert sync(client, delta["next_since"])["tasks"] == {"upserted": [], "deleted": [transient["id"]]}
+
+
+def test_deleting_a_project_leaves_tombstones_for_its_tasks(client, project, create_task):
+    task = create_task()
+    since = sync(client, 0)["next_since"]
+
+    client.delete(f"/v1/projects/{project['id']}")
+    delta = sync(client, since)
+
+    assert delta["tasks"]["deleted"] == [task["id"]]
+    assert delta["projects"]["deleted"] == [project["id"]]
+
+
+def test_paging_with_limit(client, project, create_task):
+    for i in range(3):
+        create_task(f"Task {i}")
+
+    first = sync(client, 0, limit=2)
+    assert first["has_more"] is True
+    rest = sync(client, first["next_since"], limit=2)
+    assert rest["has_more"] is False
+
+    titles = [item["title"] for page in (first, rest) for item in page["tasks"]["upserted"]]
+    assert titles == ["Task 0", "Task 1", "Task 2"]
+
+
+def test_cursor_behind_pruned_log_must_resync(client, project, create_task):
+    task, removed = create_task("Kept"), create_task("Removed")
+    stale = sync(client, 0)["next_since"]
+    client.delete(f"/v1/projects/{project['id']}/tasks/{removed['id']}")
+
+    with UnitOfWork() as uow:
+        PruneChangesCommand(uow, retention_days=-1).execute()
+
+    response = client.get("/v1/sync", params={"since": stale})
+    assert response.status_code == 410
+
+    # Compaction kept the current state; the resync cursor is valid again
+    delta = sync(client, 0)
+    assert [item["id"] for item in delta["tasks"]["upserted"]] == [task["id"]]
+    assert delta["tasks"]["deleted"] == []
+    assert sync(client, delta["next_since"])["tasks"] == {"upserted": [], "deleted": []}
@@ -0,0 +1,133 @@
+from src.repositories.task_repository import TaskRepository
+from src.services.task_service import TaskService
+from src.services.unit_of_work import UnitOfWork
+
+
+def tasks_url(project, task_id=None):
+    url = f"/v1/projects/{project['id']}/tasks/"
+    return url if task_id is None else url + str(task_id)
+
+
+# --- Keyset paging ---
+
+def test_pages_follow_next_cursor_in_id_order(client, project, create_task):
+    created = [create_task(f"Task {i}")["id"] for i in range(5)]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "after_id": cursor}
+        page = client.get(tasks_url(project), params=params).json()
+        seen.extend(task["id"] for task in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == created
+
+
+def test_filters_apply_before_paging(client, project, create_task):
+    first, second, third = (create_task(f"Task {i}") for i in range(3))
+    for task in (first, third):
+        client.put(tasks_url(project, task["id"]), json={"title": task["title"], "status": "done"})
+
+    page = client.get(tasks_url(project), params={"status": "done", "limit": 1}).json()
+    assert [task["id"] for task in page["items"]] == [first["id"]]
+
+    page = client.get(tasks_url(project), params={"status": "done", "limit": 1, "after_id": page["next_cursor"]}).json()
+    assert [task["id"] for task in page["items"]] == [third["id"]]
+    assert page["next_cursor"] is None
+
+
+# --- Conditional requests ---
+
+def test_unchanged_task_is_not_modified(client, project, create_task):
+    task = create_task()
+    response = client.get(tasks_url(project, task["id"]))
+    etag = response.headers["ETag"]
+
+    response = client.get(tasks_url(project, task["id"]), headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    client.put(tasks_url(project, task["id"]), json={"title": "Renamed"})
+    response = client.get(tasks_url(project, task["id"]), headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_task_list_etag_moves_with_any_task_write(client, project, create_task):
+    task = create_task()
+    etag = client.get(tasks_url(project)).headers["ETag"]
+    assert client.get(tasks_url(project), headers={"If-None-Match": etag}).status_code == 304
+
+    create_task("Another")
+    assert client.get(tasks_url(project), headers={"If-None-Match": etag}).status_code == 200
+
+    etag = client.get(tasks_url(project)).headers["ETag"]
+    client.delete(tasks_url(project, task["id"]))
+    assert client.get(tasks_url(project), headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_if_match_with_stale_etag_is_rejected(client, project, create_task):
+    task = create_task()
+    etag = client.get(tasks_url(project, task["id"])).headers["ETag"]
+
+    response = client.put(tasks_url(project, task["id"]), json={"title": "First"}, headers={"If-Match": etag})
+    assert response.status_code == 200
+    new_etag = response.headers["ETag"]
+    assert new_etag != etag
+
+    response = client.put(tasks_url(project, task["id"]), json={"title": "Second"}, headers={"If-Match": etag})
+    assert response.status_code == 412
+    assert response.headers["ETag"] == new_etag
+    assert client.get(tasks_url(project, task["id"])).json()["title"] == "First"
+
+
+# --- Compare-and-swap updates ---
+
+def interleave_write(monkeypatch, project_id, task_id, title):
+    """Makes the next get_current return the task as it was just before another write lands."""
+    original = TaskRepository.get_current
+    state = {"done": False}
+
+    def get_current(self, *args, **kwargs):
+        row = original(self, *args, **kwargs)
+        if not state["done"]:
+            state["done"] = True
+            with UnitOfWork() as uow:
+                TaskService(uow).update_task(project_id, task_id, title, None, None, "doing")
+        return row
+
+    monkeypatch.setattr(TaskRepository, "get_current", get_current)
+
+
+def test_lost_race_without_if_match_is_retried_on_the_new_state(client, project, create_task, monkeypatch):
+    task = create_task()
+    interleave_write(monkeypatch, project["id"], task["id"], "Concurrent")
+
+    response = client.put(tasks_url(project, task["id"]), json={"title": "Mine", "status": "done"})
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "Mine"
+    # closed_at comes from the state the update was applied to
+    assert response.json()["closed_at"] is not None
+
+
+def test_lost_race_with_if_match_is_a_precondition_failure(client, project, create_task, monkeypatch):
+    task = create_task()
+    etag = client.get(tasks_url(project, task["id"])).headers["ETag"]
+    interleave_write(monkeypatch, project["id"], task["id"], "Concurrent")
+
+    response = client.put(tasks_url(project, task["id"]), json={"title": "Mine"}, headers={"If-Match": etag})
+
+    assert response.status_code == 412
+    assert client.get(tasks_url(project, task["id"])).json()["title"] == "Concurrent"
+
+
+def test_update_that_keeps_losing_is_a_conflict(client, project, create_task, monkeypatch):
+    task = create_task()
+    monkeypatch.setattr(TaskRepository, "update_if_version", lambda self, *args, **kwargs: None)
+
+    response = client.put(tasks_url(project, task["id"]), json={"title": "Mine"})
+
+    assert response.status_code == 409
@@ -0,0 +1,111 @@
+import json
+from datetime import datetime
+
+from src.repositories.task_repository import TaskRepository
+from src.services.task_service import TaskService
+from src.services.unit_of_work import UnitOfWork
+
+
+def ndjson(response):
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_batch_create_reports_every_item_in_request_order(client, project):
+    results = ndjson(client.post("/v1/tasks:batch", json=[
+        {"project_id": project["id"], "title": "First"},
+        {"project_id": project["id"]},
+        {"project_id": 999999, "title": "Orphan"},
+        {"project_id": project["id"], "title": "Last", "deadline": "2030-01-01T09:00:00"},
+    ]))
+
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    assert [result["status"] for result in results] == ["created", "error", "error", "created"]
+    assert "title" in results[1]["error"]
+    assert results[3]["task"]["deadline"] == "2030-01-01T09:00:00"
+
+    page = client.get(f"/v1/projects/{project['id']}/tasks/").json()
+    assert [task["title"] for task in page["items"]] == ["First", "Last"]
+
+
+def test_batch_update_sets_closed_at_and_skips_missing_tasks(client, project, create_task):
+    task = create_task()
+
+    results = ndjson(client.patch("/v1/tasks:batch", json=[
+        {"id": task["id"], "title": "Done", "status": "done"},
+        {"id": 999999, "title": "Missing"},
+    ]))
+
+    assert [result["status"] for result in results] == ["updated", "error"]
+    assert results[0]["task"]["closed_at"] is not None
+    assert results[1]["id"] == 999999
+    assert client.get(f"/v1/projects/{project['id']}/tasks/{task['id']}").json()["status"] == "done"
+
+
+def test_batch_delete(client, project, create_task):
+    first, second = create_task("First"), create_task("Second")
+
+    results = ndjson(client.request("DELETE", "/v1/tasks:batch", json={"ids": [second["id"], 999999, first["id"]]}))
+
+    assert [(result["id"], result["status"]) for result in results] == [
+        (second["id"], "deleted"), (999999, "error"), (first["id"], "deleted"),
+    ]
+    assert client.get(f"/v1/projects/{project['id']}/tasks/").json()["items"] == []
+
+
+def test_batch_delete_reports_repeated_ids(client, project, create_task):
+    task = create_task()
+
+    results = ndjson(client.request("DELETE", "/v1/tasks:batch", json={"ids": [task["id"], task["id"]]}))
+
+    assert [result["status"] for result in results] == ["deleted", "error"]
+    assert "more than once" in results[1]["error"]
+
+
+def test_batch_update_applies_only_the_first_item_of_a_task(client, project, create_task):
+    task = create_task()
+
+    results = ndjson(client.patch("/v1/tasks:batch", json=[
+        {"id": task["id"], "title": "First"},
+        {"id": task["id"], "title": "Second"},
+    ]))
+
+    assert [result["status"] for result in results] == ["updated", "error"]
+    assert client.get(f"/v1/projects/{project['id']}/tasks/{task['id']}").json()["title"] == "First"
+
+
+def test_batch_update_retries_items_that_lost_a_race(client, project, create_task, monkeypatch):
+    raced, quiet = create_task("Raced"), create_task("Quiet")
+    original = TaskRepository.get_many
+    state = {}
+
+    def get_many(self, task_ids):
+        rows = original(self, task_ids)
+        if not state:
+            # Another request closes the task between the batch's read and its write
+            with UnitOfWork() as uow:
+                state["closed"] = TaskService(uow).update_task(project["id"], raced["id"], "Concurrent", None, None, "done")
+        return rows
+
+    monkeypatch.setattr(TaskRepository, "get_many", get_many)
+    results = ndjson(client.patch("/v1/tasks:batch", json=[
+        {"id": raced["id"], "title": "Mine", "status": "done"},
+        {"id": quiet["id"], "title": "Quiet too"},
+    ]))
+
+    assert [result["status"] for result in results] == ["updated", "updated"]
+    task = client.get(f"/v1/projects/{project['id']}/tasks/{raced['id']}").json()
+    assert task["title"] == "Mine"
+    # closed_at comes from the re-read state (already done), so the concurrent close time stands
+    assert datetime.fromisoformat(task["closed_at"]) == state["closed"].closed_at
+
+
+def test_batch_update_reports_items_that_keep_losing(client, project, create_task, monkeypatch):
+    task = create_task()
+    monkeypatch.setattr(TaskRepository, "update_many", lambda self, rows: [])
+
+    results = ndjson(client.patch("/v1/tasks:batch", json=[{"id": task["id"], "title": "Mine"}]))
+
+    assert results[0]["status"] == "error"
+    assert "kept changing" in results[0]["error"]
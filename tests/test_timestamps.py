@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta, timezone
+
+from src.commands.bulk_import import _csv_field
+from src.repositories.task_repository import normalize_deadline, utc_now
+
+TEHRAN = timezone(timedelta(hours=3, minutes=30))
+
+
+def test_deadlines_are_normalized_to_naive_utc(tehran_local_time):
+    assert normalize_deadline(datetime(2026, 1, 1, 12, 0, tzinfo=TEHRAN)) == datetime(2026, 1, 1, 8, 30)
+    # Naive deadlines are already UTC
+    assert normalize_deadline(datetime(2026, 1, 1, 12, 0)) == datetime(2026, 1, 1, 12, 0)
+    assert normalize_deadline(None) is None
+
+
+def test_utc_now_ignores_the_local_time_zone(tehran_local_time):
+    expected = datetime.now(timezone.utc).replace(tzinfo=None)
+    assert abs((utc_now() - expected).total_seconds()) < 1
+
+
+def test_imported_deadlines_are_written_as_utc(tehran_local_time):
+    assert _csv_field(datetime(2026, 1, 1, 12, 0, tzinfo=TEHRAN)) == '"2026-01-01T08:30:00"'
+
+
+def test_api_stores_deadlines_and_closed_at_in_utc(client, project, create_task, tehran_local_time):
+    task = create_task(deadline="2026-01-01T12:00:00+03:30")
+    assert task["deadline"] == "2026-01-01T08:30:00"
+
+    closed = client.put(
+        f"/v1/projects/{project['id']}/tasks/{task['id']}",
+        json={"title": task["title"], "deadline": task["deadline"], "status": "done"},
+    ).json()
+    closed_at = datetime.fromisoformat(closed["closed_at"])
+    assert abs((closed_at - utc_now()).total_seconds()) < 5